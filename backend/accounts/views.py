@@ -1,7 +1,8 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse_lazy
-from django.views.generic import CreateView, TemplateView
-from games.models import Game
+from django.views.generic import CreateView, ListView
+from games.leaderboard import player_totals
+from games.models import Game, ScoreParameters
 
 from .forms import CustomUserCreationForm
 
@@ -12,13 +13,22 @@ class SignUpView(CreateView):
     template_name = "accounts/signup.html"
 
 
-class ProfilePageView(LoginRequiredMixin, TemplateView):
+class ProfilePageView(LoginRequiredMixin, ListView):
     template_name = "accounts/profile.html"
+    context_object_name = "games"
+    paginate_by = 12
+
+    def get_queryset(self):
+        # Games of the user by pk, read from the index of the players of the games
+        return (
+            Game.objects.filter(valid=True, players=self.request.user)
+            .order_by("-date", "-id")
+            .prefetch_related("players")
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        context["games"] = Game.objects.filter(
-            players__username__contains=self.request.user.username
-        )
+        # Precomputed by day, a single aggregate whatever the number of games
+        context["stats"] = player_totals(self.request.user.pk, ScoreParameters.current())
         return context
@@ -1,4 +1,6 @@
 import os
+import tempfile
+from importlib.util import find_spec
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -39,6 +41,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so the time of the other middlewares is part of the latency
+    "games.metrics.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -49,6 +53,12 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Requests slower than this, in seconds, are logged with their queries and serialization time
+SLOW_REQUEST_THRESHOLD = float(os.environ.get("SLOW_REQUEST_THRESHOLD") or "inf")
+
+# /metrics is public unless a token is set, Prometheus then sends it as a bearer token
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -75,11 +85,55 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# Postgres when DB_HOST is set (see docker/docker-compose.yml), SQLite otherwise.
+# SQLite locks the whole file on writes, so concurrent uploads wait for each other.
+
+if os.environ.get("DB_HOST"):
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "HOST": os.environ["DB_HOST"],
+            "PORT": os.environ.get("DB_PORT", "5432"),
+            "NAME": os.environ.get("DB_NAME"),
+            "USER": os.environ.get("DB_USER"),
+            "PASSWORD": os.environ.get("DB_PASSWORD"),
+            # Connections are kept between requests, and checked before being reused
+            "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 60)),
+            "CONN_HEALTH_CHECKS": True,
+            # Django 4.2 has no pool of its own, set DB_POOLER when connecting through
+            # a transaction pooler (e.g. pgbouncer), which cannot keep server-side cursors
+            "DISABLE_SERVER_SIDE_CURSORS": bool(os.environ.get("DB_POOLER")),
+        }
     }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db.sqlite3",
+        }
+    }
+
+
+# Cache
+# "locmem" is a LRU in each process, "file" is shared by all the processes of the server
+
+CACHE_BACKENDS = {
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "koth",
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": int(os.environ.get("CACHE_MAX_ENTRIES", 5000))},
+    },
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("CACHE_LOCATION", os.path.join(tempfile.gettempdir(), "koth-cache")),
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": int(os.environ.get("CACHE_MAX_ENTRIES", 5000))},
+    },
+}
+
+CACHES = {
+    "default": CACHE_BACKENDS[os.environ.get("CACHE_BACKEND", "locmem")],
 }
 
 
@@ -132,8 +186,25 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "accounts.CustomUser"
 
+# orjson is optional, without it the API uses the JSON parser and renderer of DRF
+if find_spec("orjson"):
+    JSON_PARSER = "games.fastjson.FastJSONParser"
+    JSON_RENDERER = "games.fastjson.FastJSONRenderer"
+else:
+    JSON_PARSER = "rest_framework.parsers.JSONParser"
+    JSON_RENDERER = "rest_framework.renderers.JSONRenderer"
+
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_PARSER_CLASSES": [
+        JSON_PARSER,
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        JSON_RENDERER,
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
     ],
@@ -1,5 +1,26 @@
+from accounts.models import CustomUser
+from django import forms
 from django.contrib import admin
 
-from .models import Game
+from .models import DailyPlayerStats, Game, GameScore, ScoreParameters, Transition
 
-admin.site.register(Game)
+
+class GameAdminForm(forms.ModelForm):
+    # Declared as the admin leaves out the fields with a through model, the
+    # players are still saved with `set`, which updates the roster
+    players = forms.ModelMultipleChoiceField(queryset=CustomUser.objects.all())
+
+    class Meta:
+        model = Game
+        fields = "__all__"
+
+
+@admin.register(Game)
+class GameAdmin(admin.ModelAdmin):
+    form = GameAdminForm
+
+
+admin.site.register(ScoreParameters)
+admin.site.register(GameScore)
+admin.site.register(DailyPlayerStats)
+admin.site.register(Transition)
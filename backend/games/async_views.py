@@ -0,0 +1,168 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.paginator import InvalidPage, Page
+from django.db.models import Max, Prefetch, prefetch_related_objects
+from django.http import HttpResponse, HttpResponseNotAllowed, JsonResponse
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+
+from .cache import games_cache
+from .conditional import aconditional_get, version_token
+from .filters import GameFilter
+from .models import Game, GameDeletion, GameScore, ScoreParameters
+from .pagination import GameKeysetPagination
+from .serializers import GameSerializer
+
+JSONParser = import_string(settings.JSON_PARSER)
+JSONRenderer = import_string(settings.JSON_RENDERER)
+
+# Async versions of the games API, with the same responses as the sync views.
+#
+# Django does not have async prefetches nor async transactions yet, so these
+# parts (and the validation of the serializers, which queries the players)
+# run in a thread with sync_to_async, the other queries use the async ORM.
+
+
+def api_response(data, status=200) -> HttpResponse:
+    """Data rendered as by the DRF views."""
+    return HttpResponse(JSONRenderer().render(data), status=status, content_type="application/json")
+
+
+def not_found(detail="Not found.") -> HttpResponse:
+    return api_response({"detail": detail}, status=404)
+
+
+def serialize_games(games, parameters):
+    """Serialized games, prefetched as in ``GamesViewSet.get_queryset``."""
+    current_scores = GameScore.objects.filter(parameters=parameters)
+    prefetch_related_objects(
+        games,
+        "players",
+        Prefetch("scores", queryset=current_scores, to_attr="current_scores"),
+    )
+
+    return GameSerializer(games, many=True).data
+
+
+class AsyncPageNumberPagination(PageNumberPagination):
+    async def apaginate_queryset(self, queryset, request):
+        paginator = self.django_paginator_class(queryset, self.get_page_size(request))
+        paginator.count = await queryset.acount()
+
+        page_number = self.get_page_number(request, paginator)
+        try:
+            number = paginator.validate_number(page_number)
+        except InvalidPage:
+            return None
+
+        bottom = (number - 1) * paginator.per_page
+        games = [game async for game in queryset[bottom : bottom + paginator.per_page]]
+
+        self.page = Page(games, number, paginator)
+        self.request = request
+
+        return games
+
+
+async def list_page(request, parameters):
+    """Data and status of a page of the games list."""
+    filterset = GameFilter(request.GET, queryset=Game.objects.filter(valid=True))
+    # In a thread, as the validation of the players filters queries them
+    if not await sync_to_async(filterset.is_valid)():
+        return ValidationError(filterset.errors).detail, 400
+
+    if "cursor" in request.GET or request.GET.get("pagination") == "cursor":
+        pagination = GameKeysetPagination()
+        try:
+            queryset = pagination.page_queryset(filterset.qs, Request(request))
+        except NotFound as exc:
+            return {"detail": exc.detail}, 404
+        games = pagination.set_page([game async for game in queryset])
+    else:
+        pagination = AsyncPageNumberPagination()
+        games = await pagination.apaginate_queryset(filterset.qs, Request(request))
+        if games is None:
+            return {"detail": pagination.invalid_page_message}, 404
+
+    data = await sync_to_async(serialize_games)(games, parameters)
+    return pagination.get_paginated_response(data).data, 200
+
+
+async def game_list(request):
+    """Async version of ``GamesViewSet.list``."""
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    parameters = await ScoreParameters.acurrent()
+    version = {
+        "last_modified": (await Game.objects.aaggregate(last_modified=Max("modified")))["last_modified"],
+        "last_deletion": await GameDeletion.alast(),
+    }
+
+    async def response():
+        key = f"list:{parameters.pk}:{version_token(version)}:{request.build_absolute_uri()}"
+        data = await games_cache.aget(key)
+        if data is not None:
+            return api_response(data)
+
+        data, status = await list_page(request, parameters)
+        if status == 200:
+            await games_cache.aset(key, data)
+
+        return api_response(data, status)
+
+    return await aconditional_get(
+        request,
+        response,
+        (request.get_full_path(), parameters.pk, version),
+    )
+
+
+async def game_detail(request, pk):
+    """Async version of ``GamesViewSet.retrieve``."""
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    modified = await Game.objects.filter(valid=True, pk=pk).values_list("modified", flat=True).afirst()
+    if modified is None:
+        return not_found()
+
+    parameters = await ScoreParameters.acurrent()
+
+    async def response():
+        key = f"detail:{parameters.pk}:{pk}:{version_token(modified)}"
+        data = await games_cache.aget(key)
+        if data is None:
+            game = await Game.objects.filter(valid=True).aget(pk=pk)
+            data = (await sync_to_async(serialize_games)([game], parameters))[0]
+            await games_cache.aset(key, data)
+
+        return api_response(data)
+
+    # The pk is a string in the kwargs of the sync view, so the etags are the same
+    return await aconditional_get(request, response, (str(pk), parameters.pk, modified), modified)
+
+
+async def upload_game(request):
+    """Async version of ``views.upload_game``."""
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+
+    data = JSONParser().parse(request)
+
+    def save():
+        # In a thread, as the validation queries the players and the game is saved in a transaction
+        serializer = GameSerializer(data=data)
+        if serializer.is_valid():
+            serializer.save()
+            return serializer.data, 201
+        return serializer.errors, 400
+
+    data, status = await sync_to_async(save)()
+    return JsonResponse(data, status=status)
+
+
+# The decorator of Django 4.2 would make the view sync
+upload_game.csrf_exempt = True
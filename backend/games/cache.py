@@ -0,0 +1,134 @@
+import threading
+import uuid
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import transaction
+
+# Reads of the API are cached by namespace. The keys of a namespace contain
+# its version, a random token replaced when one of its entries changes, so
+# invalidating a namespace drops all its entries at once, e.g. all the pages
+# of the games list.
+
+GAMES = "games"
+PLAYERS = "players"
+# One namespace per player, counted together
+CAREER_STATS = "career-stats"
+
+
+class ReadCache:
+    """Cache of the reads of a namespace, with hit and miss counters."""
+
+    def __init__(self, namespace: str, counter: str | None = None):
+        self.namespace = namespace
+        # Hits and misses are counted under ``counter``, the namespace by default
+        self.counter = counter or namespace
+
+    @property
+    def version_key(self) -> str:
+        return f"{self.namespace}:version"
+
+    def version(self) -> str:
+        version = cache.get(self.version_key)
+        if version is None:
+            # Added only if missing, another process may have just set it
+            cache.add(self.version_key, uuid.uuid4().hex, timeout=None)
+            version = cache.get(self.version_key)
+
+        return version
+
+    def key(self, key: str) -> str:
+        return f"{self.namespace}:{self.version()}:{key}"
+
+    def get(self, key: str):
+        value = cache.get(self.key(key))
+        record(self.counter, hit=value is not None)
+
+        return value
+
+    def set(self, key: str, value):
+        cache.set(self.key(key), value)
+
+    def get_or_set(self, key: str, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.set(key, value)
+
+        return value
+
+    # Async versions, for the async views
+
+    async def aversion(self) -> str:
+        version = await cache.aget(self.version_key)
+        if version is None:
+            await cache.aadd(self.version_key, uuid.uuid4().hex, timeout=None)
+            version = await cache.aget(self.version_key)
+
+        return version
+
+    async def akey(self, key: str) -> str:
+        return f"{self.namespace}:{await self.aversion()}:{key}"
+
+    async def aget(self, key: str):
+        value = await cache.aget(await self.akey(key))
+        record(self.counter, hit=value is not None)
+
+        return value
+
+    async def aset(self, key: str, value):
+        await cache.aset(await self.akey(key), value)
+
+    async def aget_or_set(self, key: str, compute):
+        """``compute`` is a coroutine function."""
+        value = await self.aget(key)
+        if value is None:
+            value = await compute()
+            if value is not None:
+                await self.aset(key, value)
+
+        return value
+
+    def invalidate(self):
+        self.new_version()
+        # And again once the changes are committed, entries cached by other requests
+        # in the meantime do not have them
+        transaction.on_commit(self.new_version)
+
+    def new_version(self):
+        cache.set(self.version_key, uuid.uuid4().hex, timeout=None)
+
+
+games_cache = ReadCache(GAMES)
+players_cache = ReadCache(PLAYERS)
+
+
+def career_stats_cache(player_pk: int) -> ReadCache:
+    """Cache of the career stats of a player, invalidated with his games."""
+    return ReadCache(f"{CAREER_STATS}:{player_pk}", counter=CAREER_STATS)
+
+
+# Hits and misses of the process, by namespace
+
+_counters = Counter()
+_counters_lock = threading.Lock()
+
+
+def record(namespace: str, hit: bool):
+    with _counters_lock:
+        _counters[(namespace, "hits" if hit else "misses")] += 1
+
+
+def cache_stats() -> dict:
+    """Hits and misses of each namespace since the process started."""
+    with _counters_lock:
+        return {
+            namespace: {"hits": _counters[(namespace, "hits")], "misses": _counters[(namespace, "misses")]}
+            for namespace in (GAMES, PLAYERS, CAREER_STATS)
+        }
+
+
+def reset_cache_stats():
+    with _counters_lock:
+        _counters.clear()
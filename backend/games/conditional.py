@@ -0,0 +1,55 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def version_token(version) -> str:
+    """Hash of a version of a resource, in its ETag and in the keys of its cached data."""
+    return hashlib.sha1(repr(version).encode()).hexdigest()
+
+
+class Conditional:
+    """ETag and Last-Modified of a version of a resource.
+
+    ``version`` changes whenever the response would, so an unchanged resource
+    is answered with a 304 without being serialized.
+    """
+
+    def __init__(self, version, last_modified=None):
+        self.etag = '"%s"' % version_token(version)
+        self.timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+
+    def not_modified(self, request):
+        """304 (or 412) response when the client has this version, None otherwise."""
+        return get_conditional_response(request, etag=self.etag, last_modified=self.timestamp)
+
+    def set_headers(self, response):
+        if 200 <= response.status_code < 300 or response.status_code == 304:
+            response.headers["ETag"] = self.etag
+            if self.timestamp is not None:
+                response.headers["Last-Modified"] = http_date(self.timestamp)
+
+        return response
+
+
+def conditional_get(request, response_func, version, last_modified=None):
+    """Response of ``response_func``, or 304 when the client has the same ``version``."""
+    conditional = Conditional(version, last_modified)
+
+    response = conditional.not_modified(request)
+    if response is None:
+        response = response_func()
+
+    return conditional.set_headers(response)
+
+
+async def aconditional_get(request, response_func, version, last_modified=None):
+    """Async version of ``conditional_get``, ``response_func`` is a coroutine function."""
+    conditional = Conditional(version, last_modified)
+
+    response = conditional.not_modified(request)
+    if response is None:
+        response = await response_func()
+
+    return conditional.set_headers(response)
@@ -0,0 +1,95 @@
+import csv
+import json
+
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from .models import GameScore
+
+# Games fetched at once, with their players and scores, by an export
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# One row per transition, so the export loads directly as a transitions table
+CSV_HEADER = ["game", "date", "players", "sequence", "player", "duration"]
+
+date_field = serializers.DateTimeField()
+
+
+def export_queryset(games, parameters):
+    """Games in chronological order, with the scores of ``parameters``.
+
+    The pks of the players are read from the roster of the games, which avoids
+    prefetching them.
+    """
+    current_scores = GameScore.objects.filter(parameters=parameters).order_by("-points")
+
+    return games.order_by("date", "id").prefetch_related(
+        Prefetch("scores", queryset=current_scores, to_attr="current_scores"),
+    )
+
+
+def roster_players(game) -> list[int]:
+    """Pks of the players of a game, from its roster."""
+    return [int(pk) for pk in game.roster.strip(",").split(",") if pk]
+
+
+def iter_games(games):
+    """Games of a queryset, fetched by chunks so the memory used does not depend on their number."""
+    return games.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+
+def game_row(game) -> dict:
+    return {
+        "id": game.pk,
+        "date": date_field.to_representation(game.date),
+        "players": roster_players(game),
+        "transitions": game.transitions,
+        "scores": [
+            {
+                "player": score.player_id,
+                "points": score.points,
+                "total_reign_time": score.total_reign_time,
+                "crowns_claimed": score.crowns_claimed,
+                "winner": score.winner,
+            }
+            for score in game.current_scores
+        ],
+    }
+
+
+def ndjson_lines(games):
+    """One JSON document per game and per line."""
+    for game in iter_games(games):
+        yield json.dumps(game_row(game)) + "\n"
+
+
+class Echo:
+    """File-like object returning what is written, so the CSV writer produces the lines."""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(games):
+    """A header, then one line per transition of every game, written game by game."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_HEADER)
+
+    for game in iter_games(games):
+        date = date_field.to_representation(game.date)
+        players = " ".join(map(str, roster_players(game)))
+        yield "".join(
+            writer.writerow([game.pk, date, players, sequence, transition["player"], transition["duration"]])
+            for sequence, transition in enumerate(game.transitions)
+        )
+
+
+EXPORT_LINES = {
+    "ndjson": ndjson_lines,
+    "csv": csv_lines,
+}
@@ -0,0 +1,114 @@
+import io
+import math
+import re
+
+import orjson
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+# JSON parser and renderer of the API backed by orjson, used in REST_FRAMEWORK when
+# it is installed. They give the same bytes and data as the DRF ones, which still
+# handle what orjson does differently: indented output, integers over 64 bits,
+# invalid JSON, and the floats orjson writes differently. These are the NaN and
+# infinite ones, written as null, and the ones Python writes with an exponent,
+# below 1e-4 or from 1e16 (e.g. 0.00001 and 2e16 for 1e-05 and 2e+16).
+
+OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+# Dates, decimals, lazy strings... are converted as by the DRF encoder
+default = encoders.JSONEncoder().default
+
+# Exponent of the large and small floats in the output of orjson, a leading literal
+# so the search is a fast scan, the data is only looked at when found
+EXPONENT_OUTPUT = re.compile(rb"e[-0-9]")
+
+
+def is_written_differently(value: float) -> bool:
+    """Whether orjson does not write a float as ``repr``, as DRF does."""
+    return not math.isfinite(value) or (value != 0 and abs(value) < 1e-4) or abs(value) >= 1e16
+
+
+def has_different_float(data) -> bool:
+    """Whether a float of the data is written differently by orjson."""
+    if isinstance(data, float):
+        return is_written_differently(data)
+    if isinstance(data, dict):
+        return any(has_different_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(has_different_float(value) for value in data)
+
+    return False
+
+
+def has_non_finite_float(data, parsed) -> bool:
+    """Whether a float of the data is NaN or infinite, the parts read back equal from the output are skipped."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if parsed == data:
+        return False
+    if isinstance(data, dict) and isinstance(parsed, dict):
+        return any(has_non_finite_float(value, parsed.get(key)) for key, value in data.items())
+    if isinstance(data, (list, tuple)) and isinstance(parsed, list):
+        return any(map(has_non_finite_float, data, parsed))
+
+    return False
+
+
+def writes_floats_differently(ret: bytes, data) -> bool:
+    """Whether the output of orjson has floats written differently than by DRF, the data is only walked when it may."""
+    # The non-finite floats are written as null as None is, so are not read back as
+    # the data. Equalities in C skip the parts that are, and the ones only written
+    # differently by the encoder (e.g. dates)
+    if b"null" in ret:
+        parsed = orjson.loads(ret)
+        if parsed != data and has_non_finite_float(data, parsed):
+            return True
+
+    if b"0.0000" in ret or EXPONENT_OUTPUT.search(ret) is not None:
+        return has_different_float(data)
+
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=default, option=OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # DRF writes these floats, or refuses the non-finite ones with STRICT_JSON
+        if writes_floats_differently(ret, data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # As DRF, \u2028 and \u2029 are escaped so the output is a strict javascript subset
+        if b"\xe2\x80" in ret:
+            ret = ret.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if encoding.lower() not in ("utf-8", "utf8"):
+            return super().parse(stream, media_type, parser_context)
+
+        data = stream.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Parsed again to read what orjson refuses, or to raise the error of DRF
+            return super().parse(io.BytesIO(data), media_type, parser_context)
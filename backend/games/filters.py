@@ -1,17 +1,49 @@
 from django.contrib.auth import get_user_model
+from django.db.models import Count
 from django_filters import rest_framework as filters
 
-from .models import Game
+from .models import Game, roster_key
 
 
 class GameFilter(filters.FilterSet):
-    # Conjoined = True means only games where all specified players are present
+    # Only games where all specified players are present
     players = filters.ModelMultipleChoiceFilter(
         queryset=get_user_model().objects.filter(),
-        conjoined=True,
+        method="filter_players",
+    )
+    # Only games played by exactly the specified players
+    players_exact = filters.ModelMultipleChoiceFilter(
+        queryset=get_user_model().objects.filter(),
+        method="filter_players_exact",
     )
     date = filters.DateTimeFromToRangeFilter()
 
     class Meta:
         model = Game
-        fields = ["players", "date"]
+        fields = ["players", "players_exact", "date"]
+
+    def filter_players(self, queryset, name, value):
+        if not value:
+            return queryset
+
+        players_pks = {player.pk for player in value}
+        if len(players_pks) == 1:
+            return queryset.filter(players__in=players_pks)
+
+        # Games with a row of each player in the through table, read from its
+        # (customuser_id, game_id) index instead of one join per player
+        games = (
+            Game.players.through.objects.filter(customuser_id__in=players_pks)
+            .values("game_id")
+            .annotate(nb_players=Count("customuser_id"))
+            .filter(nb_players=len(players_pks))
+            .values("game_id")
+        )
+
+        return queryset.filter(pk__in=games)
+
+    def filter_players_exact(self, queryset, name, value):
+        if not value:
+            return queryset
+
+        return queryset.filter(roster=roster_key(player.pk for player in value))
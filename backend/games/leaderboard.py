@@ -0,0 +1,196 @@
+import datetime
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import TruncDate
+
+from .models import DailyPlayerStats, Game, GameScore, ScoreParameters
+
+# The leaderboard is built from the daily totals of each player, kept up to
+# date when scores are saved and when a game is (in)validated. Only the parts
+# of a date range that do not cover whole days are aggregated from the scores.
+
+STATS_FIELDS = ["points", "games_played", "wins", "total_reign_time", "crowns_claimed"]
+
+ONE_DAY = datetime.timedelta(days=1)
+ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def game_day(game: Game) -> datetime.date:
+    return game.date.astimezone(datetime.timezone.utc).date()
+
+
+def update_daily_stats(scores: list[GameScore], sign=1):
+    """Adds (or removes with ``sign=-1``) scores of valid games to the daily totals."""
+    # Scores of the same player on the same day are added in a single update
+    totals = defaultdict(lambda: {field: 0 for field in STATS_FIELDS})
+    for score in scores:
+        total = totals[(score.player_id, score.parameters_id, game_day(score.game))]
+        total["points"] += score.points
+        total["games_played"] += 1
+        total["wins"] += int(score.winner)
+        total["total_reign_time"] += score.total_reign_time
+        total["crowns_claimed"] += score.crowns_claimed
+
+    if not totals:
+        return
+
+    # A constant number of queries, whatever the number of players and days, in the
+    # transaction of the caller without a savepoint of its own
+    with transaction.atomic(savepoint=False):
+        # Missing totals are created empty, the ones another upload just created are kept
+        DailyPlayerStats.objects.bulk_create(
+            (
+                DailyPlayerStats(player_id=player_id, parameters_id=parameters_id, day=day)
+                for player_id, parameters_id, day in totals
+            ),
+            ignore_conflicts=True,
+        )
+
+        # Locked until the end of the transaction so concurrent uploads add their scores
+        # one after the other, the filter may select a few more totals than needed
+        entries = DailyPlayerStats.objects.select_for_update().filter(
+            player_id__in={player_id for player_id, _, _ in totals},
+            parameters_id__in={parameters_id for _, parameters_id, _ in totals},
+            day__in={day for _, _, day in totals},
+        )
+
+        updated = []
+        for entry in entries:
+            total = totals.get((entry.player_id, entry.parameters_id, entry.day))
+            if total is None:
+                continue
+
+            for field in STATS_FIELDS:
+                setattr(entry, field, getattr(entry, field) + sign * total[field])
+            updated.append(entry)
+
+        DailyPlayerStats.objects.bulk_update(updated, STATS_FIELDS)
+
+
+def rebuild_daily_stats(parameters: ScoreParameters):
+    """Recomputes all the daily totals of a version of the parameters from its scores."""
+    daily_scores = (
+        GameScore.objects.filter(parameters=parameters, game__valid=True)
+        .annotate(day=TruncDate("game__date", tzinfo=datetime.timezone.utc))
+        .values("player", "day")
+        .annotate(**scores_aggregates())
+    )
+
+    with transaction.atomic():
+        DailyPlayerStats.objects.filter(parameters=parameters).delete()
+        DailyPlayerStats.objects.bulk_create(
+            DailyPlayerStats(
+                player_id=row["player"],
+                parameters=parameters,
+                day=row["day"],
+                **{field: row[f"sum_{field}"] for field in STATS_FIELDS},
+            )
+            for row in daily_scores
+        )
+
+
+# Aggregates are prefixed as they cannot have the name of a model field
+
+
+def scores_aggregates() -> dict:
+    """Aggregates of ``GameScore`` rows into the leaderboard stats."""
+    return {
+        "sum_points": Sum("points"),
+        "sum_games_played": Count("id"),
+        "sum_wins": Count("id", filter=Q(winner=True)),
+        "sum_total_reign_time": Sum("total_reign_time"),
+        "sum_crowns_claimed": Sum("crowns_claimed"),
+    }
+
+
+def daily_stats_aggregates() -> dict:
+    return {f"sum_{field}": Sum(field) for field in STATS_FIELDS}
+
+
+def transitions_aggregates() -> dict:
+    """Aggregates of ``Transition`` rows into reign and crowns stats."""
+    return {
+        "sum_total_reign_time": Sum("duration"),
+        "max_reign_time": Max("duration"),
+        # The first king did not claim his crown
+        "sum_crowns_claimed": Count("id", filter=Q(sequence__gt=0)),
+    }
+
+
+def whole_days(date_after, date_before):
+    """First and last days entirely inside ``[date_after, date_before]``, None if unbounded."""
+    first_day = None
+    if date_after is not None:
+        date_after = date_after.astimezone(datetime.timezone.utc)
+        first_day = date_after.date()
+        if date_after.time() != datetime.time():
+            first_day += ONE_DAY
+
+    last_day = None
+    if date_before is not None:
+        date_before = date_before.astimezone(datetime.timezone.utc)
+        last_day = (date_before + ONE_MICROSECOND).date() - ONE_DAY
+
+    return first_day, last_day
+
+
+def day_start(day: datetime.date) -> datetime.datetime:
+    return datetime.datetime.combine(day, datetime.time(), tzinfo=datetime.timezone.utc)
+
+
+def leaderboard(parameters: ScoreParameters, date_after=None, date_before=None, games=None):
+    """Stats of every player over the valid games played in the date range.
+
+    When ``games`` is given, the stats are aggregated from the scores of these
+    games only, instead of the daily totals.
+    """
+    totals = defaultdict(lambda: {field: 0 for field in STATS_FIELDS})
+
+    def add(rows):
+        for row in rows:
+            for field in STATS_FIELDS:
+                totals[row["player"]][field] += row[f"sum_{field}"] or 0
+
+    def add_scores(**game_filters):
+        scores = GameScore.objects.filter(parameters=parameters, game__valid=True, **game_filters)
+        add(scores.values("player").annotate(**scores_aggregates()))
+
+    if games is not None:
+        add_scores(game__in=games)
+    else:
+        first_day, last_day = whole_days(date_after, date_before)
+
+        if first_day is not None and last_day is not None and first_day > last_day:
+            # The range does not cover any whole day
+            add_scores(game__date__gte=date_after, game__date__lte=date_before)
+        else:
+            daily_stats = DailyPlayerStats.objects.filter(parameters=parameters)
+            if first_day is not None:
+                daily_stats = daily_stats.filter(day__gte=first_day)
+            if last_day is not None:
+                daily_stats = daily_stats.filter(day__lte=last_day)
+            add(daily_stats.values("player").annotate(**daily_stats_aggregates()))
+
+            # Start and end of the range that are not whole days
+            if date_after is not None and day_start(first_day) > date_after:
+                add_scores(game__date__gte=date_after, game__date__lt=day_start(first_day))
+            if date_before is not None and day_start(last_day + ONE_DAY) <= date_before:
+                add_scores(game__date__gte=day_start(last_day + ONE_DAY), game__date__lte=date_before)
+
+    rows = [{"player": player, **stats} for player, stats in totals.items() if stats["games_played"]]
+    rows.sort(key=lambda row: (-row["points"], row["player"]))
+
+    return rows
+
+
+def player_totals(player_pk: int, parameters: ScoreParameters) -> dict:
+    """Stats of a player over all their valid games, from their daily totals."""
+    sums = DailyPlayerStats.objects.filter(parameters=parameters, player_id=player_pk).aggregate(
+        **daily_stats_aggregates()
+    )
+    totals = {field: sums[f"sum_{field}"] or 0 for field in STATS_FIELDS}
+    totals["average_points"] = totals["points"] / totals["games_played"] if totals["games_played"] else 0
+
+    return totals
@@ -0,0 +1,185 @@
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Sum
+from games.leaderboard import rebuild_daily_stats
+from games.models import DailyPlayerStats, Game, GameScore, ScoreParameters
+from games.scoring import score_transitions
+
+PARAMETERS_FIELDS = ["alpha", "beta", "sigma", "points_last_king"]
+
+
+def score_chunk(chunk: list[tuple], parameters: dict) -> list[tuple]:
+    """Scores a chunk of ``(game_pk, players_pks, transitions)``, runs in the worker processes."""
+    parameters = SimpleNamespace(**parameters)
+
+    return [
+        (game_pk, score_transitions(players_pks, transitions, parameters))
+        for game_pk, players_pks, transitions in chunk
+    ]
+
+
+def ranking(points: dict[int, int]) -> dict[int, int]:
+    """Rank of each player from its total points."""
+    ordered = sorted(points, key=lambda player: (-points[player], player))
+    return {player: rank for rank, player in enumerate(ordered, start=1)}
+
+
+class Command(BaseCommand):
+    help = "Scores all the valid games with new score parameters, stored as a new version."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file", help="JSON file with alpha, beta, sigma and points_last_king")
+        parser.add_argument("--alpha", type=int)
+        parser.add_argument("--beta", type=float)
+        parser.add_argument("--sigma", type=float)
+        parser.add_argument("--points-last-king", type=int)
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--workers", type=int, default=None, help="Scoring processes, 1 to score in process"
+        )
+        parser.add_argument(
+            "--activate", action="store_true", help="Use the new version to display the scores"
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only compare the rankings, nothing is written"
+        )
+
+    def handle(self, *args, **options):
+        parameters = self.parameters(options)
+        self.stdout.write(f"Scoring with {parameters}")
+
+        start = time.perf_counter()
+        if options["dry_run"]:
+            new_points = defaultdict(int)
+            nb_games = 0
+            for game_pk, scores in self.score_games(parameters, options):
+                nb_games += 1
+                for player_pk, score in scores.items():
+                    new_points[player_pk] += score["points"]
+
+            self.report_throughput(nb_games, start)
+            self.compare_rankings(new_points)
+            return
+
+        self.pending_scores = []
+        with transaction.atomic():
+            new_parameters = ScoreParameters.objects.create(**parameters)
+
+            nb_games = 0
+            for game_pk, scores in self.score_games(parameters, options):
+                nb_games += 1
+                self.pending_scores.extend(
+                    GameScore(game_id=game_pk, player_id=player_pk, parameters=new_parameters, **score)
+                    for player_pk, score in scores.items()
+                )
+                if len(self.pending_scores) >= options["chunk_size"]:
+                    self.flush_scores()
+            self.flush_scores()
+
+            rebuild_daily_stats(new_parameters)
+
+            if options["activate"]:
+                ScoreParameters.objects.exclude(pk=new_parameters.pk).update(active=False)
+                new_parameters.active = True
+                new_parameters.save(update_fields=["active"])
+
+        self.report_throughput(nb_games, start)
+        self.stdout.write(self.style.SUCCESS(f"Scores stored as {new_parameters}"))
+
+    def parameters(self, options) -> dict:
+        current = ScoreParameters.current()
+        parameters = {field: getattr(current, field) for field in PARAMETERS_FIELDS}
+
+        if options["file"]:
+            try:
+                with open(options["file"], "r") as file:
+                    params = json.load(file)
+                parameters.update({field: params[field] for field in PARAMETERS_FIELDS})
+            except (OSError, ValueError, KeyError) as e:
+                raise CommandError(f"Error reading parameters file: {e}")
+
+        for field in PARAMETERS_FIELDS:
+            if options[field] is not None:
+                parameters[field] = options[field]
+
+        return parameters
+
+    def game_chunks(self, chunk_size: int):
+        """Valid games as ``(game_pk, players_pks, transitions)``, by chunks."""
+        games = Game.objects.filter(valid=True).order_by("pk").prefetch_related("players")
+
+        chunk = []
+        for game in games.iterator(chunk_size=chunk_size):
+            players_pks = [player.pk for player in game.players.all()]
+            if not players_pks or not game.transitions:
+                continue
+
+            chunk.append((game.pk, players_pks, game.transitions))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def score_games(self, parameters: dict, options):
+        """Scores of each valid game, computed in a pool of processes."""
+        chunks = self.game_chunks(options["chunk_size"])
+        workers = options["workers"] or os.cpu_count() or 1
+
+        if workers == 1:
+            for chunk in chunks:
+                yield from score_chunk(chunk, parameters)
+            return
+
+        # The workers only score plain data, but they import this module and thus the
+        # models: Django is set up first, as spawned workers do not inherit it
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+            # Keep a bounded number of chunks in flight so the games are streamed
+            max_in_flight = 2 * workers
+            in_flight = []
+            for chunk in chunks:
+                in_flight.append(executor.submit(score_chunk, chunk, parameters))
+                if len(in_flight) >= max_in_flight:
+                    yield from in_flight.pop(0).result()
+
+            for future in in_flight:
+                yield from future.result()
+
+    def flush_scores(self):
+        GameScore.objects.bulk_create(self.pending_scores)
+        self.pending_scores = []
+
+    def report_throughput(self, nb_games: int, start: float):
+        elapsed = time.perf_counter() - start
+        throughput = nb_games / elapsed if elapsed > 0 else 0
+        self.stdout.write(f"Scored {nb_games} games in {elapsed:.2f}s ({throughput:.0f} games/s)")
+
+    def compare_rankings(self, new_points: dict[int, int]):
+        """Prints the rankings with the active and the new parameters."""
+        old_points = dict(
+            DailyPlayerStats.objects.filter(parameters=ScoreParameters.current())
+            .values("player")
+            .annotate(sum_points=Sum("points"))
+            .values_list("player", "sum_points")
+        )
+
+        old_ranking = ranking(old_points)
+        new_ranking = ranking(new_points)
+
+        self.stdout.write(f"{'player':>8} {'rank':>10} {'points':>20}")
+        for player in sorted(new_ranking, key=new_ranking.get):
+            old_rank = old_ranking.get(player, "-")
+            old_player_points = old_points.get(player, "-")
+            self.stdout.write(
+                f"{player:>8} {old_rank:>4} -> {new_ranking[player]:<4}"
+                f" {old_player_points:>8} -> {new_points[player]:<8}"
+            )
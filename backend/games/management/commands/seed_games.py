@@ -0,0 +1,55 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from games.models import ScoreParameters
+from games.seeding import seed_games, seed_users
+
+
+class Command(BaseCommand):
+    help = "Adds random games of synthetic users with bulk inserts, e.g. to fill a development database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--games", type=int, default=10_000)
+        parser.add_argument("--users", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=0, help="Same seed, users and start, same games")
+        parser.add_argument(
+            "--start", type=datetime.date.fromisoformat, help="Day of the first game, --days ago by default"
+        )
+        parser.add_argument("--days", type=int, default=365, help="Days over which the games are spread")
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--prefix", default="synthetic", help="Prefix of the usernames")
+        parser.add_argument("--no-scores", action="store_true", help="Only the games, without their scores")
+
+    def handle(self, *args, **options):
+        if options["games"] < 0 or options["users"] < 2 or options["days"] < 1 or options["batch_size"] < 1:
+            raise CommandError("Needs at least 2 users, 1 day, a batch size of 1 and a positive number of games")
+
+        start_day = options["start"] or datetime.date.today() - datetime.timedelta(days=options["days"])
+        start = datetime.datetime.combine(start_day, datetime.time(), tzinfo=datetime.timezone.utc)
+        parameters = None if options["no_scores"] else ScoreParameters.current()
+
+        begin = time.perf_counter()
+        players_pks = seed_users(options["users"], f"{options['prefix']}{options['seed']}-")
+
+        nb_games = 0
+        for batch in seed_games(
+            options["games"],
+            players_pks,
+            start,
+            days=options["days"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            parameters=parameters,
+        ):
+            nb_games += batch
+            if options["verbosity"] > 1:
+                self.stdout.write(f"{nb_games}/{options['games']} games")
+
+        elapsed = time.perf_counter() - begin
+        throughput = nb_games / elapsed if elapsed > 0 else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {nb_games} games of {len(players_pks)} users in {elapsed:.2f}s ({throughput:.0f} games/s)"
+            )
+        )
@@ -0,0 +1,231 @@
+import bisect
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+# Latency, database queries and serialization time of the requests, by view,
+# kept in the process and exposed in the Prometheus text format on /metrics.
+#
+# The queries of a request are counted by a wrapper added to every database
+# connection, which reads the metrics of the current request in a context
+# variable, so the queries that async views run in threads are counted as well.
+# The queries of a streamed response run after the middleware, they are not counted.
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the buckets of the histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERIES_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+
+class RequestMetrics:
+    """Database and serialization time of a request, while it is handled."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        # Depth of the nested serializers, only the outer one is timed
+        self.serializer_depth = 0
+
+
+current_request = contextvars.ContextVar("current_request", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Registry:
+    """Metrics of the process, by (view, method)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.latency = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self.queries = defaultdict(lambda: Histogram(QUERIES_BUCKETS))
+        self.db_time = defaultdict(float)
+        self.serializer_time = defaultdict(float)
+        self.responses = defaultdict(int)
+
+    def record(self, view, method, status, duration, metrics: RequestMetrics):
+        labels = (view, method)
+        with self.lock:
+            self.latency[labels].observe(duration)
+            self.queries[labels].observe(metrics.queries)
+            self.db_time[labels] += metrics.db_time
+            self.serializer_time[labels] += metrics.serializer_time
+            self.responses[(view, method, str(status))] += 1
+
+    def render(self) -> str:
+        """Metrics in the Prometheus text format."""
+        lines = []
+        with self.lock:
+            write_histogram(lines, "koth_request_duration_seconds", "Latency of the requests.", self.latency)
+            write_histogram(lines, "koth_request_db_queries", "Database queries per request.", self.queries)
+            write_counter(lines, "koth_requests_total", "Responses by status.", self.responses, STATUS_LABELS)
+            write_counter(lines, "koth_db_duration_seconds_total", "Time spent in the database.", self.db_time)
+            write_counter(
+                lines, "koth_serializer_duration_seconds_total", "Time spent serializing.", self.serializer_time
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+LABELS = ("view", "method")
+STATUS_LABELS = ("view", "method", "status")
+
+
+def format_labels(names, values) -> str:
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values)
+    return ",".join(f'{name}="{value}"' for name, value in zip(names, escaped))
+
+
+def write_counter(lines, name, description, values, label_names=LABELS):
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} counter")
+    for labels, value in sorted(values.items()):
+        lines.append(f"{name}{{{format_labels(label_names, labels)}}} {value}")
+
+
+def write_histogram(lines, name, description, histograms):
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, histogram in sorted(histograms.items()):
+        label_text = format_labels(LABELS, labels)
+        count = 0
+        for bound, bucket_count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+            count += bucket_count
+            lines.append(f'{name}_bucket{{{label_text},le="{bound}"}} {count}')
+        lines.append(f"{name}_sum{{{label_text}}} {histogram.sum}")
+        lines.append(f"{name}_count{{{label_text}}} {count}")
+
+
+registry = Registry()
+
+
+def reset_metrics():
+    with registry.lock:
+        registry.clear()
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper of the database connections, times the queries of the current request."""
+    metrics = current_request.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += time.perf_counter() - start
+
+
+def add_query_wrapper(sender, connection, **kwargs):
+    """Receiver of ``connection_created``."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class TimedSerializerMixin:
+    """Adds the time spent in ``to_representation`` to the serializer time of the request."""
+
+    def to_representation(self, instance):
+        metrics = current_request.get()
+        if metrics is None or metrics.serializer_depth:
+            return super().to_representation(instance)
+
+        start = time.perf_counter()
+        metrics.serializer_depth += 1
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializer_depth -= 1
+            metrics.serializer_time += time.perf_counter() - start
+
+
+def view_name(request) -> str:
+    # Unresolved paths are grouped, so the labels do not grow with the requested urls
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match else "unresolved"
+
+
+class MetricsMiddleware:
+    """Records the metrics of every request, and logs the ones slower than ``SLOW_REQUEST_THRESHOLD``."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics = RequestMetrics()
+        token = current_request.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_request.reset(token)
+
+        self.record(request, response, time.perf_counter() - start, metrics)
+        return response
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = current_request.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_request.reset(token)
+
+        self.record(request, response, time.perf_counter() - start, metrics)
+        return response
+
+    def record(self, request, response, duration, metrics):
+        view = view_name(request)
+        registry.record(view, request.method, response.status_code, duration, metrics)
+
+        if duration >= settings.SLOW_REQUEST_THRESHOLD:
+            logger.warning(
+                "Slow request %s %s (%s): %.0f ms, %d queries in %.0f ms, %.0f ms serializing",
+                request.method,
+                request.get_full_path(),
+                view,
+                duration * 1e3,
+                metrics.queries,
+                metrics.db_time * 1e3,
+                metrics.serializer_time * 1e3,
+            )
+
+
+def metrics_view(request):
+    """Metrics of the process, for Prometheus. Needs ``Bearer <METRICS_TOKEN>`` when the token is set."""
+    token = settings.METRICS_TOKEN
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponseForbidden()
+
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
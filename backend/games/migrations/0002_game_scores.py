@@ -0,0 +1,181 @@
+# Generated by Django 4.2.5 on 2026-10-18 14:18
+
+import math
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def score_transitions(players_pks, transitions, parameters):
+    """Copy of games.scoring.score_transitions at the time of this migration."""
+    game_duration = sum(transition["duration"] for transition in transitions)
+
+    stats = {
+        pk: {"total_reign_time": 0, "crowns_claimed": 0, "reign_time_points": 0.0}
+        for pk in players_pks
+    }
+
+    for i, transition in enumerate(transitions):
+        player_stats = stats.get(transition["player"])
+        if player_stats is None:
+            continue
+        duration = transition["duration"]
+
+        player_stats["total_reign_time"] += duration
+        if i > 0:
+            player_stats["crowns_claimed"] += 1
+
+        if game_duration:
+            duration_perc = int(math.ceil(duration / game_duration * 100))
+            player_stats["reign_time_points"] += duration_perc**parameters.sigma
+
+    last_king = transitions[-1]["player"]
+
+    scores = {}
+    for pk, player_stats in stats.items():
+        points = 0
+        if game_duration:
+            points += math.ceil(parameters.alpha * (player_stats["total_reign_time"] / game_duration))
+        points += math.ceil(parameters.beta * player_stats["reign_time_points"])
+        if pk == last_king:
+            points += parameters.points_last_king
+
+        scores[pk] = {
+            "points": points,
+            "total_reign_time": player_stats["total_reign_time"],
+            "crowns_claimed": player_stats["crowns_claimed"],
+        }
+
+    best_points = max(score["points"] for score in scores.values())
+    for score in scores.values():
+        score["winner"] = score["points"] == best_points
+
+    return scores
+
+
+def score_existing_games(apps, schema_editor):
+    """Scores the existing games with the default parameters."""
+    Game = apps.get_model("games", "Game")
+    GameScore = apps.get_model("games", "GameScore")
+    ScoreParameters = apps.get_model("games", "ScoreParameters")
+
+    parameters = ScoreParameters.objects.create(active=True)
+
+    for game in Game.objects.prefetch_related("players").iterator(chunk_size=500):
+        players_pks = [player.pk for player in game.players.all()]
+        if not players_pks or not game.transitions:
+            continue
+
+        scores = score_transitions(players_pks, game.transitions, parameters)
+        GameScore.objects.bulk_create(
+            GameScore(game=game, player_id=pk, parameters=parameters, **score)
+            for pk, score in scores.items()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("games", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScoreParameters",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("alpha", models.IntegerField(default=190)),
+                ("beta", models.FloatField(default=0.05)),
+                ("sigma", models.FloatField(default=1.9)),
+                ("points_last_king", models.IntegerField(default=30)),
+                (
+                    "created",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, editable=False
+                    ),
+                ),
+                ("active", models.BooleanField(default=False)),
+            ],
+            options={
+                "verbose_name_plural": "score parameters",
+                "ordering": ("-created",),
+            },
+        ),
+        migrations.AlterField(
+            model_name="game",
+            name="date",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.CreateModel(
+            name="GameScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("points", models.IntegerField()),
+                ("total_reign_time", models.IntegerField()),
+                ("crowns_claimed", models.IntegerField()),
+                ("winner", models.BooleanField(default=False)),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scores",
+                        to="games.game",
+                    ),
+                ),
+                (
+                    "parameters",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="scores",
+                        to="games.scoreparameters",
+                    ),
+                ),
+                (
+                    "player",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="game_scores",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("-points",),
+                "indexes": [
+                    models.Index(
+                        fields=["parameters", "player"],
+                        name="games_games_paramet_258f8f_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="gamescore",
+            constraint=models.UniqueConstraint(
+                fields=("game", "player", "parameters"),
+                name="unique_game_player_parameters",
+            ),
+        ),
+        migrations.RunPython(score_existing_games, migrations.RunPython.noop),
+    ]
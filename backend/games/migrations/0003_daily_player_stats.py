@@ -0,0 +1,106 @@
+# Generated by Django 4.2.5 on 2026-10-18 14:20
+
+import datetime
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+
+
+def build_daily_stats(apps, schema_editor):
+    """Daily totals of the existing scores."""
+    GameScore = apps.get_model("games", "GameScore")
+    DailyPlayerStats = apps.get_model("games", "DailyPlayerStats")
+
+    daily_scores = (
+        GameScore.objects.filter(game__valid=True)
+        .annotate(day=TruncDate("game__date", tzinfo=datetime.timezone.utc))
+        .values("player", "parameters", "day")
+        .annotate(
+            total_points=Sum("points"),
+            total_games_played=Count("id"),
+            total_wins=Count("id", filter=Q(winner=True)),
+            total_total_reign_time=Sum("total_reign_time"),
+            total_crowns_claimed=Sum("crowns_claimed"),
+        )
+    )
+
+    DailyPlayerStats.objects.bulk_create(
+        DailyPlayerStats(
+            player_id=row["player"],
+            parameters_id=row["parameters"],
+            day=row["day"],
+            points=row["total_points"],
+            games_played=row["total_games_played"],
+            wins=row["total_wins"],
+            total_reign_time=row["total_total_reign_time"],
+            crowns_claimed=row["total_crowns_claimed"],
+        )
+        for row in daily_scores
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("games", "0002_game_scores"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyPlayerStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("points", models.IntegerField(default=0)),
+                ("games_played", models.IntegerField(default=0)),
+                ("wins", models.IntegerField(default=0)),
+                ("total_reign_time", models.IntegerField(default=0)),
+                ("crowns_claimed", models.IntegerField(default=0)),
+                (
+                    "parameters",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="games.scoreparameters",
+                    ),
+                ),
+                (
+                    "player",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "daily player stats",
+                "indexes": [
+                    models.Index(
+                        fields=["parameters", "day"],
+                        name="games_daily_paramet_c7744a_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="dailyplayerstats",
+            constraint=models.UniqueConstraint(
+                fields=("parameters", "player", "day"),
+                name="unique_parameters_player_day",
+            ),
+        ),
+        migrations.RunPython(build_daily_stats, migrations.RunPython.noop),
+    ]
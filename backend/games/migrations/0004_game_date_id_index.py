@@ -0,0 +1,17 @@
+# Generated by Django 4.2.5 on 2026-10-18 14:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0003_daily_player_stats"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(fields=["date", "id"], name="games_game_date_764d09_idx"),
+        ),
+    ]
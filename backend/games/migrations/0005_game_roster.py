@@ -0,0 +1,42 @@
+# Generated by Django 4.2.5 on 2026-10-18 14:26
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def roster_key(players_pks):
+    """Copy of games.models.roster_key at the time of this migration."""
+    pks = sorted({int(pk) for pk in players_pks})
+    if not pks:
+        return ""
+
+    return "," + ",".join(map(str, pks)) + ","
+
+
+def build_rosters(apps, schema_editor):
+    """Roster of the existing games, from their players."""
+    Game = apps.get_model("games", "Game")
+
+    players = defaultdict(list)
+    for game_id, player_id in Game.players.through.objects.values_list("game_id", "customuser_id"):
+        players[game_id].append(player_id)
+
+    games = [Game(pk=game_id, roster=roster_key(pks)) for game_id, pks in players.items()]
+    Game.objects.bulk_update(games, ["roster"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0004_game_date_id_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="roster",
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(build_rosters, migrations.RunPython.noop),
+    ]
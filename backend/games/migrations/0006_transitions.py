@@ -0,0 +1,89 @@
+# Generated by Django 4.2.5 on 2026-10-18 14:31
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+BATCH_SIZE = 1000
+
+
+def build_transition_rows(apps, schema_editor):
+    """Rows of the transitions of the existing games."""
+    Game = apps.get_model("games", "Game")
+    Transition = apps.get_model("games", "Transition")
+
+    rows = []
+    for game_id, transitions in Game.objects.values_list("pk", "transitions").iterator(chunk_size=BATCH_SIZE):
+        rows.extend(
+            Transition(
+                game_id=game_id,
+                sequence=sequence,
+                player_id=transition["player"],
+                duration=transition["duration"],
+            )
+            for sequence, transition in enumerate(transitions)
+        )
+        if len(rows) >= BATCH_SIZE:
+            Transition.objects.bulk_create(rows)
+            rows = []
+
+    Transition.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("games", "0005_game_roster"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Transition",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("sequence", models.IntegerField()),
+                ("duration", models.IntegerField()),
+                (
+                    "game",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transition_rows",
+                        to="games.game",
+                    ),
+                ),
+                (
+                    "player",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transitions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("game", "sequence"),
+                "indexes": [
+                    models.Index(
+                        fields=["player", "game"], name="games_trans_player__dd7444_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="transition",
+            constraint=models.UniqueConstraint(
+                fields=("game", "sequence"), name="unique_game_sequence"
+            ),
+        ),
+        migrations.RunPython(build_transition_rows, migrations.RunPython.noop),
+    ]
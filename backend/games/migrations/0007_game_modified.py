@@ -0,0 +1,26 @@
+# Generated by Django 4.2.5 on 2026-10-18 14:39
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def set_modified(apps, schema_editor):
+    """Existing games were last changed when they were played."""
+    Game = apps.get_model("games", "Game")
+    Game.objects.update(modified=F("date"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0006_transitions"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="game",
+            name="modified",
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.RunPython(set_modified, migrations.RunPython.noop),
+    ]
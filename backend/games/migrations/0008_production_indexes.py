@@ -0,0 +1,60 @@
+# Generated by Django 4.2.5 on 2026-10-18 15:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("games", "0007_game_modified"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(fields=["valid", "date"], name="games_game_valid_b90b8a_idx"),
+        ),
+        # The through table of Game.players is declared as GamePlayer, for its index,
+        # the table is left as it is
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name="GamePlayer",
+                    fields=[
+                        (
+                            "id",
+                            models.BigAutoField(
+                                auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                            ),
+                        ),
+                        (
+                            "customuser",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL
+                            ),
+                        ),
+                        (
+                            "game",
+                            models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="games.game"),
+                        ),
+                    ],
+                    options={
+                        "db_table": "games_game_players",
+                        "unique_together": {("game", "customuser")},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name="game",
+                    name="players",
+                    field=models.ManyToManyField(through="games.GamePlayer", to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="gameplayer",
+            index=models.Index(fields=["customuser", "game"], name="games_game__customu_9d5c76_idx"),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.5 on 2026-10-18 16:21
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0008_production_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GameDeletion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("game_id", models.BigIntegerField()),
+                ("deleted", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
@@ -2,17 +2,221 @@ from accounts.models import CustomUser
 from django.db import models
 from django.utils import timezone
 
+# DEFAULT POINTS SETTINGS
+DEFAULT_ALPHA = 190
+DEFAULT_BETA = 0.05
+DEFAULT_SIGMA = 1.9
+
+DEFAULT_POINTS_LAST_KING = 30
+
+
+def roster_key(players_pks) -> str:
+    """Sorted pks of the players of a game, e.g. ",1,5,9," for players 9, 1 and 5.
+
+    The separators around each pk make ``",5,"`` a substring of the key only
+    when player 5 is part of the game.
+    """
+    pks = sorted({int(pk) for pk in players_pks})
+    if not pks:
+        return ""
+
+    return "," + ",".join(map(str, pks)) + ","
 
 
 class Game(models.Model):
-    players = models.ManyToManyField(CustomUser)
+    players = models.ManyToManyField(CustomUser, through="GamePlayer")
     transitions = models.JSONField()
     date = models.DateTimeField(default=timezone.now, editable=False)
 
     valid = models.BooleanField(default=True)
 
+    # Players of the game as a roster_key, kept in sync with `players` by the signals
+    roster = models.CharField(max_length=255, blank=True, db_index=True, editable=False)
+
+    # Last change of the game, its players or its scores, for conditional requests
+    modified = models.DateTimeField(auto_now=True, db_index=True)
+
     class Meta:
         ordering = ("-date",)
+        indexes = [
+            # Keyset pagination
+            models.Index(fields=["date", "id"]),
+            # Valid games by date, read by the lists, the exports and the leaderboard
+            models.Index(fields=["valid", "date"]),
+        ]
+
+    def __str__(self):
+        return f"Game [{self.pk}]"
+
+    def update_roster(self):
+        self.roster = roster_key(self.players.values_list("pk", flat=True))
+        self.modified = timezone.now()
+        Game.objects.filter(pk=self.pk).update(roster=self.roster, modified=self.modified)
+
+    def build_transitions(self) -> list["Transition"]:
+        """Unsaved rows of the transitions of the game."""
+        return [
+            Transition(game=self, sequence=sequence, player_id=transition["player"], duration=transition["duration"])
+            for sequence, transition in enumerate(self.transitions)
+        ]
+
+    def update_transitions(self):
+        self.transition_rows.all().delete()
+        Transition.objects.bulk_create(self.build_transitions())
+
+
+class GameDeletion(models.Model):
+    """A deleted game, the games list changes when one is removed while its last modification does not."""
+
+    game_id = models.BigIntegerField()
+    deleted = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Game [{self.game_id}] deleted"
+
+    @classmethod
+    def last(cls) -> int | None:
+        """Pk of the last deletion, an index lookup."""
+        return cls.objects.order_by("-pk").values_list("pk", flat=True).first()
+
+    @classmethod
+    async def alast(cls) -> int | None:
+        return await cls.objects.order_by("-pk").values_list("pk", flat=True).afirst()
+
+
+class GamePlayer(models.Model):
+    """A player of a game, the through table of ``Game.players``, declared for its indexes."""
+
+    game = models.ForeignKey(Game, on_delete=models.CASCADE)
+    customuser = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = "games_game_players"
+        unique_together = [("game", "customuser")]
+        indexes = [
+            # Covers the games of players, the players filter reads only the index
+            models.Index(fields=["customuser", "game"]),
+        ]
+
+    def __str__(self):
+        return f"{self.game}: {self.customuser_id}"
+
+
+class Transition(models.Model):
+    """A transition of a game, the rows of ``Game.transitions`` to aggregate them in the database."""
+
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="transition_rows")
+    # Position of the transition in the game, starting at 0
+    sequence = models.IntegerField()
+    # Not constrained, as the players of the transitions are only checked by the API
+    player = models.ForeignKey(
+        CustomUser, on_delete=models.CASCADE, related_name="transitions", db_constraint=False
+    )
+    duration = models.IntegerField()
+
+    class Meta:
+        ordering = ("game", "sequence")
+        constraints = [
+            models.UniqueConstraint(fields=["game", "sequence"], name="unique_game_sequence"),
+        ]
+        indexes = [
+            models.Index(fields=["player", "game"]),
+        ]
+
+    def __str__(self):
+        return f"{self.game} #{self.sequence}: {self.player_id} for {self.duration}s"
+
+
+class ScoreParameters(models.Model):
+    """A version of the parameters used to score the games."""
+
+    alpha = models.IntegerField(default=DEFAULT_ALPHA)
+    beta = models.FloatField(default=DEFAULT_BETA)
+    sigma = models.FloatField(default=DEFAULT_SIGMA)
+    points_last_king = models.IntegerField(default=DEFAULT_POINTS_LAST_KING)
+
+    created = models.DateTimeField(default=timezone.now, editable=False)
+
+    # Only the active version is used to display the scores
+    active = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ("-created",)
+        verbose_name_plural = "score parameters"
+
+    def __str__(self):
+        return f"Score parameters v{self.pk}"
+
+    @classmethod
+    def current(cls) -> "ScoreParameters":
+        """Active version of the parameters, created with the defaults if there is none."""
+        parameters = cls.objects.filter(active=True).order_by("-created", "-pk").first()
+        if parameters is None:
+            parameters = cls.objects.create(active=True)
+
+        return parameters
+
+    @classmethod
+    async def acurrent(cls) -> "ScoreParameters":
+        parameters = await cls.objects.filter(active=True).order_by("-created", "-pk").afirst()
+        if parameters is None:
+            parameters = await cls.objects.acreate(active=True)
+
+        return parameters
+
+
+class GameScore(models.Model):
+    """Score of a player in a game, for a version of the score parameters."""
+
+    game = models.ForeignKey(Game, on_delete=models.CASCADE, related_name="scores")
+    player = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="game_scores")
+    parameters = models.ForeignKey(ScoreParameters, on_delete=models.CASCADE, related_name="scores")
+
+    points = models.IntegerField()
+    total_reign_time = models.IntegerField()
+    crowns_claimed = models.IntegerField()
+    winner = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ("-points",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["game", "player", "parameters"], name="unique_game_player_parameters"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["parameters", "player"]),
+        ]
+
+    def __str__(self):
+        return f"{self.player} in {self.game}: {self.points} points"
+
+
+class DailyPlayerStats(models.Model):
+    """Totals of the scores of a player over the valid games of a day (UTC)."""
+
+    player = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name="daily_stats")
+    parameters = models.ForeignKey(
+        ScoreParameters, on_delete=models.CASCADE, related_name="daily_stats"
+    )
+    day = models.DateField()
+
+    points = models.IntegerField(default=0)
+    games_played = models.IntegerField(default=0)
+    wins = models.IntegerField(default=0)
+    total_reign_time = models.IntegerField(default=0)
+    crowns_claimed = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "daily player stats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["parameters", "player", "day"], name="unique_parameters_player_day"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["parameters", "day"]),
+        ]
 
     def __str__(self):
-        return f"Game [{self.pk}]"
\ No newline at end of file
+        return f"{self.player} on {self.day}"
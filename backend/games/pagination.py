@@ -0,0 +1,110 @@
+import base64
+import datetime
+from urllib import parse
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class GameKeysetPagination(BasePagination):
+    """Pagination of the games by ``(date, id)``, newest first.
+
+    Pages are selected with a cursor on the last (or first) game of the
+    previous page instead of an offset, so no count is needed and every page
+    costs the same index range scan, however deep it is.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.page_queryset(queryset, request)))
+
+    def page_queryset(self, queryset, request):
+        """Games of the page, plus the next one that tells if there is a page after it."""
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+
+        queryset = queryset.order_by("-date", "-id")
+        if self.cursor is not None:
+            date, pk, reverse = self.cursor
+            if reverse:
+                queryset = queryset.filter(Q(date__gt=date) | Q(date=date, id__gt=pk)).reverse()
+            else:
+                queryset = queryset.filter(Q(date__lt=date) | Q(date=date, id__lt=pk))
+
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, results):
+        """Sets the cursors of the page from the games of ``page_queryset``."""
+        reverse = self.cursor is not None and self.cursor[2]
+
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, self.cursor is not None
+
+        self.next_cursor = None
+        self.previous_cursor = None
+        if results and has_next:
+            self.next_cursor = (results[-1].date, results[-1].pk, False)
+        if results and has_previous:
+            self.previous_cursor = (results[0].date, results[0].pk, True)
+
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        return self.encode_cursor(self.next_cursor)
+
+    def get_previous_link(self):
+        return self.encode_cursor(self.previous_cursor)
+
+    def encode_cursor(self, cursor):
+        if cursor is None:
+            return None
+
+        date, pk, reverse = cursor
+        token = f"{date.isoformat()}|{pk}|{int(reverse)}"
+        encoded = base64.urlsafe_b64encode(token.encode()).decode()
+
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            token = base64.urlsafe_b64decode(parse.unquote(encoded).encode()).decode()
+            date, pk, reverse = token.split("|")
+            return datetime.datetime.fromisoformat(date), int(pk), bool(int(reverse))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
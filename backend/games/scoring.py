@@ -0,0 +1,106 @@
+import math
+
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import games_cache
+from .leaderboard import update_daily_stats
+from .models import Game, GameScore, ScoreParameters
+from .stats import invalidate_career_stats
+
+# transitions format is the following:
+
+# [
+#     {"player": 1, "duration": 64},
+#     {"player": 2, "duration": 20},
+#     {"player": 3, "duration": 32},
+#     {"player": 1, "duration": 35},
+# ]
+
+# The formulas are the ones of koth_stats, see the README for details.
+
+
+def score_transitions(players_pks: list[int], transitions: list[dict], parameters) -> dict[int, dict]:
+    """Computes the score of each player of a game from its transitions."""
+    game_duration = sum(transition["duration"] for transition in transitions)
+
+    stats = {
+        pk: {"total_reign_time": 0, "crowns_claimed": 0, "reign_time_points": 0.0}
+        for pk in players_pks
+    }
+
+    for i, transition in enumerate(transitions):
+        # Transitions of players outside of the game only count in its duration
+        player_stats = stats.get(transition["player"])
+        if player_stats is None:
+            continue
+        duration = transition["duration"]
+
+        player_stats["total_reign_time"] += duration
+        # The first king did not claim his crown
+        if i > 0:
+            player_stats["crowns_claimed"] += 1
+
+        # A game without duration only scores its last king
+        if game_duration:
+            duration_perc = int(math.ceil(duration / game_duration * 100))
+            player_stats["reign_time_points"] += duration_perc**parameters.sigma
+
+    last_king = transitions[-1]["player"] if transitions else None
+
+    scores = {}
+    for pk, player_stats in stats.items():
+        points = 0
+        if game_duration:
+            points += math.ceil(parameters.alpha * (player_stats["total_reign_time"] / game_duration))
+        points += math.ceil(parameters.beta * player_stats["reign_time_points"])
+        if pk == last_king:
+            points += parameters.points_last_king
+
+        scores[pk] = {
+            "points": points,
+            "total_reign_time": player_stats["total_reign_time"],
+            "crowns_claimed": player_stats["crowns_claimed"],
+        }
+
+    best_points = max((score["points"] for score in scores.values()), default=0)
+    for score in scores.values():
+        score["winner"] = score["points"] == best_points
+
+    return scores
+
+
+def build_game_scores(game: Game, players_pks: list[int], parameters: ScoreParameters):
+    """Unsaved ``GameScore`` of each player of a game."""
+    scores = score_transitions(players_pks, game.transitions, parameters)
+
+    return [
+        GameScore(game=game, player_id=pk, parameters=parameters, **score)
+        for pk, score in scores.items()
+    ]
+
+
+def save_game_scores(game: Game, parameters: ScoreParameters | None = None) -> list[GameScore]:
+    """Scores a game and stores the score of each player."""
+    if parameters is None:
+        parameters = ScoreParameters.current()
+
+    players_pks = list(game.players.values_list("pk", flat=True))
+
+    with transaction.atomic():
+        previous_scores = GameScore.objects.filter(game=game, parameters=parameters)
+        if game.valid:
+            update_daily_stats(list(previous_scores.select_related("game")), sign=-1)
+        previous_scores.delete()
+
+        scores = GameScore.objects.bulk_create(build_game_scores(game, players_pks, parameters))
+        if game.valid:
+            update_daily_stats(scores)
+
+        game.modified = timezone.now()
+        Game.objects.filter(pk=game.pk).update(modified=game.modified)
+
+    invalidate_career_stats(players_pks)
+    games_cache.invalidate()
+
+    return scores
@@ -0,0 +1,279 @@
+import datetime
+import random
+from bisect import bisect
+from collections import defaultdict
+from itertools import accumulate
+from math import log
+
+from accounts.models import CustomUser
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.utils import timezone
+
+from .cache import games_cache, players_cache
+from .leaderboard import STATS_FIELDS
+from .models import DailyPlayerStats, Game, GameScore, ScoreParameters, Transition, roster_key
+from .scoring import score_transitions
+from .stats import invalidate_career_stats
+
+# Synthetic games written with bulk inserts, for the development databases, the
+# benchmarks and the scale tests. The games skip the model signals: their roster
+# is set directly, and all their rows are inserted by multi-row statements
+# through the cursor of Django, without building model instances, which is most
+# of the cost of bulk_create.
+#
+# Games are drawn from a seeded random generator, the same seed, users and
+# start date give the same games.
+
+# Weights of the number of players of a game, from 2 to 6
+NB_PLAYERS_WEIGHTS = [35, 30, 20, 10, 5]
+
+# Median and spread of the number of transitions of a game (log-normal)
+MEDIAN_TRANSITIONS = 20
+TRANSITIONS_SIGMA = 0.5
+MAX_TRANSITIONS = 200
+
+# Mean reign of a player of average skill, in seconds (exponential)
+MEAN_REIGN = 30
+
+# Games per INSERT without RETURNING, lowered by Django to the parameters limit of the backend
+BULK_BATCH_SIZE = 1000
+
+
+def pick(rng: random.Random, items: list, cum_weights: list[float]):
+    """An item drawn by weight, ``rng.choices`` without its overhead."""
+    return items[bisect(cum_weights, rng.random() * cum_weights[-1])]
+
+
+class SyntheticPlayers:
+    """Players to draw the games from, some play more and some hold the crown longer."""
+
+    def __init__(self, players_pks: list[int], rng: random.Random):
+        self.pks = players_pks
+        activity = [rng.lognormvariate(0, 1) for _ in players_pks]
+        self.activity_weights = list(accumulate(activity))
+        self.skills = {pk: rng.lognormvariate(0, 0.5) for pk in players_pks}
+        self.mean_reigns = {pk: MEAN_REIGN * skill for pk, skill in self.skills.items()}
+
+    def draw(self, rng: random.Random, count: int) -> list[int]:
+        """``count`` different players, drawn by activity."""
+        players = []
+        while len(players) < count:
+            player = pick(rng, self.pks, self.activity_weights)
+            if player not in players:
+                players.append(player)
+
+        return players
+
+
+def random_game(rng: random.Random, players: SyntheticPlayers) -> tuple[list[int], list[dict]]:
+    """Players and transitions of a game, the crown goes to another player at each transition."""
+    nb_players = min(rng.choices(range(2, 7), NB_PLAYERS_WEIGHTS)[0], len(players.pks))
+    game_players = players.draw(rng, nb_players)
+    skills = [players.skills[pk] for pk in game_players]
+
+    # Challengers of each king, by skill
+    challengers = {}
+    for king in game_players:
+        others = [(pk, skill) for pk, skill in zip(game_players, skills) if pk != king]
+        challengers[king] = ([pk for pk, _ in others], list(accumulate(skill for _, skill in others)))
+
+    nb_transitions = int(rng.lognormvariate(0, TRANSITIONS_SIGMA) * MEDIAN_TRANSITIONS)
+    nb_transitions = max(1, min(nb_transitions, MAX_TRANSITIONS))
+
+    king = pick(rng, game_players, list(accumulate(skills)))
+    transitions = []
+    random = rng.random
+    mean_reigns = players.mean_reigns
+    for _ in range(nb_transitions):
+        # rng.expovariate without its overhead
+        duration = 1 + int(-log(1.0 - random()) * mean_reigns[king])
+        transitions.append({"player": king, "duration": duration})
+
+        candidates, cum_weights = challengers[king]
+        if candidates:
+            king = pick(rng, candidates, cum_weights)
+
+    return game_players, transitions
+
+
+def seed_users(count: int, prefix: str) -> list[int]:
+    """Pks of the users ``<prefix>0`` to ``<prefix><count - 1>``, created when missing."""
+    usernames = [f"{prefix}{i}" for i in range(count)]
+    CustomUser.objects.bulk_create((CustomUser(username=username) for username in usernames), ignore_conflicts=True)
+    pks = dict(CustomUser.objects.filter(username__in=usernames).values_list("username", "pk"))
+
+    return [pks[username] for username in usernames]
+
+
+def insert_rows(model, fields: list[str], rows: list[tuple], returning: bool = False, on_conflict: str = "") -> list:
+    """Inserts the values of ``fields`` of each row by multi-row statements, without model instances.
+
+    Returns the pks of the new rows with ``returning``, on the backends that
+    support ``INSERT ... RETURNING``. ``on_conflict`` is an ``ON CONFLICT`` clause.
+    """
+    opts = model._meta
+    quote = connection.ops.quote_name
+    columns = ", ".join(quote(opts.get_field(field).column) for field in fields)
+    placeholders = "(" + ", ".join(["%s"] * len(fields)) + ")"
+    suffix = f" {on_conflict}" if on_conflict else ""
+    if returning:
+        suffix += f" RETURNING {quote(opts.pk.column)}"
+
+    # Many rows per statement, as much as 2.5 times faster than executemany even on SQLite
+    max_params = connection.features.max_query_params or 65535
+    batch_size = max(1, min(1000, max_params // len(fields)))
+
+    pks = []
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            sql = f"INSERT INTO {quote(opts.db_table)} ({columns}) VALUES {', '.join([placeholders] * len(batch))}"
+            cursor.execute(sql + suffix, [value for row in batch for value in row])
+            if returning:
+                pks.extend(row[0] for row in cursor.fetchall())
+
+    return pks
+
+
+def insert_game_rows(games_data) -> list[int]:
+    """Pks of the new games of ``(players, transitions, date)``."""
+    if not connection.features.can_return_rows_from_bulk_insert:
+        games = Game.objects.bulk_create(
+            (
+                Game(transitions=transitions, roster=roster_key(players), date=date)
+                for players, transitions, date in games_data
+            ),
+            batch_size=BULK_BATCH_SIZE,
+        )
+        return [game.pk for game in games]
+
+    # Prepared by the fields as bulk_create would, without building the instances,
+    # with the connection itself rather than its proxy looked up at each value
+    db = connections[DEFAULT_DB_ALIAS]
+    transitions_field = Game._meta.get_field("transitions")
+    date_field = Game._meta.get_field("date")
+    modified = date_field.get_db_prep_save(timezone.now(), db)
+    rows = [
+        (
+            transitions_field.get_db_prep_save(transitions, db),
+            date_field.get_db_prep_save(date, db),
+            True,
+            roster_key(players),
+            modified,
+        )
+        for players, transitions, date in games_data
+    ]
+
+    return insert_rows(Game, ["transitions", "date", "valid", "roster", "modified"], rows, returning=True)
+
+
+def add_daily_stats(totals: dict[tuple[int, datetime.date], dict], parameters: ScoreParameters):
+    """Adds totals of the ``STATS_FIELDS`` by ``(player, day)`` to the daily stats, created when missing.
+
+    Multi-row upserts, instead of ``rebuild_daily_stats`` which aggregates all the scores again.
+    """
+    opts = DailyPlayerStats._meta
+    quote = connection.ops.quote_name
+    table = quote(opts.db_table)
+    unique = ", ".join(quote(opts.get_field(field).column) for field in ["parameters", "player", "day"])
+    stats_columns = [quote(opts.get_field(field).column) for field in STATS_FIELDS]
+    updates = ", ".join(f"{column} = {table}.{column} + excluded.{column}" for column in stats_columns)
+    day_field = opts.get_field("day")
+    days = {day: day_field.get_db_prep_save(day, connection) for _, day in totals}
+
+    insert_rows(
+        DailyPlayerStats,
+        ["player", "parameters", "day", *STATS_FIELDS],
+        [(player, parameters.pk, days[day], *map(total.get, STATS_FIELDS)) for (player, day), total in totals.items()],
+        on_conflict=f"ON CONFLICT ({unique}) DO UPDATE SET {updates}",
+    )
+
+
+def insert_games(games_data: list[tuple[list[int], list[dict], datetime.datetime]], parameters=None) -> list[int]:
+    """Inserts games of ``(players, transitions, date)`` with their rows, and their scores with ``parameters``.
+
+    The scores are added to the daily stats. Returns the pks of the games.
+    """
+    with transaction.atomic():
+        games_pks = insert_game_rows(games_data)
+
+        insert_rows(
+            Game.players.through,
+            ["game", "customuser"],
+            [(game_pk, player) for game_pk, (players, _, _) in zip(games_pks, games_data) for player in players],
+        )
+        insert_rows(
+            Transition,
+            ["game", "sequence", "player", "duration"],
+            [
+                (game_pk, sequence, transition["player"], transition["duration"])
+                for game_pk, (_, transitions, _) in zip(games_pks, games_data)
+                for sequence, transition in enumerate(transitions)
+            ],
+        )
+
+        if parameters is not None:
+            rows = []
+            totals = defaultdict(lambda: {field: 0 for field in STATS_FIELDS})
+            for game_pk, (players, transitions, date) in zip(games_pks, games_data):
+                day = date.astimezone(datetime.timezone.utc).date()
+                for player, score in score_transitions(players, transitions, parameters).items():
+                    total = totals[(player, day)]
+                    total["points"] += score["points"]
+                    total["games_played"] += 1
+                    total["wins"] += int(score["winner"])
+                    total["total_reign_time"] += score["total_reign_time"]
+                    total["crowns_claimed"] += score["crowns_claimed"]
+                    rows.append(
+                        (
+                            game_pk,
+                            player,
+                            parameters.pk,
+                            score["points"],
+                            score["total_reign_time"],
+                            score["crowns_claimed"],
+                            score["winner"],
+                        )
+                    )
+            insert_rows(
+                GameScore,
+                ["game", "player", "parameters", "points", "total_reign_time", "crowns_claimed", "winner"],
+                rows,
+            )
+            add_daily_stats(totals, parameters)
+
+    return games_pks
+
+
+def seed_games(
+    count: int,
+    players_pks: list[int],
+    start: datetime.datetime,
+    days: float = 365,
+    seed: int = 0,
+    batch_size: int = 10_000,
+    parameters: ScoreParameters | None = None,
+):
+    """Adds ``count`` random games of the players, spread over ``days`` from ``start``.
+
+    The games are inserted by batches of ``batch_size``, the number of games of
+    each batch is yielded once it is committed. Their scores are stored with
+    ``parameters`` and added to the daily stats.
+    """
+    rng = random.Random(seed)
+    players = SyntheticPlayers(players_pks, rng)
+    # Games in order of their dates, as they would be uploaded
+    step = datetime.timedelta(days=days) / max(count, 1)
+
+    for batch_start in range(0, count, batch_size):
+        games_data = []
+        for i in range(batch_start, min(batch_start + batch_size, count)):
+            game_players, transitions = random_game(rng, players)
+            games_data.append((game_players, transitions, start + step * (i + rng.random())))
+
+        insert_games(games_data, parameters)
+        yield len(games_data)
+
+    games_cache.invalidate()
+    players_cache.invalidate()
+    invalidate_career_stats(players_pks)
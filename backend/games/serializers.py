@@ -1,14 +1,162 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
 
-from .models import Game
+from .cache import games_cache
+from .leaderboard import update_daily_stats
+from .metrics import TimedSerializerMixin
+from .models import Game, GameScore, ScoreParameters, Transition, roster_key
+from .scoring import build_game_scores
+from .stats import invalidate_career_stats
 
+# Most games that can be uploaded at once
+MAX_BULK_GAMES = 500
 
-class GameSerializer(serializers.ModelSerializer):
-    transitions = serializers.ListField(allow_empty=False)
+
+class GameScoreSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = GameScore
+        fields = ["player", "points", "total_reign_time", "crowns_claimed", "winner"]
+
+
+def players_pks(data: list) -> set[int]:
+    """Pks of the players of raw games, the invalid ones are left to the validation."""
+    pks = set()
+    for game in data:
+        players = game.get("players") if isinstance(game, dict) else None
+        if not isinstance(players, list):
+            continue
+
+        for pk in players:
+            try:
+                pks.add(int(pk))
+            except (TypeError, ValueError):
+                pass
+
+    return pks
+
+
+class PlayerField(serializers.PrimaryKeyRelatedField):
+    """Pk of a player, looked up in the players loaded by a bulk upload when there are some."""
+
+    def to_internal_value(self, data):
+        players = self.context.get("players")
+        if players is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return players[int(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+def is_integer(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class TransitionsField(serializers.ListField):
+    """Transitions of a game, ``{"player": pk, "duration": seconds}``, the game has to last."""
+
+    default_error_messages = {
+        "invalid_transition": 'Each transition needs an integer "player" and a "duration" of 0 seconds or more.',
+        "no_duration": "The transitions need to last more than 0 seconds.",
+    }
+
+    def to_internal_value(self, data):
+        transitions = super().to_internal_value(data)
+
+        for transition in transitions:
+            if not (
+                isinstance(transition, dict)
+                and is_integer(transition.get("player"))
+                and is_integer(transition.get("duration"))
+                and transition["duration"] >= 0
+            ):
+                self.fail("invalid_transition")
+
+        if not sum(transition["duration"] for transition in transitions):
+            self.fail("no_duration")
+
+        return transitions
+
+
+def create_games(validated_data: list[dict]) -> list[Game]:
+    """Inserts validated games with their players, transitions, scores and daily stats.
+
+    A constant number of queries whatever the number of games, the rows are
+    inserted in bulk and the roster is computed from the validated players,
+    without the signals of the models.
+    """
+    Through = Game.players.through
+    parameters = ScoreParameters.current()
+
+    with transaction.atomic():
+        games = Game.objects.bulk_create(
+            Game(
+                roster=roster_key(player.pk for player in data["players"]),
+                **{field: value for field, value in data.items() if field != "players"},
+            )
+            for data in validated_data
+        )
+        Through.objects.bulk_create(
+            Through(game_id=game.pk, customuser_id=player.pk)
+            for game, data in zip(games, validated_data)
+            for player in data["players"]
+        )
+        Transition.objects.bulk_create(transition for game in games for transition in game.build_transitions())
+
+        scores = []
+        for game, data in zip(games, validated_data):
+            game_scores = build_game_scores(game, [player.pk for player in data["players"]], parameters)
+            # In the order of GameScore.Meta.ordering, as when they are fetched
+            game.current_scores = sorted(game_scores, key=lambda score: -score.points)
+            scores.extend(game_scores)
+        GameScore.objects.bulk_create(scores)
+        update_daily_stats(scores)
+
+    invalidate_career_stats({score.player_id for score in scores})
+    games_cache.invalidate()
+
+    prefetch_related_objects(games, "players")
+
+    return games
+
+
+class GameListSerializer(serializers.ListSerializer):
+    """Bulk upload of games, all the games are inserted or none of them."""
+
+    def to_internal_value(self, data):
+        # The players of all the games are fetched in a single query
+        if isinstance(data, list):
+            self._context["players"] = get_user_model().objects.in_bulk(players_pks(data))
+
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        return create_games(validated_data)
+
+
+class GameSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    players = PlayerField(many=True, allow_empty=False, queryset=get_user_model().objects.all())
+    transitions = TransitionsField(allow_empty=False)
+    scores = serializers.SerializerMethodField()
 
     class Meta:
         model = Game
-        fields = ["players", "transitions", "date"]
+        fields = ["players", "transitions", "date", "scores"]
+        list_serializer_class = GameListSerializer
+
+    def to_internal_value(self, data):
+        # The players of a single upload are fetched in a single query too
+        if "players" not in self.context and isinstance(data, dict):
+            self.context["players"] = get_user_model().objects.in_bulk(players_pks([data]))
+
+        return super().to_internal_value(data)
 
     def validate(self, data):
         """
@@ -21,3 +169,34 @@ class GameSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError(f"Invalid player in transitions. pk={transition['player']}")
 
         return data
+
+    def create(self, validated_data):
+        return create_games([validated_data])[0]
+
+    def get_scores(self, game):
+        """Scores of the players with the active score parameters."""
+        # Prefetched by the views listing games
+        scores = getattr(game, "current_scores", None)
+        if scores is None:
+            scores = game.scores.filter(parameters=ScoreParameters.current())
+
+        return GameScoreSerializer(scores, many=True).data
+
+
+class LeaderboardSerializer(TimedSerializerMixin, serializers.Serializer):
+    player = serializers.IntegerField()
+    points = serializers.IntegerField()
+    games_played = serializers.IntegerField()
+    wins = serializers.IntegerField()
+    total_reign_time = serializers.IntegerField()
+    crowns_claimed = serializers.IntegerField()
+
+
+class CareerStatsSerializer(TimedSerializerMixin, serializers.Serializer):
+    player = serializers.IntegerField()
+    games_played = serializers.IntegerField()
+    wins = serializers.IntegerField()
+    total_reign_time = serializers.IntegerField()
+    longest_reign_time = serializers.IntegerField()
+    crowns_claimed = serializers.IntegerField()
+    average_points = serializers.FloatField()
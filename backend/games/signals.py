@@ -0,0 +1,110 @@
+from accounts.models import CustomUser
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .cache import games_cache, players_cache
+from .leaderboard import update_daily_stats
+from .models import Game, GameDeletion, Transition
+from .scoring import save_game_scores
+from .stats import invalidate_career_stats
+
+
+@receiver(pre_save, sender=Game)
+def remember_previous_state(sender, instance, **kwargs):
+    """Keeps the validity and transitions stored before the save to detect when they change."""
+    previous = None
+    if instance.pk is not None:
+        previous = Game.objects.filter(pk=instance.pk).values_list("valid", "transitions").first()
+
+    instance._previous_valid, instance._previous_transitions = previous or (None, None)
+
+
+@receiver(post_save, sender=Game)
+def update_leaderboard_on_validity_change(sender, instance, created, **kwargs):
+    """Adds or removes the scores of a game from the daily stats when it is (in)validated."""
+    previous_valid = getattr(instance, "_previous_valid", None)
+    if created or previous_valid is None or previous_valid == instance.valid:
+        return
+
+    scores = list(instance.scores.select_related("game"))
+    update_daily_stats(scores, sign=1 if instance.valid else -1)
+    invalidate_career_stats(instance.players.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Game)
+def update_transition_rows(sender, instance, created, **kwargs):
+    """Keeps the transition rows and the scores in sync with the transitions of the game."""
+    if created:
+        # Without players yet, the game is scored when they are added
+        Transition.objects.bulk_create(instance.build_transitions())
+    elif instance.transitions != getattr(instance, "_previous_transitions", None):
+        instance.update_transitions()
+        save_game_scores(instance)
+
+
+@receiver(m2m_changed, sender=Game.players.through)
+def update_roster(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keeps the roster of the games in sync with their players, whose career stats change."""
+    if action not in ("post_add", "post_remove", "post_clear", "pre_clear"):
+        return
+
+    if not reverse:
+        if action == "pre_clear":
+            instance._cleared_players = list(instance.players.values_list("pk", flat=True))
+            return
+
+        instance.update_roster()
+        if action == "post_clear":
+            pk_set = getattr(instance, "_cleared_players", [])
+        invalidate_career_stats(pk_set)
+        save_game_scores(instance)
+        return
+
+    # From the player side, the games are only known before a clear
+    if action == "pre_clear":
+        instance._cleared_games = list(instance.game_set.values_list("pk", flat=True))
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_games", [])
+
+    for game in Game.objects.filter(pk__in=pk_set):
+        game.update_roster()
+        save_game_scores(game)
+    invalidate_career_stats([instance.pk])
+
+
+@receiver(pre_delete, sender=Game)
+def remove_deleted_game_from_leaderboard(sender, instance, **kwargs):
+    """Removes the scores of a valid game from the daily stats, before they are deleted with it."""
+    if instance.valid:
+        update_daily_stats(list(instance.scores.select_related("game")), sign=-1)
+
+
+@receiver(pre_delete, sender=Game)
+def invalidate_players_stats(sender, instance, **kwargs):
+    """The players of a deleted game are removed without m2m_changed."""
+    invalidate_career_stats(instance.players.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Game)
+def record_game_deletion(sender, instance, **kwargs):
+    """Changes the version of the games list, which is otherwise read from the remaining games."""
+    GameDeletion.objects.create(game_id=instance.pk)
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_delete, sender=Game)
+def invalidate_games_cache(sender, **kwargs):
+    games_cache.invalidate()
+
+
+@receiver(m2m_changed, sender=Game.players.through)
+def invalidate_games_cache_on_players_change(sender, action, **kwargs):
+    if action.startswith("post_"):
+        games_cache.invalidate()
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_players_cache(sender, **kwargs):
+    players_cache.invalidate()
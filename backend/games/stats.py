@@ -0,0 +1,43 @@
+from django.db.models import Avg, Count, Q
+
+from .cache import career_stats_cache
+from .leaderboard import transitions_aggregates
+from .models import GameScore, ScoreParameters, Transition
+
+# The career stats of a player are cached by version of the score parameters
+# in a namespace of the player, invalidated when his games change, see
+# ``invalidate_career_stats``.
+
+
+def career_stats(player_pk: int, parameters: ScoreParameters) -> dict:
+    """Stats of a player over all his valid games, aggregated in the database."""
+    scores = GameScore.objects.filter(parameters=parameters, player_id=player_pk, game__valid=True).aggregate(
+        games_played=Count("id"),
+        wins=Count("id", filter=Q(winner=True)),
+        average_points=Avg("points"),
+    )
+    reigns = Transition.objects.filter(player_id=player_pk, game__valid=True).aggregate(**transitions_aggregates())
+
+    return {
+        "player": player_pk,
+        "games_played": scores["games_played"],
+        "wins": scores["wins"],
+        "total_reign_time": reigns["sum_total_reign_time"] or 0,
+        "longest_reign_time": reigns["max_reign_time"] or 0,
+        "crowns_claimed": reigns["sum_crowns_claimed"],
+        "average_points": scores["average_points"] or 0,
+    }
+
+
+def cached_career_stats(player_pk: int) -> dict:
+    """Career stats of a player with the active score parameters."""
+    parameters = ScoreParameters.current()
+
+    return career_stats_cache(player_pk).get_or_set(
+        f"parameters:{parameters.pk}", lambda: career_stats(player_pk, parameters)
+    )
+
+
+def invalidate_career_stats(players_pks):
+    for pk in set(players_pks):
+        career_stats_cache(pk).invalidate()
@@ -1,15 +1,22 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from . import views
+from . import async_views, views
 
 router = DefaultRouter()
 router.register("", views.GamesViewSet)
 
 app_name = "games"
 urlpatterns = [
-    # path("", views.AllGamesView.as_view(), name="all"),
-    # TODO need to remove old api urls
-    # path("<int:pk>/", views.GameDetailView.as_view(), name="detail"),
+    # HTML pages, the API answers on "" and "<pk>/"
+    path("all", views.AllGamesView.as_view(), name="all"),
+    path("<int:pk>/details", views.GameDetailView.as_view(), name="detail"),
     path("upload", views.upload_game),  # API for mobile app
+    path("leaderboard", views.LeaderboardView.as_view(), name="leaderboard"),
+    path("players/<int:pk>/stats", views.CareerStatsView.as_view(), name="career-stats"),
+    path("export.<str:export_format>", views.ExportView.as_view(), name="export"),
+    path("cache-stats", views.CacheStatsView.as_view(), name="cache-stats"),
+    path("async/", async_views.game_list, name="async-list"),
+    path("async/<int:pk>/", async_views.game_detail, name="async-detail"),
+    path("async/upload", async_views.upload_game, name="async-upload"),
 ] + router.urls
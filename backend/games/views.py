@@ -1,14 +1,32 @@
-from django.http import JsonResponse
+from accounts.models import CustomUser
+from django.conf import settings
+from django.db.models import Max, Prefetch
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 from django.views.generic import DetailView, ListView
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import mixins, viewsets
-from rest_framework.parsers import JSONParser
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from .cache import cache_stats, games_cache
+from .conditional import conditional_get, version_token
+from .export import EXPORT_FORMATS, EXPORT_LINES, export_queryset
 from .filters import GameFilter
-from .models import Game
-from .serializers import GameSerializer
+from .leaderboard import leaderboard
+from .models import Game, GameDeletion, GameScore, ScoreParameters
+from .pagination import GameKeysetPagination
+from .serializers import MAX_BULK_GAMES, CareerStatsSerializer, GameSerializer, LeaderboardSerializer
+from .stats import cached_career_stats
+
+JSONParser = import_string(settings.JSON_PARSER)
 
 
 class GamesViewSet(mixins.CreateModelMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
@@ -17,6 +35,164 @@ class GamesViewSet(mixins.CreateModelMixin, mixins.ListModelMixin, mixins.Retrie
     filter_backends = [DjangoFilterBackend]
     filterset_class = GameFilter
 
+    @cached_property
+    def score_parameters(self):
+        return ScoreParameters.current()
+
+    def get_queryset(self):
+        # Players and scores with the active parameters, fetched in one query each for the whole page
+        current_scores = GameScore.objects.filter(parameters=self.score_parameters)
+
+        return (
+            super()
+            .get_queryset()
+            .prefetch_related(
+                "players",
+                Prefetch("scores", queryset=current_scores, to_attr="current_scores"),
+            )
+        )
+
+    @property
+    def paginator(self):
+        """Keyset pagination with ``?pagination=cursor``, page numbers otherwise."""
+        if not hasattr(self, "_paginator"):
+            query_params = self.request.query_params
+            if "cursor" in query_params or query_params.get("pagination") == "cursor":
+                self._paginator = GameKeysetPagination()
+            else:
+                self._paginator = self.pagination_class()
+
+        return self._paginator
+
+    def list(self, request, *args, **kwargs):
+        # Version of the games, from index lookups only: an added game or any change to
+        # a game, its players or its scores changes the last modification, and a deleted
+        # game the last deletion. It covers all the games, so it is the same for any
+        # filters. Only the ETag is sent: a client with only If-Modified-Since would
+        # keep a stale list after a deletion.
+        version = {
+            "last_modified": Game.objects.aggregate(last_modified=Max("modified"))["last_modified"],
+            "last_deletion": GameDeletion.last(),
+        }
+
+        # The version is in the key too, a cache not invalidated by the process of a
+        # change (e.g. with locmem) cannot answer the new ETag with a stale list
+        return conditional_get(
+            request,
+            lambda: self.cached_response(
+                f"list:{self.score_parameters.pk}:{version_token(version)}:{request.build_absolute_uri()}",
+                lambda: super(GamesViewSet, self).list(request, *args, **kwargs),
+            ),
+            (request.get_full_path(), self.score_parameters.pk, version),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            modified = self.queryset.filter(pk=kwargs["pk"]).values_list("modified", flat=True).first()
+        except (TypeError, ValueError):
+            modified = None
+        if modified is None:
+            # Not found, answered as usual
+            return super().retrieve(request, *args, **kwargs)
+
+        return conditional_get(
+            request,
+            lambda: self.cached_response(
+                f"detail:{self.score_parameters.pk}:{kwargs['pk']}:{version_token(modified)}",
+                lambda: super(GamesViewSet, self).retrieve(request, *args, **kwargs),
+            ),
+            (kwargs["pk"], self.score_parameters.pk, modified),
+            modified,
+        )
+
+    def cached_response(self, key, response_func):
+        """Response with the data cached under ``key``, the data of ``response_func`` when it is not."""
+        data = games_cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = response_func()
+        if response.status_code == 200:
+            games_cache.set(key, response.data)
+
+        return response
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """Uploads many games at once, e.g. the games played offline during a tournament.
+
+        The games are validated like a single upload and are all inserted, or none
+        of them when one is invalid. The errors are then given per game, in the
+        order of the upload.
+        """
+        serializer = self.get_serializer(data=request.data, many=True, max_length=MAX_BULK_GAMES)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class LeaderboardView(APIView):
+    """Stats of every player over the valid games, filtered like the games list."""
+
+    def get(self, request):
+        filterset = GameFilter(request.query_params, queryset=Game.objects.filter(valid=True))
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        date_range = filterset.form.cleaned_data.get("date")
+        date_after = date_range.start if date_range else None
+        date_before = date_range.stop if date_range else None
+
+        # Games with all the selected players cannot be read from the per player totals
+        cleaned_data = filterset.form.cleaned_data
+        games = filterset.qs if cleaned_data.get("players") or cleaned_data.get("players_exact") else None
+
+        rows = leaderboard(ScoreParameters.current(), date_after, date_before, games)
+        return Response(LeaderboardSerializer(rows, many=True).data)
+
+
+class CareerStatsView(APIView):
+    """Stats of a player over all his valid games."""
+
+    def get(self, request, pk):
+        player = get_object_or_404(CustomUser, pk=pk)
+
+        return Response(CareerStatsSerializer(cached_career_stats(player.pk)).data)
+
+
+class ExportView(APIView):
+    """All the valid games, filtered like the games list, streamed as NDJSON or CSV.
+
+    The games are read by chunks and written as they are read, so an export of
+    the whole history uses as much memory as one of a few games.
+    """
+
+    def get(self, request, export_format):
+        if export_format not in EXPORT_FORMATS:
+            raise Http404
+
+        filterset = GameFilter(request.query_params, queryset=Game.objects.filter(valid=True))
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        games = export_queryset(filterset.qs, ScoreParameters.current())
+        response = StreamingHttpResponse(
+            EXPORT_LINES[export_format](games), content_type=EXPORT_FORMATS[export_format]
+        )
+        response["Content-Disposition"] = f'attachment; filename="games.{export_format}"'
+
+        return response
+
+
+class CacheStatsView(APIView):
+    """Hits and misses of the cached reads in this process, to size the cache."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(cache_stats())
+
 
 # --------------------------------------------
 # OLD API TO BE DELETED
@@ -45,7 +221,6 @@ def upload_game(request):
     serializer = GameSerializer(data=data)
     if serializer.is_valid():
         serializer.save()
-        print(serializer.data)
         return JsonResponse(serializer.data, status=201)
     return JsonResponse(serializer.errors, status=400)
 
@@ -13,4 +13,5 @@ urlpatterns = [
         name="terms-and-conditions",
     ),
     path("get-player", views.get_player),
+    path("async/get-player", views.aget_player),
 ]
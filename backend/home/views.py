@@ -1,7 +1,8 @@
 from accounts.models import CustomUser
-from django.http import HttpResponseNotFound, JsonResponse
+from django.http import HttpResponseNotAllowed, HttpResponseNotFound, JsonResponse
 from django.views.decorators.http import require_GET
 from django.views.generic import TemplateView
+from games.cache import players_cache
 
 
 class HomePageView(TemplateView):
@@ -25,14 +26,46 @@ def get_player(request):
     """View to get the player information from its username"""
     query_username = request.GET.get("username", "")
 
-    try:
-        user = CustomUser.objects.get(username=query_username)
-    except CustomUser.DoesNotExist:
+    def player_json():
+        try:
+            user = CustomUser.objects.get(username=query_username)
+        except CustomUser.DoesNotExist:
+            return None
+
+        return {
+            "id": user.pk,
+            "username": user.get_username(),
+            "full_name": user.get_full_name(),
+        }
+
+    json = players_cache.get_or_set(f"username:{query_username}", player_json)
+    if json is None:
+        return HttpResponseNotFound()
+
+    return JsonResponse(json)
+
+
+async def aget_player(request):
+    """Async version of ``get_player``"""
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    query_username = request.GET.get("username", "")
+
+    async def player_json():
+        try:
+            user = await CustomUser.objects.aget(username=query_username)
+        except CustomUser.DoesNotExist:
+            return None
+
+        return {
+            "id": user.pk,
+            "username": user.get_username(),
+            "full_name": user.get_full_name(),
+        }
+
+    json = await players_cache.aget_or_set(f"username:{query_username}", player_json)
+    if json is None:
         return HttpResponseNotFound()
 
-    json = {
-        "id": user.pk,
-        "username": user.get_username(),
-        "full_name": user.get_full_name(),
-    }
     return JsonResponse(json)
@@ -0,0 +1,118 @@
+import pytest
+from django.urls import reverse
+from games.models import GameScore
+
+
+@pytest.mark.django_db
+class TestProfilePage:
+    endpoint = "/accounts/profile/"
+
+    def test_login_required(self, client):
+        # Act
+        response = client.get(self.endpoint)
+
+        # Assert
+        assert response.status_code == 302
+
+    def test_exact_membership(self, client, game_factory, custom_user_factory):
+        # Arrange
+        user = custom_user_factory(username="bob")
+        # Other users whose username contains the one of the user
+        others = [custom_user_factory(username="bobby"), custom_user_factory(username="jimbob")]
+        game = game_factory.create(players=[user, others[0]])
+        game_factory.create(players=others)
+        client.force_login(user)
+
+        # Act
+        response = client.get(self.endpoint)
+
+        # Assert
+        assert response.status_code == 200
+        assert list(response.context["games"]) == [game]
+
+    def test_paginated(self, client, game_factory, custom_user_factory):
+        # Arrange
+        user = custom_user_factory()
+        for _ in range(15):
+            game_factory.create(players=[user, custom_user_factory()])
+        client.force_login(user)
+
+        # Act
+        first_page = client.get(self.endpoint)
+        second_page = client.get(self.endpoint, {"page": 2})
+
+        # Assert
+        assert len(first_page.context["games"]) == 12
+        assert len(second_page.context["games"]) == 3
+        assert not set(first_page.context["games"]) & set(second_page.context["games"])
+
+    def test_summary(self, client, game_factory, custom_user_factory):
+        # Arrange
+        user = custom_user_factory()
+        for _ in range(3):
+            game_factory.create(players=[user, custom_user_factory()])
+        client.force_login(user)
+
+        # Act
+        response = client.get(self.endpoint)
+
+        # Assert
+        stats = response.context["stats"]
+        assert stats["games_played"] == 3
+        assert stats["points"] == sum(score.points for score in GameScore.objects.filter(player=user))
+        assert stats["average_points"] == stats["points"] / 3
+
+    def test_no_games(self, client, custom_user_factory):
+        # Arrange
+        client.force_login(custom_user_factory())
+
+        # Act
+        response = client.get(self.endpoint)
+
+        # Assert
+        assert response.context["stats"]["games_played"] == 0
+        assert response.context["stats"]["average_points"] == 0
+
+    def test_game_links(self, client, game_factory, custom_user_factory):
+        # Arrange
+        user = custom_user_factory()
+        game = game_factory.create(players=[user, custom_user_factory()])
+        client.force_login(user)
+
+        # Act
+        response = client.get(self.endpoint)
+        detail = client.get(reverse("games:detail", args=[game.pk]))
+
+        # Assert, the HTML page of the game and not its API endpoint
+        assert reverse("games:detail", args=[game.pk]).encode() in response.content
+        assert reverse("games:game-detail", args=[game.pk]).encode() + b'"' not in response.content
+        assert detail.status_code == 200
+
+    def test_all_games_link(self, client, game_factory, custom_user_factory):
+        # Arrange
+        user = custom_user_factory()
+        game_factory.create(players=[user, custom_user_factory()])
+        client.force_login(user)
+
+        # Act
+        response = client.get(self.endpoint)
+        all_games = client.get(reverse("games:all"))
+
+        # Assert, in the navbar
+        assert reverse("games:all").encode() in response.content
+        assert all_games.status_code == 200
+
+    def test_queries_do_not_depend_on_number_of_games(
+        self, client, game_factory, custom_user_factory, django_assert_max_num_queries
+    ):
+        # Arrange
+        user = custom_user_factory()
+        for _ in range(30):
+            game_factory.create(players=[user, custom_user_factory()])
+        client.force_login(user)
+        client.get(self.endpoint)
+
+        # Act / Assert
+        # Session, user, score parameters, daily stats, count, page and players
+        with django_assert_max_num_queries(7):
+            client.get(self.endpoint)
@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import cache
 from pytest_factoryboy import register
 from rest_framework.test import APIClient
 
@@ -11,3 +12,8 @@ register(CustomUserFactory)
 @pytest.fixture
 def api_client():
     return APIClient
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
@@ -1,9 +1,11 @@
+import datetime
 import random
 
 import factory
 from accounts.models import CustomUser
 from django.utils import timezone
 from games.models import Game
+from games.seeding import seed_games, seed_users
 
 
 class CustomUserFactory(factory.django.DjangoModelFactory):
@@ -31,6 +33,7 @@ class GameFactory(factory.django.DjangoModelFactory):
             return
 
         # Add the iterable of new_players using bulk addition
+        new_players = list(new_players)
         self.players.add(*new_players)
 
         # build the transitions here, havent found a better way
@@ -40,8 +43,23 @@ class GameFactory(factory.django.DjangoModelFactory):
 
         self.transitions = [
             {
-                "player": random.choice(self.players.all()).pk,
+                "player": random.choice(new_players).pk,
                 "duration": duration if duration else random.randint(1, 100),
             }
             for _ in range(10)
         ]
+
+
+# Players of the games added by seed_test_games
+NB_PLAYERS = 6
+
+
+def seed_test_games(count: int, seed=0) -> list[int]:
+    """Adds ``count`` games of random players with ``games.seeding``, an hour apart from
+    2023-01-01, returns the pks of the players."""
+    players_pks = seed_users(NB_PLAYERS, f"seeded{seed}-")
+    start = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    for _ in seed_games(count, players_pks, start, days=count / 24, seed=seed):
+        pass
+
+    return players_pks
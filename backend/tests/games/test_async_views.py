@@ -0,0 +1,157 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+from games.models import Game
+
+
+def json(response):
+    """Content of a response, with the links of the async views as the sync ones."""
+    return response.content.decode().replace("/games/async/", "/games/")
+
+
+@pytest.fixture
+def games(game_factory, custom_user_factory):
+    players = [custom_user_factory() for _ in range(4)]
+    for i in range(25):
+        date = timezone.make_aware(datetime.datetime(2023, 8, 1 + i % 20, 12))
+        game_factory.create(players=players[i % 3 : i % 3 + 2], date=date)
+
+    return players
+
+
+@pytest.mark.django_db
+class TestAsyncList:
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {},
+            {"page": 2},
+            {"page": 9},
+            {"page": "last"},
+            {"players": [1, 2]},
+            {"players_exact": [2, 3]},
+            {"players": [999]},
+            {"date_after": "2023-08-05T00:00:00Z", "date_before": "2023-08-10T00:00:00Z"},
+            {"pagination": "cursor"},
+            {"cursor": "invalid"},
+        ],
+    )
+    def test_same_as_sync(self, params, games, client):
+        # Act
+        sync_response = client.get("/games/", params)
+        async_response = client.get("/games/async/", params)
+
+        # Assert
+        assert async_response.status_code == sync_response.status_code
+        assert json(async_response) == sync_response.content.decode()
+
+    def test_cursor_pages(self, games, client):
+        # Arrange
+        sync_page = client.get("/games/", {"pagination": "cursor"}).json()
+        async_page = client.get("/games/async/", {"pagination": "cursor"}).json()
+
+        # Act
+        sync_response = client.get(sync_page["next"])
+        async_response = client.get(async_page["next"])
+
+        # Assert
+        assert json(async_response) == sync_response.content.decode()
+
+    def test_not_modified(self, games, client):
+        # Arrange
+        etag = client.get("/games/async/")["ETag"]
+
+        # Act
+        response = client.get("/games/async/", HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 304
+
+    def test_method_not_allowed(self, client):
+        # Act
+        response = client.post("/games/async/")
+
+        # Assert
+        assert response.status_code == 405
+
+
+@pytest.mark.django_db
+class TestAsyncDetail:
+    def test_same_as_sync(self, games, client):
+        # Arrange
+        game = Game.objects.first()
+
+        # Act
+        sync_response = client.get(f"/games/{game.pk}/")
+        async_response = client.get(f"/games/async/{game.pk}/")
+
+        # Assert
+        assert async_response.status_code == 200
+        assert async_response.content == sync_response.content
+        assert async_response["ETag"] == sync_response["ETag"]
+
+    def test_not_found(self, client):
+        # Act
+        sync_response = client.get("/games/999/")
+        async_response = client.get("/games/async/999/")
+
+        # Assert
+        assert async_response.status_code == 404
+        assert async_response.content == sync_response.content
+
+
+@pytest.mark.django_db
+class TestAsyncUpload:
+    def test_same_as_sync(self, custom_user_factory, client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        transitions = [{"player": players[i % 2].pk, "duration": 10 + i} for i in range(5)]
+        data = {"players": [player.pk for player in players], "transitions": transitions}
+
+        # Act
+        sync_response = client.post("/games/upload", data, content_type="application/json")
+        async_response = client.post("/games/async/upload", data, content_type="application/json")
+
+        # Assert
+        assert async_response.status_code == sync_response.status_code == 201
+        sync_game, async_game = sync_response.json(), async_response.json()
+        assert async_game.pop("date") > sync_game.pop("date")
+        assert async_game == sync_game
+        assert Game.objects.count() == 2
+
+    def test_invalid(self, custom_user_factory, client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        data = {"players": [players[0].pk], "transitions": [{"player": players[1].pk, "duration": 1}]}
+
+        # Act
+        sync_response = client.post("/games/upload", data, content_type="application/json")
+        async_response = client.post("/games/async/upload", data, content_type="application/json")
+
+        # Assert
+        assert async_response.status_code == 400
+        assert async_response.content == sync_response.content
+        assert Game.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestAsyncGetPlayer:
+    def test_same_as_sync(self, custom_user_factory, client):
+        # Arrange
+        player = custom_user_factory()
+
+        # Act
+        sync_response = client.get("/get-player", {"username": player.username})
+        async_response = client.get("/async/get-player", {"username": player.username})
+
+        # Assert
+        assert async_response.status_code == 200
+        assert async_response.content == sync_response.content
+
+    def test_not_found(self, client):
+        # Act
+        response = client.get("/async/get-player", {"username": "nobody"})
+
+        # Assert
+        assert response.status_code == 404
@@ -0,0 +1,121 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from games.leaderboard import leaderboard
+from games.models import DailyPlayerStats, Game, GameScore, ScoreParameters, roster_key
+from games.serializers import MAX_BULK_GAMES
+
+
+def game_data(players, durations=(10, 20, 30)):
+    transitions = [{"player": players[i % len(players)].pk, "duration": d} for i, d in enumerate(durations)]
+    return {"players": [player.pk for player in players], "transitions": transitions}
+
+
+@pytest.mark.django_db
+class TestBulkUpload:
+    endpoint = "/games/bulk/"
+
+    def test_upload(self, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(3)]
+        data = [game_data(players), game_data(players[:2], (5, 50)), game_data(players[1:], (1,))]
+
+        # Act
+        response = api_client().post(self.endpoint, data, format="json")
+
+        # Assert
+        assert response.status_code == 201
+        assert [game["players"] for game in response.json()] == [game["players"] for game in data]
+        assert Game.objects.count() == 3
+        assert GameScore.objects.count() == 7
+        assert sorted(Game.objects.values_list("roster", flat=True)) == sorted(
+            roster_key(game["players"]) for game in data
+        )
+        assert all(len(game["scores"]) == len(game["players"]) for game in response.json())
+
+    def test_same_as_single_uploads(self, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(3)]
+        data = [game_data(players), game_data(players[:2], (5, 50))]
+        client = api_client()
+
+        # Act
+        single = [client.post("/games/", game, format="json").json() for game in data]
+        single_leaderboard = leaderboard(ScoreParameters.current())
+        Game.objects.all().delete()
+        DailyPlayerStats.objects.all().delete()
+        bulk = client.post(self.endpoint, data, format="json").json()
+
+        # Assert
+        assert [game["scores"] for game in bulk] == [game["scores"] for game in single]
+        assert leaderboard(ScoreParameters.current()) == single_leaderboard
+
+    def test_errors_per_game(self, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        other = custom_user_factory()
+        invalid_transitions = game_data(players)
+        invalid_transitions["transitions"][0]["player"] = other.pk
+        data = [game_data(players), {"players": [999], "transitions": []}, invalid_transitions]
+
+        # Act
+        response = api_client().post(self.endpoint, data, format="json")
+
+        # Assert
+        assert response.status_code == 400
+        errors = response.json()
+        assert errors[0] == {}
+        assert set(errors[1]) == {"players", "transitions"}
+        assert "non_field_errors" in errors[2]
+        assert Game.objects.count() == 0
+
+    def test_invalid_durations(self, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        data = [game_data(players), game_data(players, durations=(0, 0)), game_data(players, durations=(10, "a"))]
+
+        # Act
+        response = api_client().post(self.endpoint, data, format="json")
+
+        # Assert
+        assert response.status_code == 400
+        errors = response.json()
+        assert errors[0] == {}
+        assert "transitions" in errors[1]
+        assert "transitions" in errors[2]
+        assert Game.objects.count() == 0
+
+    def test_not_a_list(self, api_client):
+        # Act
+        response = api_client().post(self.endpoint, {"players": [1]}, format="json")
+
+        # Assert
+        assert response.status_code == 400
+        assert "non_field_errors" in response.json()
+
+    def test_too_many_games(self, custom_user_factory, api_client):
+        # Arrange
+        data = [game_data([custom_user_factory()])] * (MAX_BULK_GAMES + 1)
+
+        # Act
+        response = api_client().post(self.endpoint, data, format="json")
+
+        # Assert
+        assert response.status_code == 400
+        assert Game.objects.count() == 0
+
+    def test_queries_do_not_depend_on_number_of_games(self, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(4)]
+        data = [game_data(players[i % 3 : i % 3 + 2]) for i in range(30)]
+        client = api_client()
+
+        # Act
+        with CaptureQueriesContext(connection) as few_games:
+            client.post(self.endpoint, data[:3], format="json")
+        with CaptureQueriesContext(connection) as many_games:
+            client.post(self.endpoint, data, format="json")
+
+        # Assert
+        assert Game.objects.count() == 33
+        assert len(many_games) <= len(few_games)
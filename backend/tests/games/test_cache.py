@@ -0,0 +1,208 @@
+import pytest
+from django.core.cache import caches
+from django.utils.timezone import now
+from games.cache import cache_stats, reset_cache_stats
+from games.models import Game
+
+
+@pytest.fixture
+def stats():
+    reset_cache_stats()
+    return cache_stats
+
+
+@pytest.mark.django_db
+class TestGamesCache:
+    endpoint = "/games/"
+
+    def test_list_cached(self, game_factory, custom_user_factory, api_client, stats, django_assert_max_num_queries):
+        # Arrange
+        game_factory.create(players=[custom_user_factory() for _ in range(2)])
+        client = api_client()
+        first = client.get(self.endpoint)
+
+        # Act
+        # Only the score parameters and the version of the games
+        with django_assert_max_num_queries(3):
+            second = client.get(self.endpoint)
+
+        # Assert
+        assert second.json() == first.json()
+        assert stats()["games"] == {"hits": 1, "misses": 1}
+
+    @pytest.mark.parametrize("endpoint", ["/games/", "/games/async/"])
+    def test_change_not_invalidated(self, endpoint, game_factory, custom_user_factory, api_client, stats):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        game_factory.create(players=players)
+        game = game_factory.create(players=players)
+        client = api_client()
+        client.get(endpoint)
+        client.get(f"{endpoint}{game.pk}/")
+
+        # Act, without the signals, as from another process with a local cache
+        Game.objects.filter(pk=game.pk).update(transitions=[{"player": players[0].pk, "duration": 1}], modified=now())
+        Game.objects.exclude(pk=game.pk).update(valid=False, modified=now())
+
+        # Assert, the new version is not answered with the cached data
+        assert client.get(endpoint).json()["count"] == 1
+        assert client.get(f"{endpoint}{game.pk}/").json()["transitions"] == [{"player": players[0].pk, "duration": 1}]
+
+    def test_detail_cached(self, game_factory, custom_user_factory, api_client, stats):
+        # Arrange
+        game = game_factory.create(players=[custom_user_factory() for _ in range(2)])
+        client = api_client()
+
+        # Act
+        first = client.get(f"/games/{game.pk}/")
+        second = client.get(f"/games/{game.pk}/")
+
+        # Assert
+        assert second.json() == first.json()
+        assert stats()["games"] == {"hits": 1, "misses": 1}
+
+    def test_invalidated_by_new_game(self, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        data = {"players": [player.pk for player in players], "transitions": [{"player": players[0].pk, "duration": 1}]}
+        client = api_client()
+        client.post(self.endpoint, data, format="json")
+        client.get(self.endpoint)
+
+        # Act
+        client.post(self.endpoint, data, format="json")
+        client.post(f"{self.endpoint}bulk/", [data], format="json")
+
+        # Assert
+        assert client.get(self.endpoint).json()["count"] == 3
+
+    def test_invalidated_by_players(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(3)]
+        game = game_factory.create(players=players[:2])
+        client = api_client()
+        client.get(f"/games/{game.pk}/")
+
+        # Act
+        game.players.add(players[2])
+
+        # Assert
+        assert len(client.get(f"/games/{game.pk}/").json()["players"]) == 3
+
+    def test_invalidated_by_deletion(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        game = game_factory.create(players=players)
+        game_factory.create(players=players)
+        client = api_client()
+        client.get(self.endpoint)
+
+        # Act
+        game.delete()
+
+        # Assert
+        assert client.get(self.endpoint).json()["count"] == 1
+
+    def test_invalidated_by_scores(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        game = game_factory.create(players=players)
+        client = api_client()
+        client.get(f"/games/{game.pk}/")
+
+        # Act, the game is scored again
+        game.transitions = [{"player": players[0].pk, "duration": 60}]
+        game.save()
+
+        # Assert
+        scores = {score["player"]: score["winner"] for score in client.get(f"/games/{game.pk}/").json()["scores"]}
+        assert scores == {players[0].pk: True, players[1].pk: False}
+
+    def test_file_backend(self, game_factory, custom_user_factory, api_client, settings, tmp_path, stats):
+        # Arrange
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": str(tmp_path)}
+        }
+        game_factory.create(players=[custom_user_factory() for _ in range(2)])
+        client = api_client()
+
+        # Act
+        first = client.get(self.endpoint)
+        second = client.get(self.endpoint)
+
+        # Assert
+        assert second.json() == first.json()
+        assert stats()["games"]["hits"] == 1
+        assert any(tmp_path.iterdir())
+        caches["default"].clear()
+
+
+@pytest.mark.django_db
+class TestPlayersCache:
+    endpoint = "/get-player"
+
+    def test_cached(self, custom_user_factory, api_client, stats, django_assert_num_queries):
+        # Arrange
+        player = custom_user_factory()
+        client = api_client()
+        client.get(self.endpoint, {"username": player.username})
+
+        # Act
+        with django_assert_num_queries(0):
+            response = client.get(self.endpoint, {"username": player.username})
+
+        # Assert
+        assert response.json()["id"] == player.pk
+        assert stats()["players"] == {"hits": 1, "misses": 1}
+
+    def test_invalidated_by_save(self, custom_user_factory, api_client):
+        # Arrange
+        player = custom_user_factory()
+        client = api_client()
+        client.get(self.endpoint, {"username": player.username})
+
+        # Act
+        player.first_name = "Roberta"
+        player.save()
+
+        # Assert
+        response = client.get(self.endpoint, {"username": player.username})
+        assert response.json()["full_name"] == "Roberta Ravioli"
+
+    def test_unknown_player(self, api_client):
+        # Act
+        response = api_client().get(self.endpoint, {"username": "nobody"})
+
+        # Assert
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestCacheStats:
+    endpoint = "/games/cache-stats"
+
+    def test_admin_only(self, custom_user_factory, api_client):
+        # Arrange
+        client = api_client()
+        client.force_authenticate(custom_user_factory())
+
+        # Act
+        response = client.get(self.endpoint)
+
+        # Assert
+        assert response.status_code == 403
+
+    def test_stats(self, custom_user_factory, api_client, stats):
+        # Arrange
+        client = api_client()
+        client.force_authenticate(custom_user_factory(is_staff=True))
+
+        # Act
+        response = client.get(self.endpoint)
+
+        # Assert
+        assert response.json() == {
+            "games": {"hits": 0, "misses": 0},
+            "players": {"hits": 0, "misses": 0},
+            "career-stats": {"hits": 0, "misses": 0},
+        }
@@ -0,0 +1,147 @@
+import pytest
+from games.cache import cache_stats, reset_cache_stats
+from games.models import Game, GameScore
+
+
+def stats_url(player):
+    return f"/games/players/{player.pk}/stats"
+
+
+def scored_game(players, transitions):
+    game = Game.objects.create(transitions=[{"player": players[i].pk, "duration": d} for i, d in transitions])
+    game.players.set(players)
+    return game
+
+
+@pytest.mark.django_db
+class TestCareerStats:
+    def test_stats(self, custom_user_factory, api_client):
+        # Arrange
+        player1, player2 = [custom_user_factory() for _ in range(2)]
+        scored_game([player1, player2], [(0, 10), (1, 20), (0, 30)])
+        scored_game([player1, player2], [(1, 50), (0, 5)])
+        invalid_game = scored_game([player1, player2], [(0, 100)])
+        invalid_game.valid = False
+        invalid_game.save()
+
+        # Act
+        response = api_client().get(stats_url(player1))
+
+        # Assert
+        assert response.status_code == 200
+        points = GameScore.objects.filter(player=player1, game__valid=True).values_list("points", flat=True)
+        assert response.json() == {
+            "player": player1.pk,
+            "games_played": 2,
+            "wins": 1,
+            "total_reign_time": 45,
+            "longest_reign_time": 30,
+            "crowns_claimed": 2,
+            "average_points": sum(points) / 2,
+        }
+
+    def test_no_games(self, custom_user_factory, api_client):
+        # Arrange
+        player = custom_user_factory()
+
+        # Act
+        response = api_client().get(stats_url(player))
+
+        # Assert
+        assert response.json()["games_played"] == 0
+        assert response.json()["average_points"] == 0
+
+    def test_unknown_player(self, api_client):
+        # Act
+        response = api_client().get("/games/players/999/stats")
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_cached(self, custom_user_factory, api_client, django_assert_max_num_queries):
+        # Arrange
+        player1, player2 = [custom_user_factory() for _ in range(2)]
+        scored_game([player1, player2], [(0, 10), (1, 20)])
+        client = api_client()
+        client.get(stats_url(player1))
+
+        reset_cache_stats()
+
+        # Act / Assert
+        # Only the player and the score parameters
+        with django_assert_max_num_queries(2):
+            client.get(stats_url(player1))
+        assert cache_stats()["career-stats"] == {"hits": 1, "misses": 0}
+
+    def test_invalidated_by_new_game(self, custom_user_factory, api_client):
+        # Arrange
+        player1, player2 = [custom_user_factory() for _ in range(2)]
+        scored_game([player1, player2], [(0, 10), (1, 20)])
+        client = api_client()
+        client.get(stats_url(player1))
+
+        # Act
+        data = {"players": [player1.pk, player2.pk], "transitions": [{"player": player1.pk, "duration": 40}]}
+        client.post("/games/", data, format="json")
+        response = client.get(stats_url(player1))
+
+        # Assert
+        assert response.json()["games_played"] == 2
+        assert response.json()["longest_reign_time"] == 40
+
+    def test_invalidated_by_bulk_upload(self, custom_user_factory, api_client):
+        # Arrange
+        player1, player2 = [custom_user_factory() for _ in range(2)]
+        client = api_client()
+        client.get(stats_url(player1))
+
+        # Act
+        data = {"players": [player1.pk, player2.pk], "transitions": [{"player": player1.pk, "duration": 40}]}
+        client.post("/games/bulk/", [data, data], format="json")
+        response = client.get(stats_url(player1))
+
+        # Assert
+        assert response.json()["games_played"] == 2
+
+    def test_invalidated_by_validity(self, custom_user_factory, api_client):
+        # Arrange
+        player1, player2 = [custom_user_factory() for _ in range(2)]
+        game = scored_game([player1, player2], [(0, 10), (1, 20)])
+        client = api_client()
+        client.get(stats_url(player1))
+
+        # Act
+        game.valid = False
+        game.save()
+        response = client.get(stats_url(player1))
+
+        # Assert
+        assert response.json()["games_played"] == 0
+
+    def test_invalidated_by_deletion(self, custom_user_factory, api_client):
+        # Arrange
+        player1, player2 = [custom_user_factory() for _ in range(2)]
+        game = scored_game([player1, player2], [(0, 10), (1, 20)])
+        client = api_client()
+        client.get(stats_url(player1))
+
+        # Act
+        game.delete()
+        response = client.get(stats_url(player1))
+
+        # Assert
+        assert response.json()["games_played"] == 0
+
+    def test_other_players_kept(self, custom_user_factory, api_client, django_assert_max_num_queries):
+        # Arrange
+        player1, player2, player3 = [custom_user_factory() for _ in range(3)]
+        scored_game([player1, player2], [(0, 10), (1, 20)])
+        client = api_client()
+        client.get(stats_url(player1))
+
+        # Act
+        scored_game([player2, player3], [(0, 10), (1, 20)])
+
+        # Assert
+        with django_assert_max_num_queries(2):
+            client.get(stats_url(player1))
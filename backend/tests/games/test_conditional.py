@@ -0,0 +1,200 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from games.models import Game
+
+
+@pytest.mark.django_db
+class TestConditionalList:
+    endpoint = "/games/"
+
+    def test_not_modified(self, game_factory, custom_user_factory, api_client, django_assert_max_num_queries):
+        # Arrange
+        game_factory.create(players=[custom_user_factory() for _ in range(2)])
+        client = api_client()
+        etag = client.get(self.endpoint)["ETag"]
+
+        # Act
+        # Only the score parameters and the version of the games
+        with django_assert_max_num_queries(3):
+            response = client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert not response.content
+
+    def test_new_game(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        game_factory.create(players=players)
+        client = api_client()
+        etag = client.get(self.endpoint)["ETag"]
+
+        # Act
+        game_factory.create(players=players)
+        response = client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response.json()["count"] == 2
+
+    def test_invalidated_game(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        first_game = game_factory.create(players=players)
+        game_factory.create(players=players)
+        client = api_client()
+        response = client.get(self.endpoint)
+
+        # Act
+        first_game.valid = False
+        first_game.save()
+
+        # Assert
+        assert client.get(self.endpoint, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 200
+
+    def test_filters_and_pages(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        game_factory.create(players=players)
+        client = api_client()
+        etag = client.get(self.endpoint)["ETag"]
+
+        # Act
+        response = client.get(self.endpoint, {"players": players[0].pk}, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_deleted_game(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        first_game = game_factory.create(players=players)
+        game_factory.create(players=players)
+        client = api_client()
+        etag = client.get(self.endpoint)["ETag"]
+
+        # Act
+        first_game.delete()
+        response = client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["count"] == 1
+
+    @pytest.mark.parametrize("endpoint", ["/games/", "/games/async/"])
+    def test_deleted_games_queryset(self, endpoint, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        games = [game_factory.create(players=players) for _ in range(3)]
+        client = api_client()
+        etag = client.get(endpoint)["ETag"]
+
+        # Act, the last game is left so the last modification is the same
+        Game.objects.filter(pk__in=[games[0].pk, games[1].pk]).delete()
+        response = client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["count"] == 1
+
+    @pytest.mark.parametrize("endpoint", ["/games/", "/games/async/"])
+    def test_not_modified_without_count(self, endpoint, game_factory, custom_user_factory, api_client):
+        # Arrange
+        game_factory.create(players=[custom_user_factory() for _ in range(2)])
+        client = api_client()
+        etag = client.get(endpoint)["ETag"]
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(endpoint, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert, the version does not scan the games
+        assert response.status_code == 304
+        assert not any("COUNT(" in query["sql"] for query in queries.captured_queries)
+
+    @pytest.mark.parametrize("endpoint", ["/games/", "/games/async/"])
+    def test_only_etag(self, endpoint, game_factory, custom_user_factory, api_client):
+        # Arrange, the last modification of the games does not change when one is deleted
+        game_factory.create(players=[custom_user_factory() for _ in range(2)])
+
+        # Act
+        response = api_client().get(endpoint, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+
+        # Assert
+        assert response.status_code == 200
+        assert "ETag" in response
+        assert "Last-Modified" not in response
+
+
+@pytest.mark.django_db
+class TestConditionalRetrieve:
+    def test_not_modified(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        game = game_factory.create(players=[custom_user_factory() for _ in range(2)])
+        client = api_client()
+        etag = client.get(f"/games/{game.pk}/")["ETag"]
+
+        # Act
+        response = client.get(f"/games/{game.pk}/", HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 304
+
+    def test_changed_transitions(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        game = game_factory.create(players=players)
+        client = api_client()
+        etag = client.get(f"/games/{game.pk}/")["ETag"]
+
+        # Act
+        game.transitions = [{"player": players[0].pk, "duration": 5}]
+        game.save()
+        response = client.get(f"/games/{game.pk}/", HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["transitions"] == game.transitions
+
+    def test_changed_players(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(3)]
+        game = game_factory.create(players=players[:2])
+        Game.objects.filter(pk=game.pk).update(modified=game.modified - datetime.timedelta(seconds=1))
+        client = api_client()
+        etag = client.get(f"/games/{game.pk}/")["ETag"]
+
+        # Act
+        game.players.add(players[2])
+        response = client.get(f"/games/{game.pk}/", HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        assert response.status_code == 200
+        assert len(response.json()["players"]) == 3
+
+    @pytest.mark.parametrize("pk", ["999", "abc"])
+    def test_not_found(self, pk, api_client):
+        # Act
+        response = api_client().get(f"/games/{pk}/")
+
+        # Assert
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_bulk_upload_sets_modified(custom_user_factory, api_client):
+    # Arrange
+    players = [custom_user_factory() for _ in range(2)]
+    data = {"players": [player.pk for player in players], "transitions": [{"player": players[0].pk, "duration": 1}]}
+
+    # Act
+    api_client().post("/games/bulk/", [data], format="json")
+
+    # Assert
+    assert Game.objects.get().modified is not None
@@ -109,6 +109,48 @@ class TestGameEndpoints:
         # Assert
         assert response.status_code == 400
 
+    @pytest.mark.parametrize(
+        "durations",
+        [[0, 0], [10, None], [10, "10"], [10, 1.5], [10, -1], [10, True]],
+        ids=["no-duration", "missing", "string", "float", "negative", "bool"],
+    )
+    def test_post_invalid_durations(self, durations, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory().pk for _ in range(2)]
+        transitions = [{"player": player, "duration": duration} for player, duration in zip(players, durations)]
+        for transition in transitions:
+            if transition["duration"] is None:
+                del transition["duration"]
+
+        data = {"players": players, "transitions": transitions}
+
+        # Act
+        response = api_client().post(self.endpoint, data, format="json")
+
+        # Assert
+        assert response.status_code == 400
+        assert "transitions" in response.json()
+
+    def test_post_zero_duration_transition(self, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory().pk for _ in range(2)]
+        transitions = [{"player": players[0], "duration": 0}, {"player": players[1], "duration": 10}]
+
+        # Act
+        response = api_client().post(self.endpoint, {"players": players, "transitions": transitions}, format="json")
+
+        # Assert
+        assert response.status_code == 201
+
+    @pytest.mark.parametrize("transition", [1, {"duration": 10}, {"player": [1], "duration": 10}])
+    def test_post_invalid_transition(self, transition, api_client):
+        # Act
+        response = api_client().post(self.endpoint, {"players": [1], "transitions": [transition]}, format="json")
+
+        # Assert
+        assert response.status_code == 400
+        assert "transitions" in response.json()
+
     def test_post_transition_with_unkown_player(self, custom_user_factory, api_client):
         # Arrange
         players = [custom_user_factory() for _ in range(3)]
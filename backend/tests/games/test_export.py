@@ -0,0 +1,104 @@
+import csv
+import datetime
+import io
+import json
+
+import pytest
+from django.utils import timezone
+from games import export
+from games.export import CSV_HEADER
+from games.models import Game
+
+
+def content(response) -> str:
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.fixture
+def games(game_factory, custom_user_factory):
+    players = [custom_user_factory() for _ in range(3)]
+    games = []
+    for i in range(5):
+        date = timezone.make_aware(datetime.datetime(2023, 8, 1 + i, 12))
+        games.append(game_factory.create(players=players[i % 2 : i % 2 + 2], date=date))
+
+    return games
+
+
+@pytest.mark.django_db
+class TestExport:
+    def test_ndjson(self, games, api_client):
+        # Act
+        response = api_client().get("/games/export.ndjson")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+
+        rows = [json.loads(line) for line in content(response).splitlines()]
+        assert [row["id"] for row in rows] == [game.pk for game in games]
+        for row, game in zip(rows, games):
+            detail = api_client().get(f"/games/{game.pk}/").json()
+            assert row["players"] == sorted(detail["players"])
+            assert row["transitions"] == detail["transitions"]
+            assert row["date"] == detail["date"]
+            assert row["scores"] == detail["scores"]
+
+    def test_csv(self, games, api_client):
+        # Act
+        response = api_client().get("/games/export.csv")
+
+        # Assert
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/csv"
+
+        header, *rows = csv.reader(io.StringIO(content(response)))
+        assert header == CSV_HEADER
+        assert len(rows) == sum(len(game.transitions) for game in games)
+
+        first_game = games[0]
+        first_rows = [row for row in rows if row[0] == str(first_game.pk)]
+        assert [(int(row[4]), int(row[5])) for row in first_rows] == [
+            (transition["player"], transition["duration"]) for transition in first_game.transitions
+        ]
+        assert first_rows[0][2] == " ".join(str(player.pk) for player in first_game.players.order_by("pk"))
+
+    def test_filters(self, games, api_client):
+        # Arrange
+        player = games[0].players.order_by("pk").first()
+        params = {"players": player.pk, "date_after": "2023-08-02T00:00:00Z"}
+        expected = Game.objects.filter(players=player, date__gte="2023-08-02T00:00:00Z").order_by("date")
+
+        # Act
+        response = api_client().get("/games/export.ndjson", params)
+
+        # Assert
+        rows = [json.loads(line) for line in content(response).splitlines()]
+        assert [row["id"] for row in rows] == [game.pk for game in expected]
+
+    def test_invalid_filter(self, api_client):
+        # Act
+        response = api_client().get("/games/export.ndjson", {"players": 999})
+
+        # Assert
+        assert response.status_code == 400
+
+    def test_unknown_format(self, api_client):
+        # Act
+        response = api_client().get("/games/export.xml")
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_queries_by_chunk(self, games, api_client, django_assert_num_queries, monkeypatch):
+        # Arrange, one chunk per game
+        monkeypatch.setattr(export, "EXPORT_CHUNK_SIZE", 1)
+
+        # Act, the games are read in one query, then the scores once per chunk
+        response = api_client().get("/games/export.ndjson")
+        with django_assert_num_queries(1 + len(games)):
+            lines = content(response).splitlines()
+
+        # Assert
+        assert len(lines) == len(games)
@@ -0,0 +1,162 @@
+import datetime
+import decimal
+import io
+import uuid
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from games.models import Game
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+pytest.importorskip("orjson")
+
+from games.fastjson import FastJSONParser, FastJSONRenderer  # noqa: E402
+
+
+def render(data, accepted_media_type=None):
+    """Data rendered by the DRF renderer and by the fast one."""
+    return (
+        JSONRenderer().render(data, accepted_media_type, {}),
+        FastJSONRenderer().render(data, accepted_media_type, {}),
+    )
+
+
+def parse(content: bytes):
+    return FastJSONParser().parse(io.BytesIO(content))
+
+
+@pytest.fixture
+def games(game_factory, custom_user_factory):
+    players = [custom_user_factory() for _ in range(3)]
+    for i in range(5):
+        game_factory.create(players=players[: 2 + i % 2])
+
+    return players
+
+
+@pytest.mark.django_db
+class TestFastJSONRenderer:
+    @pytest.mark.parametrize(
+        "endpoint",
+        ["/games/", "/games/?pagination=cursor", "/games/leaderboard", "/games/?players=999"],
+    )
+    def test_same_bytes_as_drf(self, endpoint, games, api_client):
+        # Act
+        response = api_client().get(endpoint)
+
+        # Assert
+        drf, fast = render(response.data)
+        assert fast == drf
+        assert response.content == drf
+
+    def test_same_bytes_for_detail_and_stats(self, games, api_client):
+        # Arrange
+        game_pk = Game.objects.first().pk
+
+        # Act
+        responses = [
+            api_client().get(f"/games/{game_pk}/"),
+            api_client().get(f"/games/players/{games[0].pk}/stats"),
+        ]
+
+        # Assert
+        for response in responses:
+            drf, fast = render(response.data)
+            assert fast == drf
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"date": timezone.make_aware(datetime.datetime(2023, 8, 1, 12, 30, 15, 123456))},
+            {"date": datetime.datetime(2023, 8, 1, 12, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))},
+            {"day": datetime.date(2023, 8, 1), "time": datetime.time(12, 30), "delta": datetime.timedelta(hours=1)},
+            {"decimal": decimal.Decimal("1.5"), "uuid": uuid.UUID(int=1)},
+            {"floats": [0.1, 1.5, 2 / 3, 1e15, -0.0], "ints": [0, -1, 2**63 - 1]},
+            {"small": [1e-05, -1e-05, 1.5e-07, 1e-300, 0.0001, 0.00012]},
+            {"large": [2e16, 1e16, -1.5e300, 9.9e15, 1.2345678901234568e17]},
+            {"nested": [{"a": "1e5 0.0000 null", "b": [1e-5]}]},
+            {"big": 2**70},
+            {"text": "é ü     \" \\ \n \t \x00 🏓"},
+            {"lazy": gettext_lazy("Not found.")},
+            {"set": {1}, "tuple": (1, 2)},
+        ],
+    )
+    def test_same_bytes_for_values(self, data):
+        # Act
+        drf, fast = render(data)
+
+        # Assert
+        assert fast == drf
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"nan": float("nan")},
+            {"floats": [1.5, float("inf")]},
+            {"nested": [{"a": None, "b": (-float("inf"),)}]},
+            {"date": datetime.datetime(2023, 8, 1), "previous": None, "results": [{"nan": float("nan")}]},
+        ],
+    )
+    def test_non_finite_floats_as_drf(self, data):
+        # Act
+        with pytest.raises(ValueError) as fast_error:
+            FastJSONRenderer().render(data)
+        with pytest.raises(ValueError) as drf_error:
+            JSONRenderer().render(data)
+
+        # Assert
+        assert str(fast_error.value) == str(drf_error.value)
+
+    def test_non_finite_floats_not_strict(self, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(JSONRenderer, "strict", False)
+
+        # Act
+        drf, fast = render({"nan": float("nan"), "inf": [float("inf")], "none": None})
+
+        # Assert
+        assert fast == drf
+        assert b"NaN" in fast
+
+    def test_indent(self):
+        # Act
+        drf, fast = render({"a": [1, 2]}, "application/json; indent=4")
+
+        # Assert
+        assert fast == drf
+        assert b"\n" in fast
+
+    def test_none(self):
+        # Act, Assert
+        assert render(None) == (b"", b"")
+
+
+class TestFastJSONParser:
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b'{"players": [1, 2], "transitions": [{"player": 1, "duration": 10}]}',
+            '{"text": "é \\u00e9 🏓"}'.encode(),
+            b"[1.5, 1e400, 18446744073709551616, null, true]",
+        ],
+    )
+    def test_same_data_as_drf(self, content):
+        # Act
+        data = parse(content)
+
+        # Assert
+        assert data == JSONParser().parse(io.BytesIO(content))
+
+    @pytest.mark.parametrize("content", [b"{", b'{"a": NaN}', b"", b"\xff"])
+    def test_errors_as_drf(self, content):
+        # Act
+        with pytest.raises(ParseError) as fast_error:
+            parse(content)
+        with pytest.raises(ParseError) as drf_error:
+            JSONParser().parse(io.BytesIO(content))
+
+        # Assert
+        assert str(fast_error.value.detail) == str(drf_error.value.detail)
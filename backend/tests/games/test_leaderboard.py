@@ -0,0 +1,188 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+from games.leaderboard import leaderboard, rebuild_daily_stats
+from games.models import DailyPlayerStats, Game, GameScore, ScoreParameters
+
+
+def create_scored_game(game_factory, players, date=None):
+    return game_factory.create(players=players, date=date or timezone.now())
+
+
+def expected_rows(games):
+    """Leaderboard computed directly from the scores of the games."""
+    return leaderboard(ScoreParameters.current(), games=games)
+
+
+@pytest.mark.django_db
+class TestLeaderboard:
+    endpoint = "/games/leaderboard"
+
+    def test_totals(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(3)]
+        for _ in range(4):
+            create_scored_game(game_factory, players)
+
+        # Act
+        response = api_client().get(self.endpoint)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == expected_rows(Game.objects.all())
+        assert sum(row["wins"] for row in response.json()) >= 4
+        assert {row["games_played"] for row in response.json()} == {4}
+
+    def test_post_updates_leaderboard(self, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        transitions = [{"player": player.pk, "duration": 10} for player in players]
+        data = {"players": [player.pk for player in players], "transitions": transitions}
+
+        # Act
+        api_client().post("/games/", data, format="json")
+        response = api_client().get(self.endpoint)
+
+        # Assert
+        assert len(response.json()) == 2
+        assert response.json()[0]["player"] == players[1].pk
+
+    def test_date_range(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        for day in range(10, 20):
+            for hour in (1, 12, 23):
+                date = datetime.datetime(2023, 8, day, hour, tzinfo=datetime.timezone.utc)
+                create_scored_game(game_factory, players, date)
+
+        date_after = datetime.datetime(2023, 8, 12, 6, tzinfo=datetime.timezone.utc)
+        date_before = datetime.datetime(2023, 8, 17, 12, tzinfo=datetime.timezone.utc)
+
+        # Act
+        response = api_client().get(
+            self.endpoint, {"date_after": date_after, "date_before": date_before}
+        )
+
+        # Assert
+        games = Game.objects.filter(date__gte=date_after, date__lte=date_before)
+        assert response.json() == expected_rows(games)
+        assert response.json()[0]["games_played"] == 16
+
+    def test_date_range_within_a_day(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        for hour in (1, 12, 23):
+            date = datetime.datetime(2023, 8, 10, hour, tzinfo=datetime.timezone.utc)
+            create_scored_game(game_factory, players, date)
+
+        # Act
+        response = api_client().get(
+            self.endpoint,
+            {
+                "date_after": datetime.datetime(2023, 8, 10, 6, tzinfo=datetime.timezone.utc),
+                "date_before": datetime.datetime(2023, 8, 10, 18, tzinfo=datetime.timezone.utc),
+            },
+        )
+
+        # Assert
+        assert response.json()[0]["games_played"] == 1
+
+    def test_selected_players(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        player1 = custom_user_factory()
+        player2 = custom_user_factory()
+        player3 = custom_user_factory()
+
+        create_scored_game(game_factory, (player1, player2))
+        create_scored_game(game_factory, (player2, player3))
+        create_scored_game(game_factory, (player1, player3))
+
+        # Act
+        response = api_client().get(self.endpoint, {"players": [player2.pk, player3.pk]})
+
+        # Assert
+        assert {row["player"] for row in response.json()} == {player2.pk, player3.pk}
+        assert {row["games_played"] for row in response.json()} == {1}
+
+    def test_exact_players(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        player1, player2, player3 = [custom_user_factory() for _ in range(3)]
+        game = create_scored_game(game_factory, (player1, player2))
+        create_scored_game(game_factory, (player1, player2, player3))
+
+        # Act
+        response = api_client().get(self.endpoint, {"players_exact": [player1.pk, player2.pk]})
+
+        # Assert, only the game of exactly these players
+        assert response.json() == expected_rows(Game.objects.filter(pk=game.pk))
+        assert {row["games_played"] for row in response.json()} == {1}
+
+    def test_invalidated_game(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        create_scored_game(game_factory, players)
+        game = create_scored_game(game_factory, players)
+
+        # Act
+        game.valid = False
+        game.save()
+        response_invalid = api_client().get(self.endpoint)
+
+        game.valid = True
+        game.save()
+        response_valid = api_client().get(self.endpoint)
+
+        # Assert
+        assert {row["games_played"] for row in response_invalid.json()} == {1}
+        assert {row["games_played"] for row in response_valid.json()} == {2}
+        assert response_valid.json() == expected_rows(Game.objects.all())
+
+    def test_deleted_game(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        create_scored_game(game_factory, players)
+        game = create_scored_game(game_factory, players)
+
+        # Act
+        game.delete()
+        response = api_client().get(self.endpoint)
+
+        # Assert
+        assert {row["games_played"] for row in response.json()} == {1}
+        assert response.json() == expected_rows(Game.objects.all())
+
+    def test_deleted_games_queryset(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        kept = create_scored_game(game_factory, players)
+        invalid = create_scored_game(game_factory, players)
+        invalid.valid = False
+        invalid.save()
+        for _ in range(2):
+            create_scored_game(game_factory, players)
+
+        # Act, the invalid game is not part of the totals already
+        Game.objects.exclude(pk=kept.pk).delete()
+        response = api_client().get(self.endpoint)
+
+        # Assert
+        assert {row["games_played"] for row in response.json()} == {1}
+        assert response.json() == expected_rows(Game.objects.all())
+
+    def test_rebuild(self, game_factory, custom_user_factory):
+        # Arrange
+        players = [custom_user_factory() for _ in range(3)]
+        for _ in range(3):
+            create_scored_game(game_factory, players)
+        parameters = ScoreParameters.current()
+        daily_stats = list(DailyPlayerStats.objects.values("player", "day", "points", "wins"))
+
+        # Act
+        rebuild_daily_stats(parameters)
+
+        # Assert
+        assert (
+            list(DailyPlayerStats.objects.values("player", "day", "points", "wins")) == daily_stats
+        )
+        assert GameScore.objects.count() == 9
@@ -0,0 +1,128 @@
+import re
+
+import pytest
+from games.metrics import reset_metrics
+
+
+@pytest.fixture(autouse=True)
+def metrics():
+    reset_metrics()
+
+
+def scrape(client) -> dict[str, float]:
+    """Samples of /metrics, by name and labels."""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+
+    samples = {}
+    for line in response.content.decode().splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+
+    return samples
+
+
+@pytest.mark.django_db
+class TestMetrics:
+    def test_list(self, game_factory, custom_user_factory, client):
+        # Arrange
+        game_factory.create(players=[custom_user_factory() for _ in range(2)])
+
+        # Act
+        client.get("/games/")
+        samples = scrape(client)
+
+        # Assert
+        labels = '{view="games:game-list",method="GET"}'
+        assert samples[f"koth_request_duration_seconds_count{labels}"] == 1
+        assert samples[f"koth_request_duration_seconds_sum{labels}"] > 0
+        assert samples['koth_requests_total{view="games:game-list",method="GET",status="200"}'] == 1
+        assert samples[f"koth_request_db_queries_sum{labels}"] >= 3
+        assert samples[f"koth_db_duration_seconds_total{labels}"] > 0
+        assert samples[f"koth_serializer_duration_seconds_total{labels}"] > 0
+
+    def test_buckets(self, client):
+        # Act
+        for _ in range(3):
+            client.get("/games/leaderboard")
+        samples = scrape(client)
+
+        # Assert, the buckets are cumulative
+        labels = 'view="games:leaderboard",method="GET"'
+        prefix = f"koth_request_duration_seconds_bucket{{{labels}"
+        buckets = [value for name, value in samples.items() if name.startswith(prefix)]
+        assert buckets == sorted(buckets)
+        assert samples[f'koth_request_duration_seconds_bucket{{{labels},le="+Inf"}}'] == 3
+
+    def test_async_view_queries(self, game_factory, custom_user_factory, client):
+        # Arrange
+        game = game_factory.create(players=[custom_user_factory() for _ in range(2)])
+
+        # Act
+        client.get(f"/games/async/{game.pk}/")
+        samples = scrape(client)
+
+        # Assert
+        labels = '{view="games:async-detail",method="GET"}'
+        assert samples[f"koth_request_duration_seconds_count{labels}"] == 1
+        assert samples[f"koth_request_db_queries_sum{labels}"] >= 3
+
+    def test_unresolved(self, client):
+        # Act
+        client.get("/unknown/page")
+        client.get("/other/unknown/page")
+        samples = scrape(client)
+
+        # Assert
+        assert samples['koth_requests_total{view="unresolved",method="GET",status="404"}'] == 2
+
+    def test_token(self, client, settings):
+        # Arrange
+        settings.METRICS_TOKEN = "secret"
+
+        # Act
+        forbidden = client.get("/metrics")
+        allowed = client.get("/metrics", HTTP_AUTHORIZATION="Bearer secret")
+
+        # Assert
+        assert forbidden.status_code == 403
+        assert allowed.status_code == 200
+
+    def test_slow_requests_logged(self, client, settings, caplog):
+        # Arrange
+        settings.SLOW_REQUEST_THRESHOLD = 0
+
+        # Act
+        client.get("/games/leaderboard?date_after=2023-01-01T00:00:00Z")
+
+        # Assert
+        assert re.search(
+            r"Slow request GET /games/leaderboard\?date_after=\S+ \(games:leaderboard\): \d+ ms, \d+ queries",
+            caplog.text,
+        )
+
+    def test_fast_requests_not_logged(self, client, settings, caplog):
+        # Arrange
+        settings.SLOW_REQUEST_THRESHOLD = 60
+
+        # Act
+        client.get("/games/leaderboard")
+
+        # Assert
+        assert "Slow request" not in caplog.text
+
+
+@pytest.mark.django_db
+def test_upload_does_not_print(custom_user_factory, client, capsys):
+    # Arrange
+    players = [custom_user_factory() for _ in range(2)]
+    data = {"players": [player.pk for player in players], "transitions": [{"player": players[0].pk, "duration": 5}]}
+
+    # Act
+    response = client.post("/games/upload", data, content_type="application/json")
+
+    # Assert
+    assert response.status_code == 201
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,103 @@
+import datetime
+
+import pytest
+from games.models import Game
+
+
+def collect_pages(client, url):
+    """Follows the next links from ``url``, returns the transition duration of all the games."""
+    durations = []
+    while url is not None:
+        response = client.get(url)
+        assert response.status_code == 200
+        durations.extend(game["transitions"][0]["duration"] for game in response.json()["results"])
+        url = response.json()["next"]
+
+    return durations
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    endpoint = "/games/?pagination=cursor"
+
+    def test_walks_all_games(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        date = datetime.datetime(2023, 8, 10, tzinfo=datetime.timezone.utc)
+        # Games sharing the same date are ordered by id, the duration identifies a game
+        for i in range(25):
+            game_factory.create(
+                players=players,
+                players__transition_duration=i + 1,
+                date=date + datetime.timedelta(hours=i // 3),
+            )
+        expected = [game.transitions[0]["duration"] for game in Game.objects.order_by("-date", "-id")]
+
+        # Act
+        durations = collect_pages(api_client(), self.endpoint)
+
+        # Assert
+        assert durations == expected
+        assert sorted(durations) == list(range(1, 26))
+
+    def test_previous_link(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        for _ in range(25):
+            game_factory.create(players=players)
+        client = api_client()
+
+        first_page = client.get(self.endpoint).json()
+        second_page = client.get(first_page["next"]).json()
+
+        # Act
+        response = client.get(second_page["previous"])
+
+        # Assert
+        assert first_page["previous"] is None
+        assert response.json()["results"] == first_page["results"]
+        assert response.json()["previous"] is None
+
+    def test_no_count(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        game_factory.create(players=[custom_user_factory() for _ in range(2)])
+
+        # Act
+        response = api_client().get(self.endpoint)
+
+        # Assert
+        assert set(response.json()) == {"next", "previous", "results"}
+        assert response.json()["next"] is None
+
+    def test_invalid_cursor(self, api_client):
+        # Act
+        response = api_client().get("/games/?cursor=invalid")
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_page_number_by_default(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        game_factory.create(players=[custom_user_factory() for _ in range(2)])
+
+        # Act
+        response = api_client().get("/games/")
+
+        # Assert
+        assert response.json()["count"] == 1
+
+    # Score parameters, version of the games, page (and count), players and scores
+    @pytest.mark.parametrize("endpoint, max_queries", [("/games/", 7), ("/games/?pagination=cursor", 6)])
+    def test_queries_do_not_depend_on_page_size(
+        self, endpoint, max_queries, game_factory, custom_user_factory, api_client, django_assert_max_num_queries
+    ):
+        # Arrange
+        players = [custom_user_factory() for _ in range(4)]
+        for _ in range(20):
+            game_factory.create(players=players)
+        client = api_client()
+        client.get(endpoint)
+
+        # Act / Assert
+        with django_assert_max_num_queries(max_queries):
+            client.get(endpoint)
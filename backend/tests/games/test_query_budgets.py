@@ -0,0 +1,87 @@
+import pytest
+from games.models import Game
+from games.scoring import save_game_scores
+
+from tests.factories import seed_test_games
+
+
+@pytest.fixture(params=[10, 1_000], ids=lambda size: f"{size}-games")
+def players(request, db):
+    return seed_test_games(request.param)
+
+
+@pytest.mark.django_db
+class TestQueryBudgets:
+    """The queries of each endpoint do not depend on the number of games, nor of players."""
+
+    @pytest.mark.parametrize(
+        "params, budget",
+        [
+            # Parameters, last modification and deletion, count, page, players, scores
+            ({}, 7),
+            ({"page": "last"}, 7),
+            ({"date_after": "2023-01-01T00:00:00Z", "date_before": "2023-01-01T05:00:00Z"}, 7),
+            # Keyset pagination does not count the games
+            ({"pagination": "cursor"}, 6),
+        ],
+    )
+    def test_list(self, params, budget, players, api_client, django_assert_num_queries):
+        # Act
+        with django_assert_num_queries(budget):
+            response = api_client().get("/games/", params)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["results"]
+
+    @pytest.mark.parametrize("filter, nb_players", [("players", 1), ("players", None), ("players_exact", None)])
+    def test_filter(self, filter, nb_players, players, api_client, django_assert_num_queries):
+        # Arrange, players of a game so there are results
+        game_players = list(Game.objects.first().players.values_list("pk", flat=True))[:nb_players]
+
+        # Act, the filtered players are validated first
+        with django_assert_num_queries(8):
+            response = api_client().get("/games/", {filter: game_players})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["results"]
+
+    def test_retrieve(self, players, api_client, django_assert_num_queries):
+        # Arrange
+        game = Game.objects.last()
+
+        # Act, the parameters, the last modification, the game, its players and its scores
+        with django_assert_num_queries(5):
+            response = api_client().get(f"/games/{game.pk}/")
+
+        # Assert
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("nb_players, nb_transitions", [(2, 2), (2, 200), (6, 200)])
+    def test_upload(self, nb_players, nb_transitions, players, api_client, django_assert_num_queries):
+        # Arrange
+        data = {
+            "players": players[:nb_players],
+            "transitions": [{"player": players[i % nb_players], "duration": 10} for i in range(nb_transitions)],
+        }
+
+        # Act, the players and the parameters, then in a savepoint the game, its players,
+        # transitions, scores and the 3 queries of the daily stats, then the players of the response
+        with django_assert_num_queries(12):
+            response = api_client().post("/games/upload", data, format="json")
+
+        # Assert
+        assert response.status_code == 201
+
+    def test_leaderboard(self, players, api_client, django_assert_num_queries):
+        # Arrange
+        for game in Game.objects.all()[:10]:
+            save_game_scores(game)
+
+        # Act, the parameters and the daily stats
+        with django_assert_num_queries(2):
+            response = api_client().get("/games/leaderboard")
+
+        # Assert
+        assert response.status_code == 200
@@ -0,0 +1,92 @@
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from games.management.commands import rescore
+from games.models import DailyPlayerStats, GameScore, ScoreParameters
+
+
+@pytest.fixture
+def scored_games(game_factory, custom_user_factory):
+    players = [custom_user_factory() for _ in range(3)]
+    return [game_factory.create(players=players) for _ in range(5)]
+
+
+@pytest.mark.django_db
+class TestRescoreCommand:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_new_version(self, scored_games, workers):
+        # Arrange
+        current = ScoreParameters.current()
+
+        # Act
+        call_command("rescore", alpha=10, workers=workers, chunk_size=2, stdout=StringIO())
+
+        # Assert
+        new_parameters = ScoreParameters.objects.exclude(pk=current.pk).get()
+        assert new_parameters.alpha == 10
+        assert new_parameters.sigma == current.sigma
+        assert not new_parameters.active
+        assert GameScore.objects.filter(parameters=new_parameters).count() == 15
+        assert DailyPlayerStats.objects.filter(parameters=new_parameters).exists()
+
+    @pytest.mark.parametrize("start_method", ["spawn", "forkserver"])
+    def test_workers_start_method(self, scored_games, start_method, monkeypatch):
+        # Arrange, the default start method of macOS, and of Linux from Python 3.14
+        context = multiprocessing.get_context(start_method)
+        monkeypatch.setattr(rescore, "ProcessPoolExecutor", partial(ProcessPoolExecutor, mp_context=context))
+
+        # Act
+        call_command("rescore", alpha=10, workers=2, chunk_size=2, stdout=StringIO())
+
+        # Assert
+        new_parameters = ScoreParameters.objects.get(alpha=10)
+        assert GameScore.objects.filter(parameters=new_parameters).count() == 15
+
+    def test_same_scores_with_same_parameters(self, scored_games):
+        # Act
+        call_command("rescore", workers=1, stdout=StringIO())
+
+        # Assert
+        old, new = ScoreParameters.objects.order_by("pk")
+        fields = ("game", "player", "points", "total_reign_time", "crowns_claimed", "winner")
+        old_scores = set(GameScore.objects.filter(parameters=old).values_list(*fields))
+        assert set(GameScore.objects.filter(parameters=new).values_list(*fields)) == old_scores
+
+    def test_activate(self, scored_games):
+        # Act
+        call_command("rescore", beta=1.0, activate=True, workers=1, stdout=StringIO())
+
+        # Assert
+        assert ScoreParameters.current().beta == 1.0
+        assert ScoreParameters.objects.filter(active=True).count() == 1
+
+    def test_file(self, scored_games, tmp_path):
+        # Arrange
+        params_file = tmp_path / "params.json"
+        params_file.write_text(
+            json.dumps({"alpha": 1, "beta": 2.0, "sigma": 1.5, "points_last_king": 4})
+        )
+
+        # Act
+        call_command("rescore", file=str(params_file), workers=1, stdout=StringIO())
+
+        # Assert
+        new_parameters = ScoreParameters.objects.order_by("-pk").first()
+        assert (new_parameters.alpha, new_parameters.points_last_king) == (1, 4)
+
+    def test_dry_run(self, scored_games):
+        # Arrange
+        out = StringIO()
+
+        # Act
+        call_command("rescore", points_last_king=1000, dry_run=True, workers=1, stdout=out)
+
+        # Assert
+        assert ScoreParameters.objects.count() == 1
+        assert "Scored 5 games" in out.getvalue()
+        assert "->" in out.getvalue()
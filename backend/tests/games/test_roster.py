@@ -0,0 +1,121 @@
+import json
+import random
+
+import pytest
+from games.models import Game, roster_key
+
+
+def joined_games(players):
+    """Games with all the players, with one join per player."""
+    queryset = Game.objects.all()
+    for player in players:
+        queryset = queryset.filter(players=player)
+
+    return queryset
+
+
+def test_roster_key():
+    assert roster_key([9, 1, 5]) == ",1,5,9,"
+    assert roster_key([]) == ""
+    assert roster_key([1]) not in roster_key([11, 12])
+
+
+@pytest.mark.django_db
+class TestRosterSync:
+    def test_create(self, game_factory, custom_user_factory):
+        # Arrange
+        players = [custom_user_factory() for _ in range(3)]
+
+        # Act
+        game = game_factory.create(players=players)
+
+        # Assert
+        game.refresh_from_db()
+        assert game.roster == roster_key(player.pk for player in players)
+
+    def test_remove_and_clear(self, game_factory, custom_user_factory):
+        # Arrange
+        players = [custom_user_factory() for _ in range(3)]
+        game = game_factory.create(players=players)
+
+        # Act / Assert
+        game.players.remove(players[0])
+        game.refresh_from_db()
+        assert game.roster == roster_key([players[1].pk, players[2].pk])
+
+        game.players.clear()
+        game.refresh_from_db()
+        assert game.roster == ""
+
+    def test_from_player_side(self, game_factory, custom_user_factory):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        game = game_factory.create(players=players[:1])
+
+        # Act / Assert
+        players[1].game_set.add(game)
+        game.refresh_from_db()
+        assert game.roster == roster_key(player.pk for player in players)
+
+        players[0].game_set.clear()
+        game.refresh_from_db()
+        assert game.roster == roster_key([players[1].pk])
+
+    def test_admin(self, admin_client, game_factory, custom_user_factory):
+        # Arrange
+        players = [custom_user_factory() for _ in range(3)]
+        game = game_factory.create(players=players[:2])
+
+        # Act
+        response = admin_client.post(
+            f"/admin/games/game/{game.pk}/change/",
+            {"players": [players[1].pk, players[2].pk], "transitions": json.dumps(game.transitions), "valid": "on"},
+        )
+
+        # Assert, the players are still edited through the relation
+        assert response.status_code == 302
+        game.refresh_from_db()
+        assert game.roster == roster_key([players[1].pk, players[2].pk])
+
+
+@pytest.mark.django_db
+class TestRosterFilters:
+    endpoint = "/games/"
+
+    def test_same_results_as_joins(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        rng = random.Random(0)
+        players = [custom_user_factory() for _ in range(12)]
+        for _ in range(40):
+            game_factory.create(players=rng.sample(players, rng.randint(2, 6)))
+
+        for size in range(1, 5):
+            selected = rng.sample(players, size)
+
+            # Act
+            response = api_client().get(
+                self.endpoint, {"players": [player.pk for player in selected], "page_size": 100}
+            )
+
+            # Assert
+            assert response.json()["count"] == joined_games(selected).count()
+
+    def test_exact_players(self, game_factory, custom_user_factory, api_client):
+        # Arrange
+        player1, player2, player3 = [custom_user_factory() for _ in range(3)]
+        game_factory.create(players=(player1, player2))
+        game_factory.create(players=(player2, player1))
+        game_factory.create(players=(player1, player2, player3))
+
+        # Act
+        response = api_client().get(self.endpoint, {"players_exact": [player2.pk, player1.pk]})
+
+        # Assert
+        assert response.json()["count"] == 2
+
+    def test_unknown_player(self, api_client):
+        # Act
+        response = api_client().get(self.endpoint, {"players_exact": [999]})
+
+        # Assert
+        assert response.status_code == 400
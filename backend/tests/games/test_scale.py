@@ -0,0 +1,115 @@
+import time
+
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+from games.models import Game
+from rest_framework.test import APIClient
+
+from tests.factories import seed_test_games
+
+# Latency of the API over a large history. The bounds are well above the timings
+# of a development machine (at least 4 times), so a slower one still passes, and
+# below the ones of the regressions fixed so far (e.g. a deep page in 2.6 s at
+# 100k games). They are part of every run, with the query budgets, and take a few
+# seconds, run them alone with ``-m scale``.
+
+pytestmark = [pytest.mark.scale, pytest.mark.django_db]
+
+NB_GAMES = 10_000
+
+# Bounds in seconds, of the best of a few requests with an empty cache
+LIST_BOUND = 0.25
+DETAIL_BOUND = 0.05
+UPLOAD_BOUND = 0.2
+
+
+@pytest.fixture(scope="module")
+def players(django_db_setup, django_db_blocker):
+    """Pks of the players of ``NB_GAMES`` games, seeded once for the module and then removed."""
+    with django_db_blocker.unblock(), transaction.atomic():
+        yield seed_test_games(NB_GAMES, seed=1)
+        transaction.set_rollback(True)
+
+
+def best_latency(request, repeat=3) -> float:
+    """Best time of ``request``, without the cached reads."""
+    timings = []
+    for _ in range(repeat):
+        cache.clear()
+        start = time.perf_counter()
+        response = request()
+        timings.append(time.perf_counter() - start)
+        assert response.status_code < 300
+
+    return min(timings)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"page": NB_GAMES // 20 // 2},
+        {"page": "last"},
+        {"date_after": "2024-01-01T00:00:00Z", "date_before": "2024-01-08T00:00:00Z"},
+        {"pagination": "cursor"},
+    ],
+    ids=["first-page", "deep-page", "last-page", "date", "cursor"],
+)
+def test_list(params, players):
+    # Act
+    latency = best_latency(lambda: APIClient().get("/games/", params))
+
+    # Assert
+    assert latency < LIST_BOUND
+
+
+@pytest.mark.parametrize("nb_players", [1, 2, 3])
+def test_filter_players(nb_players, players):
+    # Act
+    latency = best_latency(lambda: APIClient().get("/games/", {"players": players[:nb_players]}))
+
+    # Assert
+    assert latency < LIST_BOUND
+
+
+def test_filter_players_exact(players):
+    # Arrange
+    game_players = list(Game.objects.last().players.values_list("pk", flat=True))
+
+    # Act
+    latency = best_latency(lambda: APIClient().get("/games/", {"players_exact": game_players}))
+
+    # Assert
+    assert latency < LIST_BOUND
+
+
+def test_retrieve(players):
+    # Arrange
+    game = Game.objects.order_by("pk")[NB_GAMES // 2]
+
+    # Act
+    latency = best_latency(lambda: APIClient().get(f"/games/{game.pk}/"))
+
+    # Assert
+    assert latency < DETAIL_BOUND
+
+
+def test_upload(players):
+    # Arrange
+    transitions = [{"player": players[i % 3], "duration": 10} for i in range(50)]
+    data = {"players": players[:3], "transitions": transitions}
+
+    # Act
+    latency = best_latency(lambda: APIClient().post("/games/upload", data, format="json"))
+
+    # Assert
+    assert latency < UPLOAD_BOUND
+
+
+def test_leaderboard(players):
+    # Act
+    latency = best_latency(lambda: APIClient().get("/games/leaderboard", {"players": players[:2]}))
+
+    # Assert
+    assert latency < LIST_BOUND
@@ -0,0 +1,150 @@
+import math
+
+import pytest
+from games.models import GameScore, ScoreParameters
+from games.scoring import save_game_scores, score_transitions
+
+
+class TestScoreTransitions:
+    def test_points(self):
+        parameters = ScoreParameters()
+        transitions = [
+            {"player": 1, "duration": 10},
+            {"player": 2, "duration": 20},
+            {"player": 3, "duration": 30},
+        ]
+
+        scores = score_transitions([1, 2, 3], transitions, parameters)
+
+        def expected_points(seconds):
+            points = math.ceil(parameters.alpha * seconds / 60)
+            points += math.ceil(
+                parameters.beta * int(math.ceil(seconds / 60 * 100)) ** parameters.sigma
+            )
+            return points
+
+        assert scores[1]["points"] == expected_points(10)
+        assert scores[2]["points"] == expected_points(20)
+        assert scores[3]["points"] == expected_points(30) + parameters.points_last_king
+        assert scores[3]["winner"]
+        assert not scores[1]["winner"]
+
+    def test_crowns_and_reign_time(self):
+        transitions = [
+            {"player": 1, "duration": 10},
+            {"player": 2, "duration": 20},
+            {"player": 1, "duration": 30},
+        ]
+
+        scores = score_transitions([1, 2, 3], transitions, ScoreParameters())
+
+        assert scores[1]["crowns_claimed"] == 1
+        assert scores[1]["total_reign_time"] == 40
+        assert scores[3] == {
+            "points": 0,
+            "total_reign_time": 0,
+            "crowns_claimed": 0,
+            "winner": False,
+        }
+
+    def test_no_duration(self):
+        transitions = [{"player": 1, "duration": 0}, {"player": 2, "duration": 0}]
+        parameters = ScoreParameters()
+
+        scores = score_transitions([1, 2], transitions, parameters)
+
+        assert scores[1]["points"] == 0
+        assert scores[2]["points"] == parameters.points_last_king
+
+
+@pytest.mark.django_db
+class TestGameScores:
+    endpoint = "/games/"
+
+    def test_scores_saved_on_create(self, custom_user_factory, api_client):
+        players = [custom_user_factory() for _ in range(3)]
+        transitions = [
+            {"player": player.pk, "duration": 10 * (i + 1)} for i, player in enumerate(players)
+        ]
+
+        response = api_client().post(
+            self.endpoint,
+            {"players": [p.pk for p in players], "transitions": transitions},
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert GameScore.objects.count() == 3
+        assert len(response.json()["scores"]) == 3
+
+    def test_scores_saved_on_upload(self, custom_user_factory, api_client):
+        players = [custom_user_factory() for _ in range(2)]
+        transitions = [{"player": player.pk, "duration": 10} for player in players]
+
+        response = api_client().post(
+            f"{self.endpoint}upload",
+            {"players": [p.pk for p in players], "transitions": transitions},
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert GameScore.objects.filter(parameters=ScoreParameters.current()).count() == 2
+
+    def test_scores_listed(self, game_factory, custom_user_factory, api_client):
+        players = [custom_user_factory() for _ in range(3)]
+        for _ in range(3):
+            game_factory.create(players=players)
+
+        response = api_client().get(self.endpoint)
+
+        assert response.status_code == 200
+        for game in response.json()["results"]:
+            assert {score["player"] for score in game["scores"]} == {
+                player.pk for player in players
+            }
+
+    def test_only_active_parameters_listed(self, game_factory, custom_user_factory, api_client):
+        players = [custom_user_factory() for _ in range(2)]
+        game = game_factory.create(players=players)
+        save_game_scores(game, ScoreParameters.objects.create(alpha=10))
+
+        response = api_client().get(f"{self.endpoint}{game.pk}/")
+
+        assert len(response.json()["scores"]) == 2
+
+    def test_scores_saved_through_the_orm(self, game_factory, custom_user_factory, api_client):
+        players = [custom_user_factory() for _ in range(2)]
+
+        game = game_factory.create(players=players)
+
+        response = api_client().get(f"{self.endpoint}{game.pk}/")
+        expected = score_transitions([p.pk for p in players], game.transitions, ScoreParameters.current())
+        assert {score["player"]: score["points"] for score in response.json()["scores"]} == {
+            pk: score["points"] for pk, score in expected.items()
+        }
+
+    def test_scores_updated_with_transitions(self, game_factory, custom_user_factory, api_client):
+        players = [custom_user_factory() for _ in range(2)]
+        game = game_factory.create(players=players)
+
+        game.transitions = [{"player": players[0].pk, "duration": 60}]
+        game.save()
+
+        scores = {score.player_id: score for score in GameScore.objects.filter(game=game)}
+        assert scores[players[0].pk].winner
+        assert scores[players[1].pk].points == 0
+        leaderboard = {row["player"]: row["points"] for row in api_client().get("/games/leaderboard").json()}
+        assert leaderboard == {pk: score.points for pk, score in scores.items()}
+
+    def test_scores_updated_with_players(self, game_factory, custom_user_factory):
+        players = [custom_user_factory() for _ in range(3)]
+        game = game_factory.create(players=players[:2])
+
+        game.players.add(players[2])
+        assert set(GameScore.objects.filter(game=game).values_list("player", flat=True)) == {p.pk for p in players}
+
+        players[0].game_set.remove(game)
+        assert not GameScore.objects.filter(game=game, player=players[0]).exists()
+
+        game.players.clear()
+        assert not GameScore.objects.filter(game=game).exists()
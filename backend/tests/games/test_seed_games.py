@@ -0,0 +1,137 @@
+import datetime
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from games.leaderboard import STATS_FIELDS, rebuild_daily_stats
+from games.models import DailyPlayerStats, Game, GameScore, ScoreParameters, Transition, roster_key
+from games.scoring import score_transitions
+
+
+def seed(**options):
+    options = {"games": 50, "users": 5, "batch_size": 20, "start": datetime.date(2023, 1, 1), **options}
+    call_command("seed_games", stdout=StringIO(), **options)
+
+
+def games_data(games) -> list[tuple]:
+    return [(game.roster, game.transitions, game.date) for game in games]
+
+
+@pytest.mark.django_db
+class TestSeedGamesCommand:
+    def test_games_and_rows(self):
+        # Act
+        seed()
+
+        # Assert
+        games = Game.objects.prefetch_related("players", "transition_rows")
+        assert len(games) == 50
+        for game in games:
+            players_pks = [player.pk for player in game.players.all()]
+            assert 2 <= len(players_pks) <= 5
+            assert game.roster == roster_key(players_pks)
+            assert game.valid
+            rows = [(row.player_id, row.duration) for row in game.transition_rows.all()]
+            assert rows == [(transition["player"], transition["duration"]) for transition in game.transitions]
+
+    def test_transitions(self):
+        # Act
+        seed()
+
+        # Assert, the crown goes to another player of the game at each transition
+        for game in Game.objects.prefetch_related("players"):
+            players_pks = {player.pk for player in game.players.all()}
+            kings = [transition["player"] for transition in game.transitions]
+            assert set(kings) <= players_pks
+            assert all(king != next_king for king, next_king in zip(kings, kings[1:]))
+            assert all(transition["duration"] >= 1 for transition in game.transitions)
+
+    def test_scores(self):
+        # Act
+        seed()
+
+        # Assert, the same scores as the uploaded games
+        parameters = ScoreParameters.current()
+        for game in Game.objects.prefetch_related("players", "scores"):
+            expected = score_transitions([player.pk for player in game.players.all()], game.transitions, parameters)
+            scores = {
+                score.player_id: {
+                    "points": score.points,
+                    "total_reign_time": score.total_reign_time,
+                    "crowns_claimed": score.crowns_claimed,
+                    "winner": score.winner,
+                }
+                for score in game.scores.all()
+            }
+            assert scores == expected
+        assert DailyPlayerStats.objects.filter(parameters=parameters).exists()
+
+    def test_daily_stats(self):
+        # Arrange, the second run adds to the days of the first one
+        seed(days=3)
+        seed(days=3)
+        parameters = ScoreParameters.current()
+        stats_fields = ["player", "day", *STATS_FIELDS]
+        seeded = set(DailyPlayerStats.objects.values_list(*stats_fields))
+
+        # Act
+        rebuild_daily_stats(parameters)
+
+        # Assert, the same totals as the ones built from the scores
+        assert set(DailyPlayerStats.objects.values_list(*stats_fields)) == seeded
+
+    def test_no_scores(self):
+        # Act
+        seed(no_scores=True)
+
+        # Assert
+        assert Game.objects.count() == 50
+        assert not GameScore.objects.exists()
+        assert not DailyPlayerStats.objects.exists()
+
+    def test_reproducible(self):
+        # Act, the users are reused by the second run
+        seed(seed=3)
+        first = games_data(Game.objects.order_by("pk"))
+        seed(seed=3)
+
+        # Assert
+        assert games_data(Game.objects.order_by("pk")[50:]) == first
+        assert Transition.objects.count() == 2 * sum(len(transitions) for _, transitions, _ in first)
+
+    def test_other_seed(self):
+        # Act
+        seed(seed=1)
+        first = games_data(Game.objects.order_by("pk"))
+        seed(seed=2)
+
+        # Assert
+        assert games_data(Game.objects.order_by("pk")[50:]) != first
+
+    def test_dates(self):
+        # Act
+        seed(days=10)
+
+        # Assert, in order over the days from the start
+        dates = list(Game.objects.order_by("pk").values_list("date", flat=True))
+        assert dates == sorted(dates)
+        assert dates[0].isoformat() >= "2023-01-01"
+        assert dates[-1].isoformat() < "2023-01-11"
+
+    def test_api(self, api_client):
+        # Arrange
+        seed()
+
+        # Act
+        games = api_client().get("/games/")
+        leaderboard = api_client().get("/games/leaderboard")
+
+        # Assert
+        assert games.json()["count"] == 50
+        assert len(leaderboard.json()) == 5
+
+    @pytest.mark.parametrize("options", [{"users": 1}, {"games": -1}, {"batch_size": 0}])
+    def test_invalid_options(self, options):
+        # Act, Assert
+        with pytest.raises(CommandError):
+            seed(**options)
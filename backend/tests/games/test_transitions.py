@@ -0,0 +1,68 @@
+import pytest
+from games.leaderboard import transitions_aggregates
+from games.models import Game, GameScore, Transition
+
+
+def rows_as_transitions(game):
+    return [{"player": row.player_id, "duration": row.duration} for row in game.transition_rows.all()]
+
+
+@pytest.mark.django_db
+class TestTransitionRows:
+    def test_created_with_game(self, game_factory, custom_user_factory):
+        # Act
+        game = game_factory.create(players=[custom_user_factory() for _ in range(3)])
+
+        # Assert
+        game.refresh_from_db()
+        assert rows_as_transitions(game) == game.transitions
+        assert list(game.transition_rows.values_list("sequence", flat=True)) == list(range(10))
+
+    def test_updated_with_transitions(self, game_factory, custom_user_factory):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        game = game_factory.create(players=players)
+
+        # Act
+        game.transitions = [{"player": players[1].pk, "duration": 5}]
+        game.save()
+
+        # Assert
+        assert rows_as_transitions(game) == [{"player": players[1].pk, "duration": 5}]
+
+    def test_api_uploads(self, custom_user_factory, api_client):
+        # Arrange
+        players = [custom_user_factory() for _ in range(2)]
+        transitions = [{"player": players[i % 2].pk, "duration": 10 + i} for i in range(4)]
+        data = {"players": [player.pk for player in players], "transitions": transitions}
+        client = api_client()
+
+        # Act
+        response = client.post("/games/", data, format="json")
+        client.post("/games/bulk/", [data], format="json")
+
+        # Assert
+        assert response.json()["transitions"] == transitions
+        for game in Game.objects.all():
+            assert rows_as_transitions(game) == transitions
+
+    def test_aggregates_match_scores(self, game_factory, custom_user_factory):
+        # Arrange
+        players = [custom_user_factory() for _ in range(4)]
+        for i in range(10):
+            game_factory.create(players=players[i % 2 : i % 2 + 3])
+
+        # Act
+        rows = Transition.objects.values("player").annotate(**transitions_aggregates())
+
+        # Assert
+        for row in rows:
+            scores = GameScore.objects.filter(player=row["player"])
+            assert row["sum_total_reign_time"] == sum(score.total_reign_time for score in scores)
+            assert row["sum_crowns_claimed"] == sum(score.crowns_claimed for score in scores)
+            assert row["max_reign_time"] == max(
+                transition["duration"]
+                for game in Game.objects.filter(players=row["player"])
+                for transition in game.transitions
+                if transition["player"] == row["player"]
+            )
@@ -0,0 +1,283 @@
+import datetime
+import os
+import random
+import sys
+from pathlib import Path
+
+from timing import Results
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+DATA_DIR = Path(__file__).resolve().parent / ".data"
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+NB_USERS = 50
+SEED_BATCH_SIZE = 10_000
+
+# Number of requests sent at once by the concurrency benchmarks
+NB_CONCURRENT = 32
+
+# Number of transitions of the games of the JSON benchmarks
+JSON_TRANSITIONS = [10, 100, 1_000]
+
+
+def setup_django():
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    os.environ.setdefault("SECRET_KEY", "benchmarks")
+
+    import django
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    setup_test_environment()
+
+
+def use_database(size: int):
+    """Switches to the benchmark database of ``size`` games, kept between runs.
+
+    SQLite databases are files of ``DATA_DIR``, Postgres ones (with ``DB_HOST``
+    set) are databases named after ``DB_NAME``, created when missing.
+    """
+    from django.core.management import call_command
+    from django.db import connection
+
+    if connection.vendor == "sqlite":
+        DATA_DIR.mkdir(exist_ok=True)
+        name = str(DATA_DIR / f"api-{size}.sqlite3")
+    else:
+        name = f"{os.environ['DB_NAME']}_api_{size}"
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", [name])
+            if cursor.fetchone() is None:
+                cursor.execute(f'CREATE DATABASE "{name}"')
+
+    connection.close()
+    connection.settings_dict["NAME"] = name
+    call_command("migrate", verbosity=0)
+
+
+def database_label(size: int) -> str:
+    """Label of the timings of a database, the SQLite ones keep the size only."""
+    from django.db import connection
+
+    return str(size) if connection.vendor == "sqlite" else f"{connection.vendor}:{size}"
+
+
+def seed(size: int):
+    """Adds games until the database has ``size`` games."""
+    from games.models import Game
+    from games.seeding import seed_games, seed_users
+
+    users_pks = seed_users(NB_USERS, "benchmark")
+
+    missing_games = size - Game.objects.count()
+    if missing_games <= 0:
+        return
+
+    print(f"Seeding {missing_games} games...")
+    start_date = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+    for _ in seed_games(missing_games, users_pks, start_date, seed=size, batch_size=SEED_BATCH_SIZE):
+        pass
+
+
+def time_concurrent(results: Results, label: str, repeat: int):
+    """Throughput of the sync (WSGI) and async (ASGI) list views under concurrent requests.
+
+    Each run sends ``NB_CONCURRENT`` requests for different pages at once, the
+    sync ones from a pool of threads and the async ones from a single event
+    loop, with an empty cache so every request queries the database.
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    from django.core.cache import cache
+    from django.db import connections
+    from django.test import AsyncClient, Client
+
+    pages = [{"page": page} for page in range(1, NB_CONCURRENT + 1)]
+
+    def get_sync(params):
+        try:
+            return Client().get("/games/", params)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=NB_CONCURRENT) as executor:
+
+        def wsgi():
+            cache.clear()
+            list(executor.map(get_sync, pages))
+
+        results.time(f"api.concurrent.wsgi[{label}]", wsgi, repeat=repeat)
+
+    client = AsyncClient()
+
+    async def get_all():
+        await asyncio.gather(*(client.get("/games/async/", params) for params in pages))
+
+    def asgi():
+        cache.clear()
+        asyncio.run(get_all())
+
+    results.time(f"api.concurrent.asgi[{label}]", asgi, repeat=repeat)
+
+
+def time_load(results: Results, label: str, upload_data: dict, repeat: int):
+    """Mixed load of concurrent uploads and list requests, from a pool of threads.
+
+    Half of the ``NB_CONCURRENT`` requests upload a game (rolled back so the
+    database keeps the same number of games) while the others read a page of
+    the list, with an empty cache.
+
+    SQLite locks the whole file for each upload, and an upload that read the
+    database while another one was writing fails with "database is locked"
+    instead of waiting: these failures are counted and reported.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from django.core.cache import cache
+    from django.db import connections, transaction
+    from django.test import Client
+
+    def request(i) -> bool:
+        """Sends the request ``i``, returns whether the upload failed."""
+        # The test clients of all the threads receive the exceptions of a request,
+        # so they are turned into error responses instead of being raised
+        client = Client(raise_request_exception=False)
+        try:
+            if i % 2:
+                with transaction.atomic():
+                    response = client.post("/games/upload", upload_data, content_type="application/json")
+                    transaction.set_rollback(True)
+                return response.status_code == 500
+            else:
+                client.get("/games/", {"page": i // 2 + 1})
+                return False
+        finally:
+            connections.close_all()
+
+    failures = []
+
+    with ThreadPoolExecutor(max_workers=NB_CONCURRENT) as executor:
+
+        def load():
+            cache.clear()
+            failures.append(sum(executor.map(request, range(NB_CONCURRENT))))
+
+        results.time(f"api.concurrent.load[{label}]", load, repeat=repeat)
+
+    if any(failures):
+        print(f"  {sum(failures)} of {len(failures) * NB_CONCURRENT // 2} uploads failed on a lock")
+
+
+def time_json(results: Results, repeat: int):
+    """Rendering of a list page and parsing of an upload, by the DRF and the fast JSON classes."""
+    import io
+    from importlib.util import find_spec
+
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    if not find_spec("orjson"):
+        print("orjson is not installed, skipping the JSON benchmarks")
+        return
+
+    from games.fastjson import FastJSONParser, FastJSONRenderer
+
+    rng = random.Random(0)
+    date = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+
+    for nb_transitions in JSON_TRANSITIONS:
+        games = []
+        for _ in range(20):
+            players = rng.sample(range(1, NB_USERS + 1), 4)
+            games.append(
+                {
+                    "players": players,
+                    "transitions": [
+                        {"player": rng.choice(players), "duration": rng.randint(1, 100)} for _ in range(nb_transitions)
+                    ],
+                    "date": date,
+                    "scores": [
+                        {"player": player, "points": 50, "total_reign_time": 300, "crowns_claimed": 5, "winner": False}
+                        for player in players
+                    ],
+                }
+            )
+        page = {"count": 1000, "next": "http://testserver/games/?page=2", "previous": None, "results": games}
+        upload = JSONRenderer().render({"players": games[0]["players"], "transitions": games[0]["transitions"]})
+
+        classes = [("drf", JSONRenderer(), JSONParser()), ("fast", FastJSONRenderer(), FastJSONParser())]
+        for name, renderer, parser in classes:
+            results.time(f"api.json.render.{name}[{nb_transitions}]", lambda: renderer.render(page), repeat=repeat)
+            results.time(
+                f"api.json.parse.{name}[{nb_transitions}]", lambda: parser.parse(io.BytesIO(upload)), repeat=repeat
+            )
+
+
+def run(results: Results, options):
+    setup_django()
+    time_json(results, options.repeat)
+
+    from django.db import transaction
+    from django.test import Client
+    from games.models import Game
+
+    client = Client()
+
+    for size in options.sizes or DEFAULT_SIZES:
+        use_database(size)
+        seed(size)
+        label = database_label(size)
+
+        game = Game.objects.prefetch_related("players").first()
+        players = [player.pk for player in game.players.all()]
+        deep_page = max(1, size // 20 // 2)
+
+        results.time(f"api.list[{label}]", lambda: client.get("/games/"), repeat=options.repeat)
+        etag = client.get("/games/")["ETag"]
+        results.time(
+            f"api.list.not_modified[{label}]",
+            lambda: client.get("/games/", HTTP_IF_NONE_MATCH=etag),
+            repeat=options.repeat,
+        )
+        results.time(
+            f"api.list.deep_page[{label}]",
+            lambda: client.get("/games/", {"page": deep_page}),
+            repeat=options.repeat,
+        )
+        results.time(
+            f"api.filter.players[{label}]",
+            lambda: client.get("/games/", {"players": players[:2]}),
+            repeat=options.repeat,
+        )
+        results.time(
+            f"api.filter.date[{label}]",
+            lambda: client.get(
+                "/games/", {"date_after": "2023-03-01T00:00:00Z", "date_before": "2023-03-08T00:00:00Z"}
+            ),
+            repeat=options.repeat,
+        )
+
+        upload_data = {"players": players, "transitions": game.transitions}
+
+        def upload():
+            # Rolled back so the database keeps the same number of games
+            with transaction.atomic():
+                client.post("/games/upload", upload_data, content_type="application/json")
+                transaction.set_rollback(True)
+
+        results.time(f"api.upload[{label}]", upload, repeat=options.repeat)
+
+        def export(export_format):
+            response = client.get(f"/games/export.{export_format}")
+            for _ in response.streaming_content:
+                pass
+
+        # The whole history, once is enough
+        results.time(f"api.export.ndjson[{label}]", lambda: export("ndjson"), repeat=1)
+        results.time(f"api.export.csv[{label}]", lambda: export("csv"), repeat=1)
+
+        time_concurrent(results, label, options.repeat)
+        time_load(results, label, upload_data, options.repeat)
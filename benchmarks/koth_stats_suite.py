@@ -0,0 +1,60 @@
+import random
+import sys
+from pathlib import Path
+
+from timing import Results
+
+KOTH_STATS_DIR = Path(__file__).resolve().parent.parent / "old" / "koth_stats"
+
+GAME_SIZES = [(4, 50), (10, 1_000), (26, 10_000)]
+
+PLOTS = [
+    "points",
+    "total_reign_time",
+    "reign_time",
+    "crowns_claimed",
+    "graph_visualization",
+]
+
+STATS = ["total_reign_time", "reign_time", "crowns_claimed", "graph_visualization"]
+
+
+def build_stats(game_service):
+    for stat in STATS:
+        getattr(game_service, stat)
+
+
+def run(results: Results, options):
+    sys.path.insert(0, str(KOTH_STATS_DIR))
+    sys.path.insert(0, str(KOTH_STATS_DIR / "examples"))
+
+    from common import generate_random_game
+
+    from koth_stats.game_stats import GameStatService
+
+    for nb_players, nb_transitions in GAME_SIZES:
+        random.seed(nb_players * nb_transitions)
+        players, transitions_df = generate_random_game(nb_players, nb_transitions)
+        size = f"{nb_players}p-{nb_transitions}t"
+
+        # The stats are built when first accessed, so all of them are
+        results.time(
+            f"koth_stats.construction[{size}]",
+            lambda: build_stats(GameStatService(players, transitions_df)),
+            repeat=options.repeat,
+        )
+
+        game_service = GameStatService(players, transitions_df)
+        results.time(
+            f"koth_stats.points_df[{size}]",
+            lambda: game_service.points_df(),
+            repeat=options.repeat,
+        )
+
+        for plot in PLOTS:
+            if plot == "points":
+                plot_func = game_service.points_plot
+            else:
+                plot_func = getattr(game_service, plot).plot
+
+            results.time(f"koth_stats.plot.{plot}[{size}]", plot_func, repeat=options.repeat)
@@ -0,0 +1,54 @@
+"""Benchmark suite of koth_stats and of the games API.
+
+Usage:
+    python benchmarks/run.py koth_stats [--save | --compare]
+    python benchmarks/run.py api [--sizes 1000 100000 1000000] [--save | --compare]
+
+``--save`` stores the timings as the baseline of the suite, ``--compare``
+compares them with the stored baseline and exits with an error if one of
+them is slower by more than ``--threshold``, or is missing from the baseline.
+
+The api suite uses SQLite, or Postgres when the ``DB_*`` variables of the
+backend settings are set, its timings are then labelled with the backend.
+"""
+import argparse
+import sys
+
+import api_suite
+import koth_stats_suite
+from timing import DEFAULT_THRESHOLD, Results
+
+SUITES = {
+    "koth_stats": koth_stats_suite,
+    "api": api_suite,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("suite", choices=SUITES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sizes", type=int, nargs="+", help="Number of games of the API databases")
+    parser.add_argument("--save", action="store_true", help="Store the timings as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare with the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    options = parser.parse_args()
+
+    results = Results(options.suite)
+    SUITES[options.suite].run(results, options)
+
+    if options.save:
+        results.save()
+
+    if options.compare:
+        regressions, missing = results.compare(options.threshold)
+        if missing:
+            print(f"\n{len(missing)} benchmark(s) missing from the baseline, run with --save to update it")
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {options.threshold:.0%}")
+        if regressions or missing:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
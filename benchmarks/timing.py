@@ -0,0 +1,83 @@
+import json
+import platform
+import timeit
+from pathlib import Path
+
+BASELINES_DIR = Path(__file__).resolve().parent / "baselines"
+
+# A timing slower than its baseline by more than this fraction is a regression
+DEFAULT_THRESHOLD = 0.2
+
+
+def best_of(func, repeat=5, number=1) -> float:
+    """Best time of ``func`` in seconds, over ``repeat`` runs of ``number`` calls."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+class Results:
+    """Timings of a benchmark suite, by name."""
+
+    def __init__(self, suite: str):
+        self.suite = suite
+        self.timings: dict[str, float] = {}
+
+    def add(self, name: str, seconds: float):
+        self.timings[name] = seconds
+        print(f"{name:<60} {seconds * 1e3:>12.3f} ms")
+
+    def time(self, name: str, func, repeat=5, number=1):
+        self.add(name, best_of(func, repeat, number))
+
+    @property
+    def baseline_path(self) -> Path:
+        return BASELINES_DIR / f"{self.suite}.json"
+
+    def save(self):
+        """Stores the timings as the baseline of the suite."""
+        BASELINES_DIR.mkdir(exist_ok=True)
+        baseline = {
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+            "timings": self.timings,
+        }
+        with open(self.baseline_path, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+        print(f"Baseline saved to {self.baseline_path}")
+
+    def compare(self, threshold=DEFAULT_THRESHOLD) -> tuple[list[str], list[str]]:
+        """Compares the timings with the baseline.
+
+        Returns the names of the regressions, and the names of the timings
+        missing from the baseline, which is then out of date.
+        """
+        try:
+            with open(self.baseline_path, "r") as file:
+                baseline = json.load(file)["timings"]
+        except FileNotFoundError:
+            print(f"No baseline for {self.suite}, run with --save first")
+            return [], list(self.timings)
+
+        regressions = []
+        missing = []
+        print()
+        print(f"{'benchmark':<60} {'baseline':>12} {'current':>12} {'ratio':>8}")
+        for name, seconds in self.timings.items():
+            if name not in baseline:
+                missing.append(name)
+                print(f"{name:<60} {'-':>12} {seconds * 1e3:>10.3f}ms {'-':>8}  MISSING")
+                continue
+
+            ratio = seconds / baseline[name]
+            flag = ""
+            if ratio > 1 + threshold:
+                regressions.append(name)
+                flag = "  REGRESSION"
+
+            print(
+                f"{name:<60} {baseline[name] * 1e3:>10.3f}ms {seconds * 1e3:>10.3f}ms "
+                f"{ratio:>7.2f}x{flag}"
+            )
+
+        return regressions, missing
@@ -0,0 +1,83 @@
+"""Import time of koth_stats and construction time of GameStatService.
+
+Usage (with koth_stats installed, ``pip install -e .``):
+    python benchmarks/bench_construction.py
+"""
+
+import os
+import subprocess
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+
+from common import generate_random_game  # noqa: E402
+
+from koth_stats.game_stats import GameStatService  # noqa: E402
+
+REPEAT = 5
+GAME_SIZES = [(4, 50), (10, 1_000), (26, 10_000)]
+
+IMPORT_CODE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+plotting = [name for name in ("seaborn", "matplotlib") if name in sys.modules]
+print(elapsed, ",".join(plotting) or "-")
+"""
+
+
+def time_import(module):
+    """Best import time of ``module`` in a fresh interpreter."""
+    times = []
+    for _ in range(REPEAT):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_CODE.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+
+    print(f"import {module}: {min(times) * 1e3:.1f} ms (plotting modules: {output[1]})")
+
+
+def bench_import():
+    time_import("koth_stats.game_stats")
+    # what importing game_stats also cost before plotting imports were deferred
+    time_import("seaborn, matplotlib.figure")
+
+
+def eager_service(players, transitions_df):
+    """Builds all the stats upfront, as the service used to."""
+    game_service = GameStatService(players, transitions_df.copy())
+    game_service.total_reign_time
+    game_service.reign_time
+    game_service.crowns_claimed
+    game_service.graph_visualization
+
+    return game_service
+
+
+def best_of(func):
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def bench_construction():
+    print(f"{'players':>8} {'transitions':>12} {'eager (ms)':>12} {'lazy (ms)':>12} {'speedup':>8}")
+    for nb_players, nb_transitions in GAME_SIZES:
+        players, transitions_df = generate_random_game(nb_players, nb_transitions)
+
+        eager_time = best_of(lambda: eager_service(players, transitions_df).points_df())
+        lazy_time = best_of(lambda: GameStatService(players, transitions_df).points_df())
+
+        print(
+            f"{nb_players:>8} {nb_transitions:>12} {eager_time * 1e3:>12.2f} "
+            f"{lazy_time * 1e3:>12.2f} {eager_time / lazy_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    bench_import()
+    bench_construction()
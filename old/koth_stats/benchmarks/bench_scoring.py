@@ -0,0 +1,102 @@
+"""Compares the vectorized scoring engine with the stat by stat scoring,
+and the batch scoring of a season with scoring its games one by one.
+
+Usage (with koth_stats installed, ``pip install -e .``):
+    python benchmarks/bench_scoring.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples"))
+
+from common import generate_random_game  # noqa: E402
+
+from koth_stats.game_stats import (  # noqa: E402
+    CrownsClaimedStat,
+    ReignTimeStat,
+    TotalReignTimeStat,
+)
+from koth_stats.score_parameters import ScoreParameters  # noqa: E402
+from koth_stats.scoring import score_games, score_transitions_df  # noqa: E402
+
+GAME_SIZES = [(4, 100), (10, 1_000), (26, 10_000), (26, 100_000)]
+SEASON_SIZES = [100, 1_000, 10_000]
+REPEAT = 3
+
+
+def stat_by_stat_points_df(players, transitions_df, score_parameters):
+    points_df = TotalReignTimeStat(players, transitions_df, score_parameters).points_as_df()
+    points_df += ReignTimeStat(players, transitions_df, score_parameters).points_as_df()
+    points_df += CrownsClaimedStat(players, transitions_df, score_parameters).points_as_df()
+
+    last_king = transitions_df.iloc[-1]["Name"]
+    points_df.loc[last_king] += score_parameters.points_last_king
+
+    return points_df.sort_values("Points", ascending=False)
+
+
+def best_of(func):
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def bench_season(nb_games, score_parameters):
+    games = [generate_random_game(4, 50) for _ in range(nb_games)]
+
+    players = [game_players for game_players, _ in games]
+    names = np.concatenate([transitions_df["Name"].to_numpy() for _, transitions_df in games])
+    durations = np.concatenate(
+        [transitions_df["Duration"].to_numpy() for _, transitions_df in games]
+    )
+    offsets = np.cumsum([0] + [len(transitions_df) for _, transitions_df in games])
+
+    one_by_one_time = best_of(
+        lambda: [
+            score_transitions_df(game_players, transitions_df, score_parameters).points_df()
+            for game_players, transitions_df in games
+        ]
+    )
+    batch_time = best_of(lambda: score_games(players, names, durations, offsets, score_parameters))
+
+    print(
+        f"{nb_games:>8} {one_by_one_time * 1e3:>12.2f} {batch_time * 1e3:>12.2f} "
+        f"{one_by_one_time / batch_time:>7.1f}x"
+    )
+
+
+def main():
+    score_parameters = ScoreParameters()
+
+    print(
+        f"{'players':>8} {'transitions':>12} {'stats (ms)':>12} {'engine (ms)':>12} {'speedup':>8}"
+    )
+    for nb_players, nb_transitions in GAME_SIZES:
+        players, transitions_df = generate_random_game(nb_players, nb_transitions)
+
+        expected = stat_by_stat_points_df(players, transitions_df, score_parameters)
+        actual = score_transitions_df(players, transitions_df, score_parameters).points_df()
+        assert actual.equals(expected), "engine and stats disagree"
+
+        stats_time = best_of(
+            lambda: stat_by_stat_points_df(players, transitions_df, score_parameters)
+        )
+        engine_time = best_of(
+            lambda: score_transitions_df(players, transitions_df, score_parameters).points_df()
+        )
+
+        print(
+            f"{nb_players:>8} {nb_transitions:>12} {stats_time * 1e3:>12.2f} "
+            f"{engine_time * 1e3:>12.2f} {stats_time / engine_time:>7.1f}x"
+        )
+
+    print()
+    print(f"{'games':>8} {'single (ms)':>12} {'batch (ms)':>12} {'speedup':>8}")
+    for nb_games in SEASON_SIZES:
+        bench_season(nb_games, score_parameters)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,21 @@
+from __future__ import annotations
+
 import math
 from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
-import seaborn as sns
-from matplotlib.figure import Figure
 
+from .rendering import RenderCache, render_plot
 from .score_parameters import ScoreParameters
+from .scoring import score_transitions_df
+
+# seaborn and matplotlib are only imported when a plot is drawn,
+# scoring a game does not need them
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 # transitions_df format is the following:
 
@@ -19,6 +29,14 @@ from .score_parameters import ScoreParameters
 PLOT_LINEWIDTH = 12
 
 
+@lru_cache(maxsize=128)
+def players_colors(players: tuple[str, ...]) -> dict[str, tuple[float, float, float]]:
+    """Unique color of each player, shared by all the stats of the same players."""
+    import seaborn as sns
+
+    return dict(zip(players, sns.color_palette("Pastel1", n_colors=len(players))))
+
+
 class GameStatService:
     """Wrapper class to contain all stats for the KOTH."""
 
@@ -30,28 +48,35 @@ class GameStatService:
     ):
         self.players = players
         self.transitions_df = transitions_df
+        self.score_parameters = score_parameters
 
-        self.total_reign_time = TotalReignTimeStat(players, transitions_df, score_parameters)
-        self.reign_time = ReignTimeStat(players, transitions_df, score_parameters)
-        self.crowns_claimed = CrownsClaimedStat(players, transitions_df, score_parameters)
-        self.graph_visualization = GraphVisualizationStat(players, transitions_df, score_parameters)
+    # The stats are only built when first accessed
 
-        self.score_parameters = score_parameters
+    @cached_property
+    def total_reign_time(self) -> TotalReignTimeStat:
+        return TotalReignTimeStat(self.players, self.transitions_df, self.score_parameters)
 
-    def points_df(self, ascending=False):
-        points_df = self.total_reign_time.points_as_df()
-        points_df += self.reign_time.points_as_df()
-        points_df += self.crowns_claimed.points_as_df()
+    @cached_property
+    def reign_time(self) -> ReignTimeStat:
+        return ReignTimeStat(self.players, self.transitions_df, self.score_parameters)
 
-        # points for being last king
-        last_king = self.transitions_df.iloc[-1]["Name"]
-        points_df.loc[last_king] += self.score_parameters.points_last_king
+    @cached_property
+    def crowns_claimed(self) -> CrownsClaimedStat:
+        return CrownsClaimedStat(self.players, self.transitions_df, self.score_parameters)
 
-        points_df = points_df.sort_values("Points", ascending=ascending)
+    @cached_property
+    def graph_visualization(self) -> GraphVisualizationStat:
+        return GraphVisualizationStat(self.players, self.transitions_df, self.score_parameters)
 
-        return points_df
+    def points_df(self, ascending=False):
+        return score_transitions_df(
+            self.players, self.transitions_df, self.score_parameters
+        ).points_df(ascending=ascending)
 
     def points_plot(self, include_title=False) -> Figure:
+        import seaborn as sns
+        from matplotlib.figure import Figure
+
         fig = Figure(linewidth=PLOT_LINEWIDTH)
         ax = fig.subplots()
 
@@ -71,6 +96,16 @@ class GameStatService:
 
         return fig
 
+    def render(
+        self, kind: str, format="png", include_title=False, cache: RenderCache | None = None
+    ) -> bytes:
+        """Renders the plot ``kind`` as PNG or SVG bytes, see ``rendering.PLOT_KINDS``.
+
+        Renders are cached, so rendering the same plot of the same game again
+        only costs a cache lookup.
+        """
+        return render_plot(self, kind, format, include_title, cache)
+
 
 class GameStat(ABC):
     @abstractmethod
@@ -86,14 +121,10 @@ class GameStat(ABC):
 
         self.game_duration = transitions_df["Duration"].sum()
 
+    @property
+    def player_colors(self) -> dict[str, tuple[float, float, float]]:
         # Define a set of unique colors for consistent painting for each graph
-        self.player_colors = {
-            player: color
-            for player, color in zip(
-                players,
-                sns.color_palette("Pastel1", n_colors=len(players)),
-            )
-        }
+        return players_colors(tuple(self.players))
 
     @abstractmethod
     def plot(self, include_title=False) -> Figure:
@@ -147,6 +178,8 @@ class TotalReignTimeStat(GameStat):
                     )
 
     def plot(self, include_title=False) -> Figure:
+        from matplotlib.figure import Figure
+
         fig = Figure(linewidth=PLOT_LINEWIDTH)
         ax = fig.subplots()
 
@@ -193,6 +226,9 @@ class ReignTimeStat(GameStat):
                     )
 
     def plot(self, include_title=False) -> Figure:
+        import seaborn as sns
+        from matplotlib.figure import Figure
+
         fig = Figure()
         ax = fig.subplots()
 
@@ -254,6 +290,9 @@ class CrownsClaimedStat(GameStat):
                     )
 
     def plot(self, include_title=False) -> Figure:
+        import seaborn as sns
+        from matplotlib.figure import Figure
+
         fig = Figure()
         ax = fig.subplots()
 
@@ -293,24 +332,37 @@ class GraphVisualizationStat(GameStat):
         super().__init__(players, transitions_df, score_parameters)
 
         # normalize seconds for nice display
-        transitions_df["Duration_perc"] = self.transitions_df["Duration"].apply(
-            lambda seconds: int(math.ceil(seconds / self.game_duration * 100))
-        )
+        durations_perc = np.ceil(
+            self.transitions_df["Duration"].to_numpy() / self.game_duration * 100
+        ).astype(np.int64)
 
-        self.graph_vector = []
-        for _, transition in transitions_df.iterrows():
-            self.graph_vector.extend(transition["Name"] for _ in range(transition["Duration_perc"]))
+        # Run-length representation of the graph: each transition is a step of
+        # its duration in percents, transitions under one percent are not drawn
+        drawn = durations_perc > 0
+        self.step_names = self.transitions_df["Name"].to_numpy()[drawn]
+        self.step_lengths = durations_perc[drawn]
+        self.step_starts = np.cumsum(self.step_lengths) - self.step_lengths
+
+    @property
+    def graph_vector(self) -> list[str]:
+        """King at each percent of the game advancement."""
+        return np.repeat(self.step_names, self.step_lengths).tolist()
 
     def plot(self, include_title=False) -> Figure:
+        from matplotlib.figure import Figure
+
         fig = Figure(figsize=(15, 5))
         ax = fig.subplots()
 
-        sns.lineplot(
-            x=range(len(self.graph_vector)),
-            y=self.graph_vector,
-            drawstyle="steps",
-            ax=ax,
-        )
+        # Same line as drawing the king at each percent with "steps-pre",
+        # but with one point per step instead of one per percent
+        if len(self.step_names) > 0:
+            graph_length = self.step_lengths.sum()
+            x = np.append(np.maximum(self.step_starts - 1, 0), graph_length - 1)
+            y = np.append(self.step_names, self.step_names[-1])
+
+            ax.plot(x, y, drawstyle="steps-post")
+
         ax.set_xlabel("Game advancement (%)")
 
         if include_title:
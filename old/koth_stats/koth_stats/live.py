@@ -0,0 +1,110 @@
+import math
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .score_parameters import ScoreParameters
+from .scoring import score_game
+
+
+class LiveGameScorer:
+    """Scores a game while it is played, one crown transition at a time.
+
+    Each ``push`` only updates running totals, so its cost does not depend on
+    the length of the game. ``standings`` derives the points from these totals:
+    its cost depends on the number of players and of distinct reign durations,
+    not on the number of transitions. Once the game is over, ``points_df``
+    gives the final points with the exact same evaluation as
+    ``GameStatService.points_df``.
+    """
+
+    def __init__(self, players: list[str], score_parameters=ScoreParameters()):
+        self.players = players
+        self.score_parameters = score_parameters
+
+        self.names: list[str] = []
+        self.durations: list[int] = []
+
+        self.game_duration = 0
+        self.current_king: str | None = None
+
+        self.total_reign_time = {player: 0 for player in players}
+        self.crowns_claimed = {player: 0 for player in players}
+
+        # Number of reigns of each duration, per player
+        self.reign_times = {player: Counter() for player in players}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def push(self, player: str, duration: int):
+        """Records that ``player`` was king for ``duration`` seconds."""
+        if player not in self.total_reign_time:
+            raise ValueError(f"Unknown player: {player}")
+
+        # The first king did not claim his crown
+        if self.current_king is not None:
+            self.crowns_claimed[player] += 1
+
+        self.names.append(player)
+        self.durations.append(duration)
+
+        self.game_duration += duration
+        self.current_king = player
+        self.total_reign_time[player] += duration
+        self.reign_times[player][duration] += 1
+
+    def reign_time_points(self, player: str) -> int:
+        # Reign times are normalized by the current game duration, so they are
+        # transformed again at each call, once per distinct duration
+        reign_times = self.reign_times[player]
+        if not reign_times:
+            return 0
+
+        durations = np.fromiter(reign_times.keys(), dtype=np.int64, count=len(reign_times))
+        counts = np.fromiter(reign_times.values(), dtype=np.int64, count=len(reign_times))
+        percents = np.ceil(durations / self.game_duration * 100).astype(np.int64)
+
+        points = sum(
+            count * int(percent) ** self.score_parameters.sigma
+            for percent, count in zip(percents, counts)
+        )
+
+        return math.ceil(self.score_parameters.beta * points)
+
+    def points(self, player: str) -> int:
+        # Reign times are shares of the game duration, there are none yet
+        if self.game_duration == 0:
+            return 0
+
+        points = math.ceil(
+            self.score_parameters.alpha * (self.total_reign_time[player] / self.game_duration)
+        )
+        points += self.reign_time_points(player)
+
+        if player == self.current_king:
+            points += self.score_parameters.points_last_king
+
+        return points
+
+    def standings(self, ascending=False) -> pd.DataFrame:
+        """Current points of the players, as if the game ended now."""
+        points_df = pd.DataFrame(
+            {
+                "Name": self.players,
+                "Points": [self.points(player) for player in self.players],
+            }
+        )
+        points_df.set_index("Name", inplace=True)
+
+        return points_df.sort_values("Points", ascending=ascending)
+
+    def points_df(self, ascending=False) -> pd.DataFrame:
+        """Final points of the game, exactly as ``GameStatService.points_df``."""
+        return score_game(
+            self.players,
+            np.array(self.names, dtype=object),
+            np.array(self.durations),
+            self.score_parameters,
+        ).points_df(ascending=ascending)
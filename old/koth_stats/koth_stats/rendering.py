@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.figure import Figure
+
+    from .game_stats import GameStatService
+    from .score_parameters import ScoreParameters
+
+# Plots of a game that can be rendered, "points" is ``GameStatService.points_plot``
+# and the others are the ``plot`` of the stat with the same name
+PLOT_KINDS = (
+    "points",
+    "total_reign_time",
+    "reign_time",
+    "crowns_claimed",
+    "graph_visualization",
+)
+RENDER_FORMATS = ("png", "svg")
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def render_figure(fig: Figure, format="png") -> bytes:
+    """Renders a ``figure.Figure`` into PNG or SVG bytes with the Agg canvas."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if format not in RENDER_FORMATS:
+        raise ValueError(f"Unknown render format: {format}")
+
+    FigureCanvasAgg(fig)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=format)
+
+    return buffer.getvalue()
+
+
+def plot_key(
+    players: list[str],
+    transitions_df: pd.DataFrame,
+    score_parameters: ScoreParameters,
+    kind: str,
+    format="png",
+    include_title=False,
+) -> str:
+    """Content hash identifying a rendered plot of a game."""
+    digest = hashlib.sha256()
+
+    header = {
+        "players": list(players),
+        "score_parameters": [
+            score_parameters.alpha,
+            score_parameters.beta,
+            score_parameters.sigma,
+            score_parameters.points_last_king,
+        ],
+        "kind": kind,
+        "format": format,
+        "include_title": include_title,
+    }
+    digest.update(json.dumps(header).encode())
+
+    digest.update("\0".join(map(str, transitions_df["Name"])).encode())
+    digest.update(np.ascontiguousarray(transitions_df["Duration"].to_numpy()).tobytes())
+
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Cache of rendered plots.
+
+    Plots are kept in memory in a LRU bounded to ``max_bytes``, and are also
+    written in ``directory`` when given so they survive the process.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory: str | None = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Size in bytes of the plots kept in memory."""
+        return self._size
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+        data = self._read_file(key)
+        if data is not None:
+            self._store(key, data)
+            with self._lock:
+                self.hits += 1
+            return data
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, data: bytes):
+        self._store(key, data)
+        self._write_file(key, data)
+
+    def clear(self):
+        """Empties the memory tier, the files are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _store(self, key: str, data: bytes):
+        # A plot bigger than the whole cache is only kept on disk
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[key] = data
+            self._size += len(data)
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def _read_file(self, key: str) -> bytes | None:
+        if self.directory is None:
+            return None
+
+        try:
+            with open(self._path(key), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_file(self, key: str, data: bytes):
+        if self.directory is None:
+            return
+
+        # Write then rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+# Cache used by ``GameStatService.render`` when none is given
+default_render_cache = RenderCache()
+
+
+def render_plot(
+    game_service: GameStatService,
+    kind: str,
+    format="png",
+    include_title=False,
+    cache: RenderCache | None = None,
+) -> bytes:
+    """Renders a plot of a game, reusing the cached bytes of an identical game."""
+    if kind not in PLOT_KINDS:
+        raise ValueError(f"Unknown plot kind: {kind}")
+
+    if cache is None:
+        cache = default_render_cache
+
+    key = plot_key(
+        game_service.players,
+        game_service.transitions_df,
+        game_service.score_parameters,
+        kind,
+        format,
+        include_title,
+    )
+
+    data = cache.get(key)
+    if data is None:
+        if kind == "points":
+            fig = game_service.points_plot(include_title=include_title)
+        else:
+            fig = getattr(game_service, kind).plot(include_title=include_title)
+
+        data = render_figure(fig, format)
+        cache.set(key, data)
+
+    return data
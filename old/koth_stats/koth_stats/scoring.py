@@ -0,0 +1,308 @@
+import numpy as np
+import pandas as pd
+
+from .score_parameters import ScoreParameters
+
+# The scoring engine works on the raw columns of a transitions_df:
+#
+#     names      = ["Bob", "Alice", "John", "Bob"]
+#     durations  = [64, 20, 32, 35]
+#
+# Every player is mapped to its index in ``players`` and all the stats are
+# computed with grouped NumPy operations over these indices, instead of one
+# pandas query per player.
+
+# Decimals kept before taking the ceil of float points, so the rounding errors
+# of a different summation order do not add a point
+POINTS_DECIMALS = 9
+
+
+class GameScores:
+    """Points of every player of a game, computed in a single grouped pass.
+
+    All the arrays are aligned with ``players``.
+    """
+
+    def __init__(
+        self,
+        players: list[str],
+        total_reign_time: np.ndarray,
+        crowns_claimed: np.ndarray,
+        total_reign_time_points: np.ndarray,
+        reign_time_points: np.ndarray,
+        crowns_claimed_points: np.ndarray,
+        last_king: str,
+        last_king_points: np.ndarray,
+    ):
+        self.players = players
+        self.total_reign_time = total_reign_time
+        self.crowns_claimed = crowns_claimed
+        self.total_reign_time_points = total_reign_time_points
+        self.reign_time_points = reign_time_points
+        self.crowns_claimed_points = crowns_claimed_points
+        self.last_king = last_king
+        self.last_king_points = last_king_points
+
+    @property
+    def points(self) -> np.ndarray:
+        return (
+            self.total_reign_time_points
+            + self.reign_time_points
+            + self.crowns_claimed_points
+            + self.last_king_points
+        )
+
+    def points_df(self, ascending=False) -> pd.DataFrame:
+        """Same layout as ``GameStatService.points_df``."""
+        points_df = pd.DataFrame({"Name": self.players, "Points": self.points})
+        points_df.set_index("Name", inplace=True)
+
+        return points_df.sort_values("Points", ascending=ascending)
+
+
+def player_codes(players: list[str], names) -> np.ndarray:
+    """Maps each transition name to the index of the player in ``players``.
+
+    Names that are not part of ``players`` are mapped to -1.
+    """
+    inverse, unique_names = pd.factorize(np.asarray(names))
+
+    index = {player: i for i, player in enumerate(players)}
+    unique_codes = np.array([index.get(name, -1) for name in unique_names], dtype=np.int64)
+
+    return unique_codes[inverse]
+
+
+def segment_sums(values: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+    """Sums of the consecutive segments ``values[bounds[i] : bounds[i + 1]]``.
+
+    The segments cover ``values``, empty ones sum to 0.
+    """
+    starts, lengths = bounds[:-1], np.diff(bounds)
+    sums = np.zeros(len(starts))
+
+    # reduceat sums up to the next start, the empty segments are left out
+    nonempty = lengths > 0
+    if nonempty.any():
+        sums[nonempty] = np.add.reduceat(values, starts[nonempty])
+
+    return sums
+
+
+def ceil_points(points: np.ndarray) -> np.ndarray:
+    return np.ceil(np.round(points, POINTS_DECIMALS)).astype(np.int64)
+
+
+def reign_time_points_sums(
+    rows: np.ndarray,
+    durations: np.ndarray,
+    game_durations,
+    nb_rows: int,
+    sigma: float,
+) -> np.ndarray:
+    """Sums of the transformed reign times of every row, before weighting by beta.
+
+    ``rows`` gives the row (player of a game) of each transition and
+    ``game_durations`` the duration of the game of each transition.
+    """
+    # normalize seconds in percents of the game, then transform them
+    # the power is evaluated once per possible percent with python floats
+    # so the result is exactly the one of the per-transition evaluation
+    percents = np.ceil(durations / game_durations * 100).astype(np.int64)
+    min_percent = percents.min(initial=0)
+    max_percent = percents.max(initial=0)
+    transformed = np.array([percent**sigma for percent in range(min_percent, max_percent + 1)])
+    transformed = transformed[percents - min_percent]
+
+    # group the transitions by row
+    order = np.argsort(rows, kind="stable")
+    bounds = np.searchsorted(rows[order], np.arange(nb_rows + 1))
+
+    return segment_sums(transformed[order], bounds)
+
+
+def score_rows(
+    rows: np.ndarray,
+    nb_rows: int,
+    row_games: np.ndarray,
+    durations: np.ndarray,
+    offsets: np.ndarray,
+    score_parameters: ScoreParameters,
+) -> dict[str, np.ndarray]:
+    """Scores the rows (one per player of a game) of one or many games.
+
+    ``rows`` gives the row of each transition, -1 for unknown players, and
+    ``row_games`` the game of each row. The transitions of game ``i`` are
+    ``durations[offsets[i] : offsets[i + 1]]``.
+    """
+    game_lengths = np.diff(offsets)
+    if (game_lengths <= 0).any():
+        raise ValueError("Every game needs at least one transition.")
+
+    game_durations = np.add.reduceat(durations, offsets[:-1])
+    transition_game_durations = np.repeat(game_durations, game_lengths)
+    known = rows >= 0
+
+    # Total reign time
+    total_reign_time = np.bincount(rows[known], weights=durations[known], minlength=nb_rows)
+    if durations.dtype.kind in "iu":
+        total_reign_time = total_reign_time.astype(durations.dtype)
+    total_reign_time_points = np.ceil(
+        score_parameters.alpha * (total_reign_time / game_durations[row_games])
+    ).astype(np.int64)
+
+    # Reign time
+    reign_time_sums = reign_time_points_sums(
+        rows[known],
+        durations[known],
+        transition_game_durations[known],
+        nb_rows,
+        score_parameters.sigma,
+    )
+    reign_time_points = ceil_points(score_parameters.beta * reign_time_sums)
+
+    # Crowns claimed, the first king did not claim his crown
+    crowns_claimed = np.bincount(rows[known], minlength=nb_rows)
+    first_kings = rows[offsets[:-1]]
+    np.subtract.at(crowns_claimed, first_kings[first_kings >= 0], 1)
+
+    # Crowns claimed do not award points yet
+    crowns_claimed_points = np.zeros(nb_rows, dtype=np.int64)
+
+    # Last king
+    last_kings = rows[offsets[1:] - 1]
+    if (last_kings < 0).any():
+        unknown_game = np.flatnonzero(last_kings < 0)[0]
+        raise KeyError(f"Last king of game {unknown_game} is not one of its players.")
+
+    last_king_points = np.zeros(
+        nb_rows, dtype=np.result_type(np.int64, score_parameters.points_last_king)
+    )
+    last_king_points[last_kings] = score_parameters.points_last_king
+
+    return {
+        "total_reign_time": total_reign_time,
+        "crowns_claimed": crowns_claimed,
+        "total_reign_time_points": total_reign_time_points,
+        "reign_time_points": reign_time_points,
+        "crowns_claimed_points": crowns_claimed_points,
+        "last_kings": last_kings,
+        "last_king_points": last_king_points,
+    }
+
+
+def score_game(
+    players: list[str],
+    names,
+    durations,
+    score_parameters=ScoreParameters(),
+) -> GameScores:
+    """Computes the points of all the players of a game.
+
+    ``names`` and ``durations`` are the ``Name`` and ``Duration`` columns of a
+    transitions_df, in chronological order.
+    """
+    names = np.asarray(names)
+    nb_players = len(players)
+
+    scores = score_rows(
+        player_codes(players, names),
+        nb_players,
+        np.zeros(nb_players, dtype=np.int64),
+        np.asarray(durations),
+        np.array([0, len(names)]),
+        score_parameters,
+    )
+
+    return GameScores(
+        players,
+        scores["total_reign_time"],
+        scores["crowns_claimed"],
+        scores["total_reign_time_points"],
+        scores["reign_time_points"],
+        scores["crowns_claimed_points"],
+        names[-1],
+        scores["last_king_points"],
+    )
+
+
+def score_transitions_df(
+    players: list[str],
+    transitions_df: pd.DataFrame,
+    score_parameters=ScoreParameters(),
+) -> GameScores:
+    """Computes the points of all the players of a game from its transitions_df."""
+    return score_game(
+        players,
+        transitions_df["Name"].to_numpy(),
+        transitions_df["Duration"].to_numpy(),
+        score_parameters,
+    )
+
+
+def score_games(
+    players: list[list[str]],
+    names,
+    durations,
+    offsets,
+    score_parameters=ScoreParameters(),
+    game_ids=None,
+) -> pd.DataFrame:
+    """Computes the points of all the players of many games at once.
+
+    The games are given as ragged arrays: the transitions of game ``i`` are
+    ``names[offsets[i] : offsets[i + 1]]`` and
+    ``durations[offsets[i] : offsets[i + 1]]``, and its players are
+    ``players[i]``.
+
+    Returns a points table indexed by ``(Game, Name)``, with the players of
+    each game in the order of ``players[i]``. Use ``game_points_df`` to get the
+    ``GameStatService.points_df`` of a single game.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    nb_games = len(offsets) - 1
+    if len(players) != nb_games:
+        raise ValueError("One list of players is needed per game.")
+
+    names = np.asarray(names)
+    durations = np.asarray(durations)
+
+    # one row per player of each game
+    row_names = np.array([player for game_players in players for player in game_players])
+    row_games = np.repeat(
+        np.arange(nb_games), [len(game_players) for game_players in players]
+    ).astype(np.int64)
+    nb_rows = len(row_names)
+
+    # a (game, name) pair identifies a row, look up the row of each transition
+    codes, unique_names = pd.factorize(np.concatenate([row_names, names]))
+    row_keys = row_games * len(unique_names) + codes[:nb_rows]
+    transition_games = np.repeat(np.arange(nb_games), np.diff(offsets))
+    transition_keys = transition_games * len(unique_names) + codes[nb_rows:]
+
+    row_order = np.argsort(row_keys, kind="stable")
+    sorted_row_keys = row_keys[row_order]
+    positions = np.minimum(np.searchsorted(sorted_row_keys, transition_keys), nb_rows - 1)
+    rows = np.where(sorted_row_keys[positions] == transition_keys, row_order[positions], -1).astype(
+        np.int64
+    )
+
+    scores = score_rows(rows, nb_rows, row_games, durations, offsets, score_parameters)
+    points = (
+        scores["total_reign_time_points"]
+        + scores["reign_time_points"]
+        + scores["crowns_claimed_points"]
+        + scores["last_king_points"]
+    )
+
+    game_ids = np.arange(nb_games) if game_ids is None else np.asarray(game_ids)
+    index = pd.MultiIndex.from_arrays([game_ids[row_games], row_names], names=["Game", "Name"])
+
+    return pd.DataFrame({"Points": points}, index=index)
+
+
+def game_points_df(points_table: pd.DataFrame, game, ascending=False) -> pd.DataFrame:
+    """Points of a single game of a ``score_games`` table, as ``GameStatService.points_df``."""
+    points_df = points_table.xs(game, level="Game")
+
+    return points_df.sort_values("Points", ascending=ascending)
@@ -1,4 +1,6 @@
 import math
+import subprocess
+import sys
 
 import matplotlib as mpl
 import pandas as pd
@@ -99,3 +101,54 @@ class TestGraphVisualizationStat:
             "C": 0,
         }
         assert game_service.graph_visualization.points == points
+
+
+class TestLazyStats:
+    def test_no_plotting_import(self):
+        code = (
+            "import sys\n"
+            "import pandas as pd\n"
+            "import koth_stats.game_stats as gs\n"
+            "df = pd.DataFrame({'Name': ['A', 'B'], 'Duration': [1, 2]})\n"
+            "gs.GameStatService(['A', 'B'], df).points_df()\n"
+            "assert 'seaborn' not in sys.modules\n"
+            "assert 'matplotlib' not in sys.modules\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_stats_built_on_access(self, game_service):
+        assert "graph_visualization" not in vars(game_service)
+
+        game_service.points_df()
+        assert "graph_visualization" not in vars(game_service)
+
+        assert game_service.graph_visualization is game_service.graph_visualization
+
+    def test_shared_palette(self, game_service):
+        assert game_service.reign_time.player_colors is game_service.crowns_claimed.player_colors
+
+
+class TestGraphVisualizationSteps:
+    def test_graph_vector(self, game_service):
+        graph_vector = game_service.graph_visualization.graph_vector
+
+        assert graph_vector == ["A"] * 17 + ["B"] * 34 + ["C"] * 50
+
+    def test_steps(self, game_service):
+        graph = game_service.graph_visualization
+
+        assert list(graph.step_names) == ["A", "B", "C"]
+        assert list(graph.step_lengths) == [17, 34, 50]
+        assert list(graph.step_starts) == [0, 17, 51]
+
+    def test_input_not_modified(self, game_service):
+        game_service.graph_visualization
+
+        assert list(game_service.transitions_df.columns) == ["Name", "Duration"]
+
+    def test_short_transition_not_drawn(self):
+        transitions_df = pd.DataFrame({"Name": ["A", "B", "A"], "Duration": [0, 50, 50]})
+        graph = gs.GraphVisualizationStat(["A", "B"], transitions_df, gs.ScoreParameters())
+
+        assert list(graph.step_names) == ["B", "A"]
@@ -0,0 +1,73 @@
+import random
+
+import pandas as pd
+import pytest
+
+import koth_stats.game_stats as gs
+from koth_stats.live import LiveGameScorer
+
+
+def play(players, transitions_df):
+    scorer = LiveGameScorer(players)
+    for name, duration in zip(transitions_df["Name"], transitions_df["Duration"]):
+        scorer.push(name, duration)
+
+    return scorer
+
+
+class TestLiveGameScorer:
+    @pytest.mark.parametrize("seed", range(10))
+    def test_same_points_as_service(self, seed):
+        rng = random.Random(seed)
+        players = ["Player %s" % chr(i) for i in range(65, 65 + rng.randint(3, 8))]
+        nb_transitions = rng.randint(1, 300)
+        transitions_df = pd.DataFrame(
+            {
+                "Name": rng.choices(players, k=nb_transitions),
+                "Duration": [rng.randint(0, 100) for _ in range(nb_transitions)],
+            }
+        )
+
+        scorer = play(players, transitions_df)
+        expected_df = gs.GameStatService(players, transitions_df).points_df()
+
+        assert scorer.points_df().equals(expected_df)
+        assert scorer.standings().equals(expected_df)
+
+    def test_running_totals(self):
+        scorer = LiveGameScorer(["A", "B", "C"])
+        scorer.push("A", 10)
+        scorer.push("B", 20)
+        scorer.push("A", 5)
+
+        assert len(scorer) == 3
+        assert scorer.current_king == "A"
+        assert scorer.game_duration == 35
+        assert scorer.total_reign_time == {"A": 15, "B": 20, "C": 0}
+        assert scorer.crowns_claimed == {"A": 1, "B": 1, "C": 0}
+
+    def test_standings_follow_the_game(self):
+        scorer = LiveGameScorer(["A", "B"])
+        assert list(scorer.standings().Points) == [0, 0]
+
+        scorer.push("A", 10)
+        assert scorer.standings().index[0] == "A"
+
+        scorer.push("B", 100)
+        assert scorer.standings().index[0] == "B"
+
+    def test_zero_duration(self):
+        scorer = LiveGameScorer(["A", "B"])
+        assert list(scorer.standings()["Points"]) == [0, 0]
+
+        scorer.push("A", 0)
+        scorer.push("B", 0)
+        assert list(scorer.standings()["Points"]) == [0, 0]
+
+        scorer.push("A", 10)
+        assert scorer.points("A") > 0
+        assert scorer.points("B") == 0
+
+    def test_unknown_player(self):
+        with pytest.raises(ValueError):
+            LiveGameScorer(["A", "B"]).push("C", 10)
@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+
+import koth_stats.game_stats as gs
+from koth_stats.rendering import PLOT_KINDS, RenderCache, render_figure
+from koth_stats.score_parameters import ScoreParameters
+
+
+@pytest.fixture
+def game_service():
+    players = ["A", "B", "C"]
+
+    transitions_df = pd.DataFrame(
+        {
+            "Name": players,
+            "Duration": [10, 20, 30],
+        }
+    )
+
+    return gs.GameStatService(players, transitions_df)
+
+
+class TestRenderFigure:
+    def test_png(self, game_service):
+        assert render_figure(game_service.points_plot()).startswith(b"\x89PNG")
+
+    def test_svg(self, game_service):
+        assert b"<svg" in render_figure(game_service.points_plot(), format="svg")
+
+    def test_unknown_format(self, game_service):
+        with pytest.raises(ValueError):
+            render_figure(game_service.points_plot(), format="bmp")
+
+
+class TestRender:
+    @pytest.mark.parametrize("kind", PLOT_KINDS)
+    def test_all_kinds(self, game_service, kind):
+        assert game_service.render(kind, cache=RenderCache()).startswith(b"\x89PNG")
+
+    def test_cached(self, game_service, monkeypatch):
+        cache = RenderCache()
+        data = game_service.render("points", cache=cache)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("plot rendered again")
+
+        monkeypatch.setattr(gs.GameStatService, "points_plot", fail)
+
+        # Another service for the same game hits the cache
+        same_game = gs.GameStatService(game_service.players, game_service.transitions_df.copy())
+        assert same_game.render("points", cache=cache) == data
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_parameters_in_key(self, game_service):
+        cache = RenderCache()
+        game_service.render("points", cache=cache)
+
+        other_parameters = gs.GameStatService(
+            game_service.players, game_service.transitions_df, ScoreParameters(alpha=10)
+        )
+        other_parameters.render("points", cache=cache)
+        game_service.render("points", format="svg", cache=cache)
+
+        assert cache.misses == 3
+        assert len(cache) == 3
+
+    def test_unknown_kind(self, game_service):
+        with pytest.raises(ValueError):
+            game_service.render("unknown", cache=RenderCache())
+
+
+class TestRenderCache:
+    def test_lru_eviction(self):
+        cache = RenderCache(max_bytes=10)
+        cache.set("a", b"12345")
+        cache.set("b", b"12345")
+        cache.get("a")
+        cache.set("c", b"12345")
+
+        assert cache.get("a") == b"12345"
+        assert cache.get("b") is None
+        assert cache.size == 10
+
+    def test_too_big(self):
+        cache = RenderCache(max_bytes=4)
+        cache.set("a", b"12345")
+
+        assert len(cache) == 0
+
+    def test_disk_tier(self, tmp_path):
+        RenderCache(directory=tmp_path).set("a", b"12345")
+
+        cache = RenderCache(directory=tmp_path)
+        assert cache.get("a") == b"12345"
+        assert len(cache) == 1
+        assert cache.get("b") is None
@@ -0,0 +1,137 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import koth_stats.game_stats as gs
+import koth_stats.scoring as scoring
+from koth_stats.score_parameters import ScoreParameters
+
+
+def legacy_points_df(game_service: gs.GameStatService, ascending=False):
+    """Points computed stat by stat, as GameStatService.points_df used to."""
+    points_df = game_service.total_reign_time.points_as_df()
+    points_df += game_service.reign_time.points_as_df()
+    points_df += game_service.crowns_claimed.points_as_df()
+
+    last_king = game_service.transitions_df.iloc[-1]["Name"]
+    points_df.loc[last_king] += game_service.score_parameters.points_last_king
+
+    return points_df.sort_values("Points", ascending=ascending)
+
+
+def random_game(nb_players, nb_transitions, seed):
+    rng = random.Random(seed)
+    players = ["Player %s" % chr(i) for i in range(65, 65 + nb_players)]
+
+    transitions_df = pd.DataFrame(
+        {
+            "Name": rng.choices(players, k=nb_transitions),
+            "Duration": [rng.randint(0, 100) for _ in range(nb_transitions)],
+        }
+    )
+
+    return players, transitions_df
+
+
+class TestScoreGame:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_same_points_as_stats(self, seed):
+        players, transitions_df = random_game(3 + seed % 8, 1 + seed * 37, seed)
+        game_service = gs.GameStatService(players, transitions_df)
+
+        assert game_service.points_df().equals(legacy_points_df(game_service))
+
+    @pytest.mark.parametrize("ascending", [True, False])
+    def test_same_order(self, ascending):
+        players, transitions_df = random_game(6, 500, 42)
+        game_service = gs.GameStatService(players, transitions_df)
+
+        points_df = game_service.points_df(ascending=ascending)
+        expected_df = legacy_points_df(game_service, ascending=ascending)
+
+        assert list(points_df.index) == list(expected_df.index)
+
+    def test_player_never_king(self):
+        players = ["A", "B", "C", "D"]
+        transitions_df = pd.DataFrame({"Name": ["A", "B", "C"], "Duration": [10, 20, 30]})
+        game_service = gs.GameStatService(players, transitions_df)
+
+        assert game_service.points_df().loc["D", "Points"] == 0
+        assert game_service.points_df().equals(legacy_points_df(game_service))
+
+    def test_custom_parameters(self):
+        players, transitions_df = random_game(5, 200, 7)
+        score_parameters = ScoreParameters(alpha=100, beta=0.3, sigma=2, points_last_king=12)
+        game_service = gs.GameStatService(players, transitions_df, score_parameters)
+
+        assert game_service.points_df().equals(legacy_points_df(game_service))
+
+    def test_crowns_claimed(self):
+        players = ["A", "B", "C"]
+        scores = scoring.score_game(players, ["A", "B", "A", "C", "A"], [1, 1, 1, 1, 1])
+
+        assert list(scores.crowns_claimed) == [2, 1, 1]
+        assert scores.last_king == "A"
+
+
+class TestScoreGames:
+    def random_season(self, nb_games, seed):
+        rng = random.Random(seed)
+        games = [
+            random_game(rng.randint(3, 10), rng.randint(1, 400), seed * 1000 + i)
+            for i in range(nb_games)
+        ]
+
+        players = [game_players for game_players, _ in games]
+        names = [name for _, transitions_df in games for name in transitions_df["Name"]]
+        durations = [
+            duration for _, transitions_df in games for duration in transitions_df["Duration"]
+        ]
+        offsets = [0]
+        for _, transitions_df in games:
+            offsets.append(offsets[-1] + len(transitions_df))
+
+        return games, players, names, durations, offsets
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_points_as_service(self, seed):
+        games, players, names, durations, offsets = self.random_season(50, seed)
+
+        points_table = scoring.score_games(players, names, durations, offsets)
+
+        for game, (game_players, transitions_df) in enumerate(games):
+            game_service = gs.GameStatService(game_players, transitions_df)
+            assert scoring.game_points_df(points_table, game).equals(game_service.points_df())
+
+    def test_game_ids(self):
+        _, players, names, durations, offsets = self.random_season(3, 0)
+
+        points_table = scoring.score_games(
+            players, names, durations, offsets, game_ids=[11, 12, 13]
+        )
+
+        assert list(points_table.index.unique(level="Game")) == [11, 12, 13]
+        assert len(points_table.loc[12]) == len(players[1])
+
+    def test_empty_game(self):
+        with pytest.raises(ValueError):
+            scoring.score_games([["A", "B"], ["A", "B"]], ["A", "B"], [1, 2], [0, 2, 2])
+
+
+class TestSegmentSums:
+    def test_sums(self):
+        rng = np.random.default_rng(0)
+        values = rng.random(1000) * 100
+        bounds = np.array([0, 0, 3, 200, 200, 999, 1000])
+
+        sums = scoring.segment_sums(values, bounds)
+
+        expected = [pd.Series(values[start:end]).sum() for start, end in zip(bounds[:-1], bounds[1:])]
+        assert np.allclose(sums, expected, rtol=1e-12)
+        assert sums[0] == sums[3] == 0
+
+    def test_ceil_points_ignores_rounding_errors(self):
+        # 0.1 + 0.2 is 0.30000000000000004
+        assert list(scoring.ceil_points(np.array([(0.1 + 0.2) * 10, 2.5, 3.0]))) == [3, 3, 3]